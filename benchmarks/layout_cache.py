@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the per-call cost of `cache_get` and `cache_put` serialization
+and parsing with and without the ctypes layout cache.
+
+No Ignite server is needed: the connection is replaced with an in-memory
+loopback, that discards the requests and replays a canned response.
+"""
+
+import ctypes
+import sys
+import timeit
+
+from pyignite import utils
+from pyignite.api import cache_get, cache_put
+from pyignite.connection import Connection
+from pyignite.datatypes import AnyDataObject
+
+
+VALUE = 'The quick brown fox jumps over the lazy dog'
+CALLS = 20000
+
+
+class LoopbackConnection(Connection):
+    """ Discards requests, replays the given response forever. """
+
+    def __init__(self, response: bytes):
+        super().__init__()
+        self.response = response
+        self.position = 0
+
+    def send(self, data: bytes, flags=None):
+        self.position = 0
+
+    def _recv(self, buffersize, flags=None) -> bytes:
+        start = self.position
+        self.position += buffersize
+        return self.response[start:self.position]
+
+    def recv_frame(self) -> memoryview:
+        # the responses are read as whole frames, bypassing `_recv`
+        return memoryview(self.response)
+
+
+def make_response(payload: bytes=b'') -> bytes:
+    header = (
+        (0).to_bytes(ctypes.sizeof(ctypes.c_longlong), 'little', signed=True)
+        + (0).to_bytes(ctypes.sizeof(ctypes.c_int), 'little', signed=True)
+    )
+    length = len(header) + len(payload)
+    return length.to_bytes(ctypes.sizeof(ctypes.c_int), 'little') + (
+        header + payload
+    )
+
+
+def measure() -> dict:
+    get_conn = LoopbackConnection(
+        make_response(AnyDataObject.from_python(VALUE))
+    )
+    put_conn = LoopbackConnection(make_response())
+    return {
+        'cache_get': timeit.timeit(
+            lambda: cache_get(get_conn, 'my cache', 'my key'),
+            number=CALLS,
+        ),
+        'cache_put': timeit.timeit(
+            lambda: cache_put(put_conn, 'my cache', 'my key', VALUE),
+            number=CALLS,
+        ),
+    }
+
+
+def main():
+    cached = measure()
+
+    # temporarily bypass the memoization in every module that uses it
+    original_layout = utils.layout
+    build_layout = utils._build_layout.__wrapped__
+
+    def uncached_layout(name, fields, base=ctypes.LittleEndianStructure):
+        return build_layout(name, base, tuple(fields))
+
+    patched_modules = [
+        module for module in list(sys.modules.values())
+        if getattr(module, 'layout', None) is original_layout
+    ]
+    for module in patched_modules:
+        module.layout = uncached_layout
+    try:
+        uncached = measure()
+    finally:
+        for module in patched_modules:
+            module.layout = original_layout
+
+    for op in ('cache_get', 'cache_put'):
+        print('{}: {:.1f} us/call uncached, {:.1f} us/call cached'.format(
+            op,
+            uncached[op] / CALLS * 1e6,
+            cached[op] / CALLS * 1e6,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -14,4 +14,5 @@
 # limitations under the License.
 
 from pyignite.client import Client
-from pyignite.binary import GenericObjectMeta
+from pyignite.pool import ClientPool
+from pyignite.binary import GenericObjectMeta, RawBinaryObject
@@ -0,0 +1,36 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This package contains the asyncio implementation of `pyignite` client:
+:class:`~pyignite.aio.client.AioClient` and
+:class:`~pyignite.aio.cache.AioCache`. It uses the same queries and data
+types as the blocking client, but runs them over asyncio streams.
+
+Many coroutines can share one `AioClient` connection: their requests are
+sent as soon as they are made, and the responses are matched to them
+by query ID.
+
+Requires Python 3.6 or newer, while the blocking client works with older
+Python versions too.
+"""
+
+import sys
+
+if sys.version_info < (3, 6):
+    raise ImportError('pyignite.aio requires Python 3.6 or newer.')
+
+from .cache import AioCache
+from .client import AioClient
@@ -0,0 +1,626 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from copy import copy
+from typing import Any, Iterable, Optional, Union
+
+from pyignite.api.cache_config import cache_destroy, cache_get_configuration
+from pyignite.api.key_value import (
+    cache_get, cache_put, cache_get_all, cache_put_all, cache_replace,
+    cache_clear, cache_clear_key, cache_clear_keys,
+    cache_contains_key, cache_contains_keys,
+    cache_get_and_put, cache_get_and_put_if_absent, cache_put_if_absent,
+    cache_get_and_remove, cache_get_and_replace,
+    cache_remove_key, cache_remove_keys, cache_remove_all,
+    cache_remove_if_equals, cache_replace_if_equals, cache_get_size,
+)
+from pyignite.api.sql import (
+    scan, scan_cursor_get_page, sql, sql_cursor_get_page,
+)
+from pyignite.cache import CACHE_CREATE_FUNCS, Cache
+from pyignite.datatypes import prop_codes
+from pyignite.exceptions import CacheCreationError, CacheError, SQLError
+from pyignite.utils import cache_id
+from .coalescing import AioRequestCoalescer
+from .utils import close_cursor, status_to_exception
+
+
+__all__ = ['AioCache']
+
+
+class AioCache:
+    """
+    Asynchronous Ignite cache abstraction. Users should never use this class
+    directly, but construct its instances with
+    :py:meth:`~pyignite.aio.client.AioClient.create_cache`,
+    :py:meth:`~pyignite.aio.client.AioClient.get_or_create_cache` or
+    :py:meth:`~pyignite.aio.client.AioClient.get_cache` methods instead.
+
+    The methods are the coroutine counterparts of the methods
+    of :class:`~pyignite.cache.Cache`.
+    """
+    _cache_id = None
+    _name = None
+    _client = None
+    _settings = None
+    _coalescer = None
+
+    def __init__(self, client: 'AioClient', settings: Union[str, dict]=None):
+        """
+        Initialize cache object without communicating with server.
+
+        :param client: asynchronous Ignite client,
+        :param settings: cache settings. Can be a string (cache name) or a dict
+         of cache properties and their values. In this case PROP_NAME is
+         mandatory.
+        """
+        Cache._validate_settings(settings)
+        self._client = client
+        if type(settings) == str:
+            self._name = settings
+        else:
+            self._name = settings[prop_codes.PROP_NAME]
+        self._cache_id = cache_id(self._name)
+
+    @classmethod
+    async def create(
+        cls, client: 'AioClient', settings: Union[str, dict],
+        with_get: bool=False,
+    ) -> 'AioCache':
+        """
+        Create cache on server and initialize cache object.
+
+        :param client: asynchronous Ignite client,
+        :param settings: cache name or dict of cache properties,
+        :param with_get: (optional) do not raise exception, if the cache
+         is already exists. Defaults to False,
+        :return: cache object.
+        """
+        Cache._validate_settings(settings)
+        func = CACHE_CREATE_FUNCS[type(settings) is dict][with_get]
+        result = await func(client, settings)
+        if result.status != 0:
+            raise CacheCreationError(result.message)
+        return cls(client, settings)
+
+    async def settings(self) -> Optional[dict]:
+        """
+        Lazy Cache settings.
+
+        :return: dict of cache properties and their values.
+        """
+        if self._settings is None:
+            config_result = await cache_get_configuration(
+                self._client, self._cache_id
+            )
+            if config_result.status == 0:
+                self._settings = config_result.value
+            else:
+                raise CacheError(config_result.message)
+
+        return self._settings
+
+    @property
+    def name(self) -> str:
+        """
+        Cache name.
+        """
+        return self._name
+
+    @property
+    def client(self) -> 'AioClient':
+        """
+        :class:`~pyignite.aio.client.AioClient` object, through which
+        the cache is accessed.
+        """
+        return self._client
+
+    @property
+    def cache_id(self) -> int:
+        """
+        Cache ID.
+        """
+        return self._cache_id
+
+    @property
+    def coalescer(self) -> Optional[AioRequestCoalescer]:
+        """
+        Request coalescer of this cache object, if it is enabled.
+        """
+        return self._coalescer
+
+    def with_coalescing(
+        self, window: float=0.0002, max_batch: int=256,
+    ) -> 'AioCache':
+        """
+        Returns the same cache, that merges the concurrent `get` and
+        `contains_key` calls into `get_all` and `contains_keys` requests.
+        See :py:meth:`~pyignite.cache.Cache.with_coalescing`.
+
+        :return: :class:`~pyignite.aio.cache.AioCache` object.
+        """
+        cache = copy(self)
+        cache._coalescer = AioRequestCoalescer(cache, window, max_batch)
+        return cache
+
+    def _invalidate(self):
+        """
+        Counts the write, so that the request coalescers do not share
+        the reads, that have started before it.
+        """
+        # the coroutines run in the event loop thread, so the count
+        # is not changed concurrently
+        write_counts = self._client._write_counts
+        write_counts[self._cache_id] = write_counts.get(self._cache_id, 0) + 1
+
+    @status_to_exception(CacheError)
+    async def destroy(self):
+        """
+        Destroys cache with a given name.
+        """
+        result = await cache_destroy(self._client, self._cache_id)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def get(self, key, key_hint: object=None) -> Any:
+        """
+        Retrieves a value from cache by key.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :return: value retrieved.
+        """
+        if self._coalescer is not None:
+            result = await self._coalescer.get(key, key_hint)
+            if result is not None:
+                return result
+        result = await cache_get(
+            self._client, self._cache_id, key, key_hint=key_hint
+        )
+        result.value = await self._client.unwrap_binary(result.value)
+        return result
+
+    @status_to_exception(CacheError)
+    async def put(
+        self, key, value, key_hint: object=None, value_hint: object=None
+    ):
+        """
+        Puts a value with a given key to cache (overwriting existing value
+        if any).
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted.
+        """
+        result = await cache_put(
+            self._client, self._cache_id, key, value,
+            key_hint=key_hint, value_hint=value_hint
+        )
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def get_all(self, keys: list) -> list:
+        """
+        Retrieves multiple key-value pairs from cache.
+
+        :param keys: list of keys or tuples of (key, key_hint),
+        :return: a dict of key-value pairs.
+        """
+        result = await cache_get_all(self._client, self._cache_id, keys)
+        if result.value:
+            for key, value in result.value.items():
+                result.value[key] = await self._client.unwrap_binary(value)
+        return result
+
+    @status_to_exception(CacheError)
+    async def put_all(self, pairs: dict):
+        """
+        Puts multiple key-value pairs to cache (overwriting existing
+        associations if any).
+
+        :param pairs: dictionary type parameters, contains key-value pairs
+         to save. Each key or value can be an item of representable
+         Python type or a tuple of (item, hint).
+        """
+        result = await cache_put_all(self._client, self._cache_id, pairs)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def replace(
+        self, key, value, key_hint: object=None, value_hint: object=None
+    ):
+        """
+        Puts a value with a given key to cache only if the key already exist.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted.
+        """
+        result = await cache_replace(
+            self._client, self._cache_id, key, value,
+            key_hint=key_hint, value_hint=value_hint
+        )
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def clear(self, keys: Optional[list]=None):
+        """
+        Clears the cache without notifying listeners or cache writers.
+
+        :param keys: (optional) list of cache keys or (key, key type
+         hint) tuples to clear (default: clear all).
+        """
+        if keys:
+            result = await cache_clear_keys(self._client, self._cache_id, keys)
+        else:
+            result = await cache_clear(self._client, self._cache_id)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def clear_key(self, key, key_hint: object=None):
+        """
+        Clears the cache key without notifying listeners or cache writers.
+
+        :param key: key for the cache entry,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted.
+        """
+        result = await cache_clear_key(
+            self._client, self._cache_id, key, key_hint=key_hint
+        )
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def contains_key(self, key, key_hint=None) -> bool:
+        """
+        Returns a value indicating whether given key is present in cache.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :return: boolean `True` when key is present, `False` otherwise.
+        """
+        if self._coalescer is not None:
+            result = await self._coalescer.contains_key(key, key_hint)
+            if result is not None:
+                return result
+        return await cache_contains_key(
+            self._client, self._cache_id, key, key_hint=key_hint
+        )
+
+    @status_to_exception(CacheError)
+    async def contains_keys(self, keys: Iterable) -> bool:
+        """
+        Returns a value indicating whether all given keys are present in cache.
+
+        :param keys: a list of keys or (key, type hint) tuples,
+        :return: boolean `True` when all keys are present, `False` otherwise.
+        """
+        return await cache_contains_keys(self._client, self._cache_id, keys)
+
+    @status_to_exception(CacheError)
+    async def get_and_put(
+        self, key, value, key_hint=None, value_hint=None
+    ) -> Any:
+        """
+        Puts a value with a given key to cache, and returns the previous value
+        for that key, or null value if there was not such key.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted,
+        :return: old value or None.
+        """
+        result = await cache_get_and_put(
+            self._client, self._cache_id, key, value, key_hint, value_hint
+        )
+        result.value = await self._client.unwrap_binary(result.value)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def get_and_put_if_absent(
+        self, key, value, key_hint=None, value_hint=None
+    ):
+        """
+        Puts a value with a given key to cache only if the key does not
+        already exist.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted,
+        :return: old value or None.
+        """
+        result = await cache_get_and_put_if_absent(
+            self._client, self._cache_id, key, value, key_hint, value_hint
+        )
+        result.value = await self._client.unwrap_binary(result.value)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def put_if_absent(self, key, value, key_hint=None, value_hint=None):
+        """
+        Puts a value with a given key to cache only if the key does not
+        already exist.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted.
+        """
+        result = await cache_put_if_absent(
+            self._client, self._cache_id, key, value, key_hint, value_hint
+        )
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def get_and_remove(self, key, key_hint=None) -> Any:
+        """
+        Removes the cache entry with specified key, returning the value.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :return: old value or None.
+        """
+        result = await cache_get_and_remove(
+            self._client, self._cache_id, key, key_hint
+        )
+        result.value = await self._client.unwrap_binary(result.value)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def get_and_replace(
+        self, key, value, key_hint=None, value_hint=None
+    ) -> Any:
+        """
+        Puts a value with a given key to cache, returning previous value
+        for that key, if and only if there is a value currently mapped
+        for that key.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted,
+        :return: old value or None.
+        """
+        result = await cache_get_and_replace(
+            self._client, self._cache_id, key, value, key_hint, value_hint
+        )
+        result.value = await self._client.unwrap_binary(result.value)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def remove_key(self, key, key_hint=None):
+        """
+        Clears the cache key without notifying listeners or cache writers.
+
+        :param key: key for the cache entry,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted.
+        """
+        result = await cache_remove_key(
+            self._client, self._cache_id, key, key_hint
+        )
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def remove_keys(self, keys: list):
+        """
+        Removes cache entries by given list of keys, notifying listeners
+        and cache writers.
+
+        :param keys: list of keys or tuples of (key, key_hint) to remove.
+        """
+        result = await cache_remove_keys(self._client, self._cache_id, keys)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def remove_all(self):
+        """
+        Removes all cache entries, notifying listeners and cache writers.
+        """
+        result = await cache_remove_all(self._client, self._cache_id)
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def remove_if_equals(
+        self, key, sample, key_hint=None, sample_hint=None
+    ):
+        """
+        Removes an entry with a given key if provided value is equal to
+        actual value, notifying listeners and cache writers.
+
+        :param key: key for the cache entry,
+        :param sample: a sample to compare the stored value with,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param sample_hint: (optional) Ignite data type, for which
+         the given sample should be converted.
+        """
+        result = await cache_remove_if_equals(
+            self._client, self._cache_id, key, sample, key_hint, sample_hint
+        )
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def replace_if_equals(
+        self, key, sample, value,
+        key_hint=None, sample_hint=None, value_hint=None
+    ) -> Any:
+        """
+        Puts a value with a given key to cache only if the key already exists
+        and value equals provided sample.
+
+        :param key: key for the cache entry,
+        :param sample: a sample to compare the stored value with,
+        :param value: new value for the given key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param sample_hint: (optional) Ignite data type, for which
+         the given sample should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted,
+        :return: boolean `True` when key is present, `False` otherwise.
+        """
+        result = await cache_replace_if_equals(
+            self._client, self._cache_id, key, sample, value,
+            key_hint, sample_hint, value_hint
+        )
+        self._invalidate()
+        return result
+
+    @status_to_exception(CacheError)
+    async def get_size(self, peek_modes=0):
+        """
+        Gets the number of entries in cache.
+
+        :param peek_modes: (optional) limit count to near cache partition
+         (PeekModes.NEAR), primary cache (PeekModes.PRIMARY), or backup cache
+         (PeekModes.BACKUP). Defaults to all cache partitions (PeekModes.ALL),
+        :return: integer number of cache entries.
+        """
+        return await cache_get_size(self._client, self._cache_id, peek_modes)
+
+    async def _unwrap_page(self, data: dict):
+        page = []
+        for k, v in data.items():
+            page.append((
+                await self._client.unwrap_binary(k),
+                await self._client.unwrap_binary(v),
+            ))
+        return page
+
+    async def scan(
+        self, page_size: int=1, partitions: int=-1, local: bool=False
+    ):
+        """
+        Returns all key-value pairs from the cache. See
+        :py:meth:`~pyignite.cache.Cache.scan`.
+
+        The cursor is closed on the server, if the iteration stops before
+        the last page. Await the `aclose()` method of the iterator to close
+        it right away, instead of when it is garbage-collected.
+
+        :return: async iterator with key-value pairs.
+        """
+        result = await scan(
+            self._client, self._cache_id, page_size, partitions, local
+        )
+        if result.status != 0:
+            raise CacheError(result.message)
+
+        cursor, more = result.value['cursor'], result.value['more']
+        try:
+            for k, v in await self._unwrap_page(result.value['data']):
+                yield k, v
+
+            while more:
+                result = await scan_cursor_get_page(self._client, cursor)
+                if result.status != 0:
+                    raise CacheError(result.message)
+                more = result.value['more']
+
+                for k, v in await self._unwrap_page(result.value['data']):
+                    yield k, v
+        finally:
+            # the cursor is left open on error or early exit
+            if more:
+                await close_cursor(self._client, cursor)
+
+    async def select_row(
+        self, query_str: str, page_size: int=1,
+        query_args: Optional[list]=None, distributed_joins: bool=False,
+        replicated_only: bool=False, local: bool=False, timeout: int=0
+    ):
+        """
+        Executes a simplified SQL SELECT query over data stored in the cache.
+        See :py:meth:`~pyignite.cache.Cache.select_row`.
+
+        The cursor is closed on the server, if the iteration stops before
+        the last page. Await the `aclose()` method of the iterator to close
+        it right away, instead of when it is garbage-collected.
+
+        :return: async iterator with key-value pairs.
+        """
+        settings = await self.settings()
+        type_name = settings[
+            prop_codes.PROP_QUERY_ENTITIES
+        ][0]['value_type_name']
+        if not type_name:
+            raise SQLError('Value type is unknown')
+        result = await sql(
+            self._client,
+            self._cache_id,
+            type_name,
+            query_str,
+            page_size,
+            query_args,
+            distributed_joins,
+            replicated_only,
+            local,
+            timeout
+        )
+        if result.status != 0:
+            raise SQLError(result.message)
+
+        cursor, more = result.value['cursor'], result.value['more']
+        try:
+            for k, v in await self._unwrap_page(result.value['data']):
+                yield k, v
+
+            while more:
+                result = await sql_cursor_get_page(self._client, cursor)
+                if result.status != 0:
+                    raise SQLError(result.message)
+                more = result.value['more']
+
+                for k, v in await self._unwrap_page(result.value['data']):
+                    yield k, v
+        finally:
+            # the cursor is left open on error or early exit
+            if more:
+                await close_cursor(self._client, cursor)
@@ -0,0 +1,400 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `AioClient` class, the asyncio counterpart
+of :class:`~pyignite.client.Client`.
+
+The client is passed to the functions of :mod:`pyignite.api` instead
+of the blocking connection, and they return awaitables::
+
+    client = AioClient()
+    await client.connect('127.0.0.1', 10800)
+    result = await cache_get(client, 'my cache', 'my key')
+"""
+
+from typing import Callable, Iterable, Type, Union
+
+from pyignite.api.binary import get_binary_type, put_binary_type
+from pyignite.api.cache_config import cache_get_names
+from pyignite.api.result import APIResult
+from pyignite.api.sql import sql_fields, sql_fields_cursor_get_page
+from pyignite.client import Client
+from pyignite.datatypes import BinaryObject
+from pyignite.exceptions import (
+    BinaryTypeError, CacheError, ParseError, SQLError,
+)
+from pyignite.utils import entity_id, is_wrapped, schema_id
+from .cache import AioCache
+from .connection import AioConnection
+from .utils import close_cursor, status_to_exception
+
+
+__all__ = ['AioClient']
+
+
+class MissingBinaryType(Exception):
+    """
+    Raised while decoding, when a binary type is not found in the local
+    registry. The type is then fetched from the server and decoding
+    is repeated.
+    """
+
+    def __init__(self, type_id: int, schema_id: int):
+        super().__init__(type_id, schema_id)
+        self.type_id = type_id
+        self.schema_id = schema_id
+
+
+class RegistryView:
+    """
+    Stands for the client while decoding the response. Only looks up
+    the local binary type registry, since decoding is not asynchronous.
+    """
+
+    def __init__(self, client: 'AioClient'):
+        self.client = client
+
+    def query_binary_type(self, type_id: int, schema_id: int) -> Type:
+        try:
+            return self.client.registry[type_id][schema_id]
+        except KeyError:
+            raise MissingBinaryType(type_id, schema_id) from None
+
+    @property
+    def compact_footer(self) -> bool:
+        return self.client.compact_footer
+
+    @compact_footer.setter
+    def compact_footer(self, value: bool):
+        self.client.compact_footer = value
+
+
+class AioClient(AioConnection):
+    """
+    Asynchronous Ignite client. Shares the binary type registry with
+    the blocking :class:`~pyignite.client.Client`.
+    """
+
+    _compact_footer = None
+    _unregistered = None
+
+    def __init__(self, compact_footer: bool=None, **kwargs):
+        """
+        Initialize client.
+
+        :param compact_footer: (optional) use compact (True, recommended) or
+         full (False) schema approach when serializing Complex objects.
+         Default is to use the same approach the server is using (None).
+        """
+        self._compact_footer = compact_footer
+        self._unregistered = []
+        # the numbers of writes by cache ID, see
+        # :py:class:`~pyignite.aio.coalescing.AioRequestCoalescer`
+        self._write_counts = {}
+        super().__init__(**kwargs)
+
+    @property
+    def registry(self) -> dict:
+        """
+        Binary type registry: {type ID: {schema ID: data class}}.
+        """
+        return Client._registry
+
+    @property
+    def compact_footer(self) -> bool:
+        """
+        Complex object schema encoding approach. See
+        :py:attr:`~pyignite.client.Client.compact_footer`.
+        """
+        return self._compact_footer or self._compact_footer is None
+
+    @compact_footer.setter
+    def compact_footer(self, value: bool):
+        if self._compact_footer not in (value, None):
+            raise Warning('Can not change client schema approach.')
+        else:
+            self._compact_footer = value
+
+    def defer_query(
+        self, query_id: int, send_buffer: bytes, response_struct: 'Response',
+        post_process: Callable=None,
+    ):
+        """
+        Called by :py:meth:`~pyignite.queries.Query.perform`.
+
+        :return: coroutine, that sends the query and returns
+         :class:`~pyignite.api.result.APIResult`.
+        """
+        # the query is serialized just now, so the classes are the ones
+        # met while serializing it
+        unregistered, self._unregistered = self._unregistered, []
+        return self._perform(
+            query_id, send_buffer, response_struct, post_process,
+            unregistered,
+        )
+
+    async def _perform(
+        self, query_id: int, send_buffer: bytes, response_struct: 'Response',
+        post_process: Callable=None, unregistered: list=None,
+    ) -> APIResult:
+        for data_class in unregistered or []:
+            await self.register_binary_type(data_class)
+        frame = await self.request(query_id, send_buffer)
+        result = await self.decode(
+            lambda client: response_struct.decode(frame, client)
+        )
+        if result.status == 0 and post_process is not None:
+            result.value = post_process(result.value)
+        return result
+
+    async def decode(self, decoder: Callable):
+        """
+        Runs the decoder, fetching the missing binary types from the server
+        and repeating it as needed.
+
+        :param decoder: function, that accepts the client object to look up
+         binary types with,
+        :return: the return value of the decoder.
+        """
+        attempted = set()
+        while True:
+            try:
+                return decoder(RegistryView(self))
+            except MissingBinaryType as e:
+                if (e.type_id, e.schema_id) in attempted:
+                    raise ParseError('Binary type is not registered') from None
+                attempted.add((e.type_id, e.schema_id))
+                await self._sync_binary_registry(e.type_id)
+
+    async def unwrap_binary(self, value):
+        """
+        Detects and unwraps Binary Object.
+
+        :param value: anything that could be a Binary Object,
+        :return: the result of the Binary Object unwrapping with all other
+         data left intact.
+        """
+        if not is_wrapped(value):
+            return value
+        blob, offset = value
+        return await self.decode(
+            lambda client: BinaryObject.decode(
+                memoryview(blob), offset, client
+            )[0]
+        )
+
+    @status_to_exception(BinaryTypeError)
+    async def get_binary_type(self, binary_type: Union[str, int]) -> dict:
+        """
+        Gets the binary type information from the Ignite server. See
+        :py:meth:`~pyignite.client.Client.get_binary_type`.
+
+        :param binary_type: binary type name or ID,
+        :return: binary type description.
+        """
+        result = await get_binary_type(self, binary_type)
+        if result.status == 0 and result.value['type_exists']:
+            result.value = Client._convert_binary_type(result.value)
+        return result
+
+    @status_to_exception(BinaryTypeError)
+    async def put_binary_type(
+        self, type_name: str, affinity_key_field: str=None,
+        is_enum=False, schema: dict=None
+    ):
+        """
+        Registers binary type information in cluster. See
+        :py:meth:`~pyignite.client.Client.put_binary_type`.
+        """
+        return await put_binary_type(
+            self, type_name, affinity_key_field, is_enum, schema
+        )
+
+    async def _sync_binary_registry(self, type_id: int):
+        """
+        Reads Complex object description from Ignite server. Creates default
+        Complex object classes and puts in registry, if not already there.
+
+        :param type_id: Complex object type ID.
+        """
+        Client._update_binary_registry(
+            type_id, await self.get_binary_type(type_id)
+        )
+
+    def ensure_binary_type(self, data_class: Type):
+        """
+        Called while serializing the query. The Complex object class,
+        that is not registered yet, is registered before the query is sent.
+
+        :param data_class: Complex object class.
+        """
+        registered = self.registry[data_class.type_id].get(
+            data_class.schema_id, None
+        )
+        if registered is not data_class:
+            if data_class not in self._unregistered:
+                self._unregistered.append(data_class)
+
+    async def register_binary_type(
+        self, data_class: Type, affinity_key_field: str=None,
+    ):
+        """
+        Register the given class as a representation of a certain Complex
+        object type. Discards autogenerated or previously registered class.
+
+        :param data_class: Complex object class,
+        :param affinity_key_field: (optional) affinity parameter.
+        """
+        if not await self.query_binary_type(
+            data_class.type_id, data_class.schema_id
+        ):
+            await self.put_binary_type(
+                data_class.type_name,
+                affinity_key_field,
+                schema=data_class.schema,
+            )
+        self.registry[data_class.type_id][data_class.schema_id] = data_class
+
+    async def query_binary_type(
+        self, binary_type: Union[int, str], schema: Union[int, dict]=None,
+        sync: bool=True
+    ):
+        """
+        Queries the registry of Complex object classes. See
+        :py:meth:`~pyignite.client.Client.query_binary_type`.
+        """
+        type_id = entity_id(binary_type)
+        s_id = schema_id(schema)
+
+        if schema:
+            result = self.registry[type_id].get(s_id, None)
+        else:
+            result = self.registry[type_id]
+
+        if sync and not result:
+            await self._sync_binary_registry(type_id)
+            return await self.query_binary_type(type_id, s_id, sync=False)
+
+        return result
+
+    async def create_cache(self, settings: Union[str, dict]) -> AioCache:
+        """
+        Creates Ignite cache by name. Raises `CacheError` if such a cache is
+        already exists.
+
+        :param settings: cache name or dict of cache properties' codes
+         and values,
+        :return: :class:`~pyignite.aio.cache.AioCache` object.
+        """
+        return await AioCache.create(self, settings)
+
+    async def get_or_create_cache(
+        self, settings: Union[str, dict]
+    ) -> AioCache:
+        """
+        Creates Ignite cache, if not exist.
+
+        :param settings: cache name or dict of cache properties' codes
+         and values,
+        :return: :class:`~pyignite.aio.cache.AioCache` object.
+        """
+        return await AioCache.create(self, settings, with_get=True)
+
+    def get_cache(self, settings: Union[str, dict]) -> AioCache:
+        """
+        Creates cache object with a given cache name without checking it up
+        on server.
+
+        :param settings: cache name or cache properties (but only `PROP_NAME`
+         property is allowed),
+        :return: :class:`~pyignite.aio.cache.AioCache` object.
+        """
+        return AioCache(self, settings)
+
+    @status_to_exception(CacheError)
+    async def get_cache_names(self) -> list:
+        """
+        Gets existing cache names.
+
+        :return: list of cache names.
+        """
+        return await cache_get_names(self)
+
+    async def sql(
+        self, query_str: str, page_size: int=1, query_args: Iterable=None,
+        schema: Union[int, str]='PUBLIC',
+        statement_type: int=0, distributed_joins: bool=False,
+        local: bool=False, replicated_only: bool=False,
+        enforce_join_order: bool=False, collocated: bool=False,
+        lazy: bool=False, include_field_names: bool=False,
+        max_rows: int=-1, timeout: int=0,
+    ):
+        """
+        Runs an SQL query and returns its result. Takes the same parameters
+        as :py:meth:`~pyignite.client.Client.sql`. The query is sent, when
+        the coroutine is awaited, and the following pages are fetched, when
+        the rows are iterated over::
+
+            await client.sql('DROP TABLE Student IF EXISTS')
+            async for row in await client.sql('SELECT * FROM Student'):
+                print(row)
+
+        The cursor is closed on the server, if the iteration stops before
+        the last page. Await the `aclose()` method of the iterator to close
+        it right away, instead of when it is garbage-collected.
+
+        :return: async iterator with result rows as a lists. If
+         `include_field_names` was set, the first row will hold field names.
+        """
+        schema = await self.get_or_create_cache(schema)
+        result = await sql_fields(
+            self, schema.cache_id, query_str,
+            page_size, query_args, schema.name,
+            statement_type, distributed_joins, local, replicated_only,
+            enforce_join_order, collocated, lazy, include_field_names,
+            max_rows, timeout,
+        )
+        if result.status != 0:
+            raise SQLError(result.message)
+
+        return self._generate_result(
+            result.value, include_field_names
+        )
+
+    async def _generate_result(self, value: dict, include_field_names: bool):
+        if include_field_names:
+            yield value['fields']
+            field_count = len(value['fields'])
+        else:
+            field_count = value['field_count']
+        cursor, more = value['cursor'], value['more']
+        try:
+            for line in value['data']:
+                yield line
+
+            while more:
+                result = await sql_fields_cursor_get_page(
+                    self, cursor, field_count
+                )
+                if result.status != 0:
+                    raise SQLError(result.message)
+                more = result.value['more']
+                for line in result.value['data']:
+                    yield line
+        finally:
+            # the cursor is left open on error or early exit
+            if more:
+                await close_cursor(self, cursor)
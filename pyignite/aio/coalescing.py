@@ -0,0 +1,169 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `AioRequestCoalescer` class, the asyncio counterpart
+of :class:`~pyignite.coalescing.RequestCoalescer`.
+"""
+
+import asyncio
+from typing import Optional
+
+from pyignite.api.key_value import (
+    cache_contains_key, cache_contains_keys, cache_get, cache_get_all,
+)
+from pyignite.api.result import APIResult
+from pyignite.coalescing import Batch, Call, CoalescerBase, GET, CONTAINS_KEY
+
+
+__all__ = ['AioRequestCoalescer']
+
+
+class AioCall(Call):
+    """
+    The coroutine, that waits for a batch to complete.
+    """
+    __slots__ = ()
+
+    def __init__(self, key, key_hint: object=None, generation: int=0):
+        super().__init__(key, key_hint, generation)
+        self.done = asyncio.Event()
+
+    async def wait(self) -> APIResult:
+        await self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class AioBatch(Batch):
+
+    def __init__(self):
+        super().__init__()
+        self.full = asyncio.Event()
+
+
+class AioRequestCoalescer(CoalescerBase):
+    """
+    Merges the concurrent `get` and `contains_key` calls of the cache
+    into `get_all` and `contains_keys` requests.
+
+    The batches are sent by separate tasks, so the cancellation of any
+    of the calls does not affect the others.
+    """
+    call_class = AioCall
+    batch_class = AioBatch
+
+    async def get(self, key, key_hint: object=None) -> Optional[APIResult]:
+        """
+        Coalesced counterpart
+        of :py:func:`~pyignite.api.key_value.cache_get`. The value is
+        already unwrapped.
+
+        :return: API result data object, or None, if the key can not
+         be coalesced.
+        """
+        return await self._call(GET, key, key_hint)
+
+    async def contains_key(
+        self, key, key_hint: object=None,
+    ) -> Optional[APIResult]:
+        """
+        Coalesced counterpart
+        of :py:func:`~pyignite.api.key_value.cache_contains_key`.
+
+        :return: API result data object, or None, if the key can not
+         be coalesced.
+        """
+        return await self._call(CONTAINS_KEY, key, key_hint)
+
+    async def _call(self, kind: str, key, key_hint: object=None):
+        call, batch = self._join(kind, key, key_hint)
+        if call is None:
+            return None
+        if batch is not None:
+            asyncio.ensure_future(self._send(kind, batch))
+        return await call.wait()
+
+    async def _send(self, kind: str, batch: AioBatch):
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.window)
+        except asyncio.TimeoutError:
+            pass
+        with self._lock:
+            self._close(kind, batch)
+
+        calls = list(batch.calls.values())
+        try:
+            if kind == GET:
+                results = await self._get(batch)
+            else:
+                results = await self._contains_key(batch)
+            for call, result in zip(calls, results):
+                call.result = result
+        except Exception as e:
+            for call in calls:
+                call.error = e
+        finally:
+            self._complete(kind, batch)
+            for call in calls:
+                call.done.set()
+
+    async def _get(self, batch: AioBatch) -> list:
+        client = self.cache.client
+        calls = list(batch.calls.values())
+        self._count_request()
+        if len(calls) == 1:
+            result = await cache_get(
+                client, self.cache.cache_id, calls[0].key,
+                key_hint=calls[0].key_hint,
+            )
+            result.value = await client.unwrap_binary(result.value)
+            return [result]
+
+        result = await cache_get_all(
+            client, self.cache.cache_id, [call.item for call in calls],
+        )
+        results = self._fan_out_get(batch, result)
+        for result in results:
+            result.value = await client.unwrap_binary(result.value)
+        return results
+
+    async def _contains_key(self, batch: AioBatch) -> list:
+        client = self.cache.client
+        calls = list(batch.calls.values())
+        self._count_request()
+        if len(calls) == 1:
+            return [await cache_contains_key(
+                client, self.cache.cache_id, calls[0].key,
+                key_hint=calls[0].key_hint,
+            )]
+
+        result = await cache_contains_keys(
+            client, self.cache.cache_id, [call.item for call in calls],
+        )
+        if result.status != 0 or result.value:
+            return [result] * len(calls)
+
+        # some of the keys are missing, check them one by one; the requests
+        # share the connection
+        self._count_request()
+        return await asyncio.gather(*[
+            cache_contains_key(
+                client, self.cache.cache_id, call.key,
+                key_hint=call.key_hint,
+            )
+            for call in calls
+        ])
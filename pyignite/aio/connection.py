@@ -0,0 +1,211 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `AioConnection` class, that wraps asyncio streams
+and multiplexes the requests of many coroutines over one connection.
+"""
+
+import asyncio
+import ctypes
+
+from pyignite.constants import *
+from pyignite.connection.handshake import (
+    HandshakeRequest, decode_response, get_error_text,
+)
+from pyignite.connection.ssl import create_context
+from pyignite.exceptions import HandshakeError, ParameterError, SocketError
+from pyignite.utils import c_struct
+
+
+__all__ = ['AioConnection']
+
+
+class AioConnection:
+    """
+    Asynchronous connection to Ignite node. Each request is sent as soon
+    as it is made, and its response is matched to it by query ID, so
+    the requests of many coroutines can be in flight at the same time.
+    """
+
+    _reader = None
+    _writer = None
+    _read_task = None
+    _drain_lock = None
+    host = None
+    port = None
+    timeout = None
+    username = None
+    password = None
+
+    @staticmethod
+    def _check_kwargs(kwargs):
+        expected_args = [
+            'timeout',
+            'use_ssl',
+            'ssl_version',
+            'ssl_ciphers',
+            'ssl_cert_reqs',
+            'ssl_keyfile',
+            'ssl_certfile',
+            'ssl_ca_certfile',
+            'username',
+            'password',
+        ]
+        for kw in kwargs:
+            if kw not in expected_args:
+                raise ParameterError((
+                    'Unexpected parameter for connection initialization: `{}`'
+                ).format(kw))
+
+    def __init__(self, **kwargs):
+        """
+        Initialize connection. Accepts the same parameters as
+        :py:meth:`~pyignite.connection.Connection.__init__`, except
+        for the ones, that are specific for the blocking socket reading.
+
+        :param timeout: (optional) timeout (in seconds) for connecting
+         and for waiting for each response. Default is None (no timeout).
+        """
+        self._check_kwargs(kwargs)
+        self.timeout = kwargs.pop('timeout', None)
+        self.username = kwargs.pop('username', None)
+        self.password = kwargs.pop('password', None)
+        if all([self.username, self.password, 'use_ssl' not in kwargs]):
+            kwargs['use_ssl'] = True
+        self.init_kwargs = kwargs
+        self._pending = {}
+
+    def __repr__(self) -> str:
+        if self.host and self.port:
+            return '{}:{}'.format(self.host, self.port)
+        else:
+            return '<not connected>'
+
+    @property
+    def closed(self) -> bool:
+        """
+        True if the connection is not established or is broken.
+        """
+        return self._read_task is None or self._read_task.done()
+
+    async def connect(
+        self, host: str=IGNITE_DEFAULT_HOST, port: int=IGNITE_DEFAULT_PORT
+    ):
+        """
+        Connect to the server and perform the handshake.
+
+        :param host: (optional) Ignite server host,
+        :param port: (optional) Ignite server port.
+        """
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host, port, ssl=create_context(self.init_kwargs)
+            ),
+            self.timeout,
+        )
+        self._drain_lock = asyncio.Lock()
+
+        hs_request = HandshakeRequest(self.username, self.password)
+        self._writer.write(bytes(hs_request))
+        hs_response = decode_response(
+            await asyncio.wait_for(self._read_frame(), self.timeout)
+        )
+        if hs_response['op_code'] == 0:
+            self._writer.close()
+            raise HandshakeError(get_error_text(hs_response))
+
+        self.host, self.port = host, port
+        self._read_task = asyncio.ensure_future(self._read_responses())
+
+    async def close(self):
+        """
+        Close the connection. All the requests, that are waiting for their
+        responses, fail with `SocketError`.
+        """
+        if self._read_task is not None:
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
+        if self._writer is not None:
+            self._writer.close()
+        self._read_task = self._reader = self._writer = None
+        self.host = self.port = None
+
+    async def _read_frame(self) -> memoryview:
+        """
+        Read the whole response frame, which is prefixed with its length.
+        """
+        length_buffer = await self._reader.readexactly(
+            ctypes.sizeof(ctypes.c_int)
+        )
+        length = int.from_bytes(length_buffer, byteorder=PROTOCOL_BYTE_ORDER)
+        return memoryview(
+            length_buffer + await self._reader.readexactly(length)
+        )
+
+    async def _read_responses(self):
+        """
+        Read response frames and pass them to the waiting requests.
+        """
+        id_decoder = c_struct(ctypes.c_longlong)
+        error = SocketError('Socket connection broken.')
+        try:
+            while True:
+                frame = await self._read_frame()
+                query_id = id_decoder.unpack_from(
+                    frame, ctypes.sizeof(ctypes.c_int)
+                )[0]
+                future = self._pending.pop(query_id, None)
+                if future is not None and not future.done():
+                    future.set_result(frame)
+        except asyncio.CancelledError:
+            error = SocketError('Connection is closed.')
+            raise
+        except (EOFError, OSError):
+            pass
+        finally:
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def request(self, query_id: int, send_buffer: bytes) -> memoryview:
+        """
+        Send the query and wait for the response with the same query ID.
+
+        :param query_id: query ID, must be unique among the queries,
+         that are in flight,
+        :param send_buffer: serialized query,
+        :return: the whole response frame.
+        """
+        if self.closed:
+            raise SocketError('Connection is not established.')
+        if query_id in self._pending:
+            raise ParameterError(
+                'Duplicate query ID in flight: {}'.format(query_id)
+            )
+
+        future = asyncio.get_event_loop().create_future()
+        self._pending[query_id] = future
+        try:
+            self._writer.write(send_buffer)
+            async with self._drain_lock:
+                await self._writer.drain()
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(query_id, None)
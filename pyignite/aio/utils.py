@@ -0,0 +1,54 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import wraps
+from typing import Type
+
+from pyignite.api.sql import resource_close
+from pyignite.exceptions import ReconnectError
+
+
+async def close_cursor(client: 'AioClient', cursor: int):
+    """
+    Closes the cursor, that has not been read till the end, on the server.
+    Coroutine version of :py:func:`~pyignite.prefetch.close_cursor`.
+
+    :param client: asynchronous Ignite client,
+    :param cursor: cursor ID.
+    """
+    try:
+        await resource_close(client, cursor)
+    except (OSError, ReconnectError):
+        pass
+
+
+def status_to_exception(exc: Type[Exception]):
+    """
+    Converts erroneous status code with error message to an exception
+    of the given class. Coroutine version of
+    :py:func:`~pyignite.utils.status_to_exception`.
+
+    :param exc: the class of exception to raise,
+    :return: decorator.
+    """
+    def ste_decorator(fn):
+        @wraps(fn)
+        async def ste_wrapper(*args, **kwargs):
+            result = await fn(*args, **kwargs)
+            if result.status != 0:
+                raise exc(result.message)
+            return result.value
+        return ste_wrapper
+    return ste_decorator
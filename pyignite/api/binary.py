@@ -17,10 +17,10 @@ from typing import Union
 
 from pyignite.constants import *
 from pyignite.datatypes.binary import (
-    body_struct, enum_struct, schema_struct, binary_fields_struct,
+    enum_struct, schema_struct, binary_fields_struct,
 )
 from pyignite.datatypes import String, Int, Bool
-from pyignite.queries import Query, Response
+from pyignite.queries import BinaryTypeResponse, Query
 from pyignite.queries.op_codes import *
 from pyignite.utils import int_overflow, entity_id
 from .result import APIResult
@@ -48,57 +48,13 @@ def get_binary_type(
         query_id=query_id,
     )
 
-    _, send_buffer = query_struct.from_python({
-        'type_id': entity_id(binary_type),
-    })
-    connection.send(send_buffer)
-
-    response_head_struct = Response([
-        ('type_exists', Bool),
-    ])
-    response_head_type, recv_buffer = response_head_struct.parse(connection)
-    response_head = response_head_type.from_buffer_copy(recv_buffer)
-    response_parts = []
-    if response_head.type_exists:
-        resp_body_type, resp_body_buffer = body_struct.parse(connection)
-        response_parts.append(('body', resp_body_type))
-        resp_body = resp_body_type.from_buffer_copy(resp_body_buffer)
-        recv_buffer += resp_body_buffer
-        if resp_body.is_enum:
-            resp_enum, resp_enum_buffer = enum_struct.parse(connection)
-            response_parts.append(('enums', resp_enum))
-            recv_buffer += resp_enum_buffer
-        resp_schema_type, resp_schema_buffer = schema_struct.parse(connection)
-        response_parts.append(('schema', resp_schema_type))
-        recv_buffer += resp_schema_buffer
-
-    response_class = type(
-        'GetBinaryTypeResponse',
-        (response_head_type,),
-        {
-            '_pack_': 1,
-            '_fields_': response_parts,
-        }
+    return query_struct.perform(
+        connection,
+        query_params={
+            'type_id': entity_id(binary_type),
+        },
+        response_struct=BinaryTypeResponse(),
     )
-    response = response_class.from_buffer_copy(recv_buffer)
-    result = APIResult(response)
-    if result.status != 0:
-        return result
-    result.value = {
-        'type_exists': response.type_exists
-    }
-    if hasattr(response, 'body'):
-        result.value.update(body_struct.to_python(response.body))
-    if hasattr(response, 'enums'):
-        result.value['enums'] = enum_struct.to_python(response.enums)
-    if hasattr(response, 'schema'):
-        result.value['schema'] = {
-            x['schema_id']: [
-                z['schema_field_id'] for z in x['schema_fields']
-            ]
-            for x in schema_struct.to_python(response.schema)
-        }
-    return result
 
 
 def put_binary_type(
@@ -200,10 +156,11 @@ def put_binary_type(
             ],
             query_id=query_id,
         )
-    result = query_struct.perform(connection, query_params=data)
-    if result.status == 0:
-        result.value = {
+    return query_struct.perform(
+        connection,
+        query_params=data,
+        post_process=lambda value: {
             'type_id': type_id,
             'schema_id': schema_id,
-        }
-    return result
+        },
+    )
@@ -77,7 +77,7 @@ def cache_get_configuration(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -86,10 +86,8 @@ def cache_get_configuration(
         response_config=[
             ('cache_config', cache_config_struct),
         ],
+        post_process=lambda value: compact_cache_config(value['cache_config']),
     )
-    if result.status == 0:
-        result.value = compact_cache_config(result.value['cache_config'])
-    return result
 
 
 def cache_create(
@@ -194,15 +192,13 @@ def cache_get_names(connection: 'Connection', query_id=None) -> 'APIResult':
     """
 
     query_struct = Query(OP_CACHE_GET_NAMES, query_id=query_id)
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         response_config=[
             ('cache_names', StringArray),
         ],
+        post_process=lambda value: value['cache_names'],
     )
-    if result.status == 0:
-        result.value = result.value['cache_names']
-    return result
 
 
 def cache_create_with_config(
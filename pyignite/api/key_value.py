@@ -31,7 +31,8 @@ def cache_put(
     """
     Puts a value with a given key to cache (overwriting existing value if any).
 
-    :param connection: connection to Ignite server,
+    :param connection: connection to Ignite server or a
+     :class:`~pyignite.queries.pipeline.Pipeline`,
     :param cache: name or ID of the cache,
     :param key: key for the cache entry. Can be of any supported type,
     :param value: value for the key,
@@ -73,7 +74,8 @@ def cache_get(
     """
     Retrieves a value from cache by key.
 
-    :param connection: connection to Ignite server,
+    :param connection: connection to Ignite server or a
+     :class:`~pyignite.queries.pipeline.Pipeline`,
     :param cache: name or ID of the cache,
     :param key: key for the cache entry. Can be of any supported type,
     :param key_hint: (optional) Ignite data type, for which the given key
@@ -96,7 +98,7 @@ def cache_get(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -106,11 +108,8 @@ def cache_get(
         response_config=[
            ('value', AnyDataObject),
         ],
+        post_process=lambda value: value['value'],
     )
-    if result.status != 0:
-        return result
-    result.value = result.value['value']
-    return result
 
 
 def cache_get_all(
@@ -142,7 +141,7 @@ def cache_get_all(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -152,10 +151,8 @@ def cache_get_all(
         response_config=[
             ('data', Map),
         ],
+        post_process=lambda value: dict(value)['data'],
     )
-    if result.status == 0:
-        result.value = dict(result.value)['data']
-    return result
 
 
 def cache_put_all(
@@ -206,7 +203,8 @@ def cache_contains_key(
     """
     Returns a value indicating whether given key is present in cache.
 
-    :param connection: connection to Ignite server,
+    :param connection: connection to Ignite server or a
+     :class:`~pyignite.queries.pipeline.Pipeline`,
     :param cache: name or ID of the cache,
     :param key: key for the cache entry. Can be of any supported type,
     :param key_hint: (optional) Ignite data type, for which the given key
@@ -230,9 +228,9 @@ def cache_contains_key(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
-            query_params={
+        query_params={
             'hash_code': cache_id(cache),
             'flag': 1 if binary else 0,
             'key': key,
@@ -240,10 +238,8 @@ def cache_contains_key(
         response_config=[
             ('value', Bool),
         ],
+        post_process=lambda value: value['value'],
     )
-    if result.status == 0:
-        result.value = result.value['value']
-    return result
 
 
 def cache_contains_keys(
@@ -275,7 +271,7 @@ def cache_contains_keys(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -285,10 +281,8 @@ def cache_contains_keys(
         response_config=[
             ('value', Bool),
         ],
+        post_process=lambda value: value['value'],
     )
-    if result.status == 0:
-        result.value = result.value['value']
-    return result
 
 
 def cache_get_and_put(
@@ -327,7 +321,7 @@ def cache_get_and_put(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -338,10 +332,8 @@ def cache_get_and_put(
         response_config=[
             ('value', AnyDataObject),
         ],
+        post_process=lambda value: value['value'],
     )
-    if result.status == 0:
-        result.value = result.value['value']
-    return result
 
 
 def cache_get_and_replace(
@@ -379,7 +371,7 @@ def cache_get_and_replace(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -390,10 +382,8 @@ def cache_get_and_replace(
         response_config=[
             ('value', AnyDataObject),
         ],
+        post_process=lambda value: value['value'],
     )
-    if result.status == 0:
-        result.value = result.value['value']
-    return result
 
 
 def cache_get_and_remove(
@@ -425,7 +415,7 @@ def cache_get_and_remove(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -435,10 +425,8 @@ def cache_get_and_remove(
         response_config=[
             ('value', AnyDataObject),
         ],
+        post_process=lambda value: value['value'],
     )
-    if result.status == 0:
-        result.value = result.value['value']
-    return result
 
 
 def cache_put_if_absent(
@@ -476,7 +464,7 @@ def cache_put_if_absent(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -487,10 +475,8 @@ def cache_put_if_absent(
         response_config=[
             ('success', Bool),
         ],
+        post_process=lambda value: value['success'],
     )
-    if result.status == 0:
-        result.value = result.value['success']
-    return result
 
 
 def cache_get_and_put_if_absent(
@@ -528,7 +514,7 @@ def cache_get_and_put_if_absent(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -539,10 +525,8 @@ def cache_get_and_put_if_absent(
         response_config=[
             ('value', AnyDataObject),
         ],
+        post_process=lambda value: value['value'],
     )
-    if result.status == 0:
-        result.value = result.value['value']
-    return result
 
 
 def cache_replace(
@@ -580,7 +564,7 @@ def cache_replace(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -591,10 +575,8 @@ def cache_replace(
         response_config=[
             ('success', Bool),
         ],
+        post_process=lambda value: value['success'],
     )
-    if result.status == 0:
-        result.value = result.value['success']
-    return result
 
 
 def cache_replace_if_equals(
@@ -638,7 +620,7 @@ def cache_replace_if_equals(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -650,10 +632,8 @@ def cache_replace_if_equals(
         response_config=[
             ('success', Bool),
         ],
+        post_process=lambda value: value['success'],
     )
-    if result.status == 0:
-        result.value = result.value['success']
-    return result
 
 
 def cache_clear(
@@ -800,7 +780,7 @@ def cache_remove_key(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -810,10 +790,8 @@ def cache_remove_key(
         response_config=[
             ('success', Bool),
         ],
+        post_process=lambda value: value['success'],
     )
-    if result.status == 0:
-        result.value = result.value['success']
-    return result
 
 
 def cache_remove_if_equals(
@@ -853,7 +831,7 @@ def cache_remove_if_equals(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -864,10 +842,8 @@ def cache_remove_if_equals(
         response_config=[
             ('success', Bool),
         ],
+        post_process=lambda value: value['success'],
     )
-    if result.status == 0:
-        result.value = result.value['success']
-    return result
 
 
 def cache_remove_keys(
@@ -979,7 +955,7 @@ def cache_get_size(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -989,7 +965,5 @@ def cache_get_size(
         response_config=[
             ('count', Long),
         ],
+        post_process=lambda value: value['count'],
     )
-    if result.status == 0:
-        result.value = result.value['count']
-    return result
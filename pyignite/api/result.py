@@ -36,3 +36,24 @@ class APIResult:
         self.query_id = response.query_id
         if hasattr(response, 'error_message'):
             self.message = String.to_python(response.error_message)
+
+    @classmethod
+    def from_values(
+        cls, status: int, query_id: int, message: str=None, value=None,
+    ) -> 'APIResult':
+        """
+        Creates the result object from already decoded response values.
+
+        :param status: request status code,
+        :param query_id: query ID, as returned by server,
+        :param message: (optional) error description,
+        :param value: (optional) return value,
+        :return: API result data object.
+        """
+        result = cls.__new__(cls)
+        result.status = status
+        result.query_id = query_id
+        if message is not None:
+            result.message = message
+        result.value = value
+        return result
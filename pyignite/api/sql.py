@@ -25,7 +25,7 @@ from pyignite.datatypes import (
     StructArray,
 )
 from pyignite.datatypes.sql import StatementType
-from pyignite.queries import Query, Response, SQLResponse
+from pyignite.queries import Query, SQLResponse
 from pyignite.queries.op_codes import *
 from pyignite.utils import cache_id
 from .result import APIResult
@@ -33,7 +33,8 @@ from .result import APIResult
 
 def scan(
     connection: 'Connection', cache: Union[str, int], page_size: int,
-    partitions: int=-1, local: bool=False, binary: bool=False, query_id=None,
+    partitions: int=-1, local: bool=False, binary: bool=False,
+    columnar: bool=False, query_id=None,
 ) -> APIResult:
     """
     Performs scan query.
@@ -47,6 +48,8 @@ def scan(
      on local node only. Defaults to False,
     :param binary: (optional) pass True to keep the value in binary form.
      False by default,
+    :param columnar: (optional) pass True to get the data as two columns,
+     keys and values, like in :py:func:`sql_fields`. False by default,
     :param query_id: (optional) a value generated by client and returned as-is
      in response.query_id. When the parameter is omitted, a random value
      is generated,
@@ -57,7 +60,8 @@ def scan(
      Value dict is of following format:
 
      * `cursor`: int, cursor ID,
-     * `data`: dict, result rows as key-value pairs,
+     * `data`: dict, result rows as key-value pairs (or a list of two
+       columns),
      * `more`: bool, True if more data is available for subsequent
        ‘scan_cursor_get_page’ calls.
     """
@@ -74,7 +78,7 @@ def scan(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -89,14 +93,17 @@ def scan(
             ('data', Map),
             ('more', Bool),
         ],
+        # the key-value pairs are decoded as two-field rows
+        response_struct=SQLResponse(
+            has_cursor=True, field_count=2, columnar=True,
+        ) if columnar else None,
+        post_process=None if columnar else dict,
     )
-    if result.status == 0:
-        result.value = dict(result.value)
-    return result
 
 
 def scan_cursor_get_page(
     connection: 'Connection', cursor: int, query_id=None,
+    columnar: bool=False,
 ) -> APIResult:
     """
     Fetches the next scan query cursor page by cursor ID that is obtained
@@ -107,13 +114,16 @@ def scan_cursor_get_page(
     :param query_id: (optional) a value generated by client and returned as-is
      in response.query_id. When the parameter is omitted, a random value
      is generated,
+    :param columnar: (optional) pass True to get the data as two columns,
+     like in :py:func:`scan`. False by default,
     :return: API result data object. Contains zero status and a value
      of type dict with results on success, non-zero status and an error
      description otherwise.
 
      Value dict is of following format:
 
-     * `data`: dict, result rows as key-value pairs,
+     * `data`: dict, result rows as key-value pairs (or a list of two
+       columns),
      * `more`: bool, True if more data is available for subsequent
        ‘scan_cursor_get_page’ calls.
     """
@@ -125,7 +135,7 @@ def scan_cursor_get_page(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'cursor': cursor,
@@ -134,10 +144,11 @@ def scan_cursor_get_page(
             ('data', Map),
             ('more', Bool),
         ],
+        response_struct=SQLResponse(
+            field_count=2, columnar=True,
+        ) if columnar else None,
+        post_process=None if columnar else dict,
     )
-    if result.status == 0:
-        result.value = dict(result.value)
-    return result
 
 
 def sql(
@@ -199,7 +210,7 @@ def sql(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'hash_code': cache_id(cache),
@@ -218,10 +229,8 @@ def sql(
             ('data', Map),
             ('more', Bool),
         ],
+        post_process=dict,
     )
-    if result.status == 0:
-        result.value = dict(result.value)
-    return result
 
 
 def sql_cursor_get_page(
@@ -253,7 +262,7 @@ def sql_cursor_get_page(
         ],
         query_id=query_id,
     )
-    result = query_struct.perform(
+    return query_struct.perform(
         connection,
         query_params={
             'cursor': cursor,
@@ -262,10 +271,8 @@ def sql_cursor_get_page(
             ('data', Map),
             ('more', Bool),
         ],
+        post_process=dict,
     )
-    if result.status == 0:
-        result.value = dict(result.value)
-    return result
 
 
 def sql_fields(
@@ -275,7 +282,7 @@ def sql_fields(
     local: bool=False, replicated_only: bool=False,
     enforce_join_order: bool=False, collocated: bool=False, lazy: bool=False,
     include_field_names: bool=False, max_rows: int=-1, timeout: int=0,
-    binary: bool=False, query_id=None
+    binary: bool=False, columnar: bool=False, query_id=None
 ) -> APIResult:
     """
     Performs SQL fields query.
@@ -311,6 +318,9 @@ def sql_fields(
      timeout (default),
     :param binary: (optional) pass True to keep the value in binary form.
      False by default,
+    :param columnar: (optional) pass True to get the data as a list
+     of columns instead of a list of rows. The numeric and boolean columns
+     are `array.array` objects. False by default,
     :param query_id: (optional) a value generated by client and returned as-is
      in response.query_id. When the parameter is omitted, a random value
      is generated,
@@ -321,7 +331,7 @@ def sql_fields(
      Value dict is of following format:
 
      * `cursor`: int, cursor ID,
-     * `data`: list, result values,
+     * `data`: list, result values (rows or columns),
      * `more`: bool, True if more data is available for subsequent
        ‘sql_fields_cursor_get_page’ calls.
     """
@@ -351,43 +361,37 @@ def sql_fields(
         query_id=query_id,
     )
 
-    _, send_buffer = query_struct.from_python({
-        'hash_code': cache_id(cache),
-        'flag': 1 if binary else 0,
-        'schema': schema,
-        'page_size': page_size,
-        'max_rows': max_rows,
-        'query_str': query_str,
-        'query_args': query_args,
-        'statement_type': statement_type,
-        'distributed_joins': distributed_joins,
-        'local': local,
-        'replicated_only': replicated_only,
-        'enforce_join_order': enforce_join_order,
-        'collocated': collocated,
-        'lazy': lazy,
-        'timeout': timeout,
-        'include_field_names': include_field_names,
-    })
-
-    connection.send(send_buffer)
-
-    response_struct = SQLResponse(
-        include_field_names=include_field_names,
-        has_cursor=True,
+    return query_struct.perform(
+        connection,
+        query_params={
+            'hash_code': cache_id(cache),
+            'flag': 1 if binary else 0,
+            'schema': schema,
+            'page_size': page_size,
+            'max_rows': max_rows,
+            'query_str': query_str,
+            'query_args': query_args,
+            'statement_type': statement_type,
+            'distributed_joins': distributed_joins,
+            'local': local,
+            'replicated_only': replicated_only,
+            'enforce_join_order': enforce_join_order,
+            'collocated': collocated,
+            'lazy': lazy,
+            'timeout': timeout,
+            'include_field_names': include_field_names,
+        },
+        response_struct=SQLResponse(
+            include_field_names=include_field_names,
+            has_cursor=True,
+            columnar=columnar,
+        ),
     )
-    response_class, recv_buffer = response_struct.parse(connection)
-    response = response_class.from_buffer_copy(recv_buffer)
-
-    result = APIResult(response)
-    if result.status != 0:
-        return result
-    result.value = response_struct.to_python(response)
-    return result
 
 
 def sql_fields_cursor_get_page(
     connection: 'Connection', cursor: int, field_count: int, query_id=None,
+    columnar: bool=False,
 ) -> APIResult:
     """
     Retrieves the next query result page by cursor ID from `sql_fields`.
@@ -398,13 +402,15 @@ def sql_fields_cursor_get_page(
     :param query_id: (optional) a value generated by client and returned as-is
      in response.query_id. When the parameter is omitted, a random value
      is generated,
+    :param columnar: (optional) pass True to get the data as a list
+     of columns, like in :py:func:`sql_fields`. False by default,
     :return: API result data object. Contains zero status and a value
      of type dict with results on success, non-zero status and an error
      description otherwise.
 
      Value dict is of following format:
 
-     * `data`: list, result values,
+     * `data`: list, result values (rows or columns),
      * `more`: bool, True if more data is available for subsequent
        ‘sql_fields_cursor_get_page’ calls.
     """
@@ -417,35 +423,43 @@ def sql_fields_cursor_get_page(
         query_id=query_id,
     )
 
-    _, send_buffer = query_struct.from_python({
-        'cursor': cursor,
-    })
-
-    connection.send(send_buffer)
-
-    response_struct = Response([
-        ('data', StructArray([
-            ('field_{}'.format(i), AnyDataObject) for i in range(field_count)
-        ])),
-        ('more', Bool),
-    ])
-    response_class, recv_buffer = response_struct.parse(connection)
-    response = response_class.from_buffer_copy(recv_buffer)
-
-    result = APIResult(response)
-    if result.status != 0:
-        return result
-    value = response_struct.to_python(response)
-    result.value = {
-        'data': [],
-        'more': value['more']
-    }
-    for row_dict in value['data']:
-        row = []
-        for field_key in sorted(row_dict.keys()):
-            row.append(row_dict[field_key])
-        result.value['data'].append(row)
-    return result
+    if columnar:
+        return query_struct.perform(
+            connection,
+            query_params={
+                'cursor': cursor,
+            },
+            response_struct=SQLResponse(
+                field_count=field_count, columnar=True,
+            ),
+        )
+
+    def process_page(value):
+        page = {
+            'data': [],
+            'more': value['more']
+        }
+        for row_dict in value['data']:
+            row = []
+            for field_key in sorted(row_dict.keys()):
+                row.append(row_dict[field_key])
+            page['data'].append(row)
+        return page
+
+    return query_struct.perform(
+        connection,
+        query_params={
+            'cursor': cursor,
+        },
+        response_config=[
+            ('data', StructArray([
+                ('field_{}'.format(i), AnyDataObject)
+                for i in range(field_count)
+            ])),
+            ('more', Bool),
+        ],
+        post_process=process_page,
+    )
 
 
 def resource_close(
@@ -0,0 +1,163 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module converts the columnar query result pages into Apache Arrow
+record batches. It requires `pyarrow` and is used by
+:py:meth:`~pyignite.client.Client.sql_to_arrow` and
+:py:meth:`~pyignite.cache.Cache.scan_to_arrow`::
+
+    for batch in client.sql_to_arrow('SELECT * FROM Person'):
+        table = pyarrow.Table.from_batches([batch])
+
+The Arrow types are mapped from Ignite type codes as follows:
+
+* numeric and boolean types − respective Arrow types,
+* `String` and `Char` − `string`,
+* `UUID` − `string`,
+* `Date` − `timestamp[ms]`,
+* `Timestamp` − `timestamp[us]` (the nanoseconds are truncated),
+* `Time` − `duration[ms]`,
+* `Decimal` − `decimal128`, as inferred by Arrow,
+* primitive, string, UUID and date arrays − lists of the above,
+* Complex objects − `binary`, the serialized objects.
+
+The values of other types are converted by Arrow, or to strings,
+if Arrow can not represent them.
+"""
+
+from array import array
+from datetime import timedelta
+
+import pyarrow
+
+from .binary import RawBinaryObject
+from .constants import *
+from .datatypes.type_codes import *
+from .utils import is_wrapped
+
+
+__all__ = ['ARROW_TYPES', 'arrow_array', 'record_batch']
+
+
+def _timestamp(value: tuple):
+    moment, fraction = value
+    return moment + timedelta(microseconds=fraction // 1000)
+
+
+def _binary_object(value):
+    if is_wrapped(value):
+        return RawBinaryObject.from_wrapped(value).data
+    if isinstance(value, RawBinaryObject):
+        return value.data
+    return value
+
+
+def _list_of(converter):
+    def convert(value):
+        return [None if x is None else converter(x) for x in value]
+    return convert
+
+
+# type code → (Arrow type, value converter)
+ARROW_TYPES = {
+    int.from_bytes(type_code, byteorder=PROTOCOL_BYTE_ORDER): types
+    for type_code, types in [
+        (TC_BYTE, (pyarrow.int8(), None)),
+        (TC_SHORT, (pyarrow.int16(), None)),
+        (TC_INT, (pyarrow.int32(), None)),
+        (TC_LONG, (pyarrow.int64(), None)),
+        (TC_FLOAT, (pyarrow.float32(), None)),
+        (TC_DOUBLE, (pyarrow.float64(), None)),
+        (TC_BOOL, (pyarrow.bool_(), None)),
+        (TC_CHAR, (pyarrow.string(), None)),
+        (TC_STRING, (pyarrow.string(), None)),
+        (TC_UUID, (pyarrow.string(), str)),
+        (TC_DATE, (pyarrow.timestamp('ms'), None)),
+        (TC_TIMESTAMP, (pyarrow.timestamp('us'), _timestamp)),
+        (TC_TIME, (pyarrow.duration('ms'), None)),
+        (TC_DECIMAL, (None, None)),
+        (TC_BYTE_ARRAY, (pyarrow.list_(pyarrow.int8()), list)),
+        (TC_SHORT_ARRAY, (pyarrow.list_(pyarrow.int16()), list)),
+        (TC_INT_ARRAY, (pyarrow.list_(pyarrow.int32()), list)),
+        (TC_LONG_ARRAY, (pyarrow.list_(pyarrow.int64()), list)),
+        (TC_FLOAT_ARRAY, (pyarrow.list_(pyarrow.float32()), list)),
+        (TC_DOUBLE_ARRAY, (pyarrow.list_(pyarrow.float64()), list)),
+        (TC_BOOL_ARRAY, (pyarrow.list_(pyarrow.bool_()), list)),
+        (TC_CHAR_ARRAY, (pyarrow.list_(pyarrow.string()), list)),
+        (TC_STRING_ARRAY, (pyarrow.list_(pyarrow.string()), None)),
+        (TC_UUID_ARRAY, (pyarrow.list_(pyarrow.string()), _list_of(str))),
+        (TC_DATE_ARRAY, (pyarrow.list_(pyarrow.timestamp('ms')), None)),
+        (
+            TC_TIMESTAMP_ARRAY,
+            (pyarrow.list_(pyarrow.timestamp('us')), _list_of(_timestamp)),
+        ),
+        (TC_TIME_ARRAY, (pyarrow.list_(pyarrow.duration('ms')), None)),
+        (TC_ARRAY_WRAPPED_OBJECTS, (pyarrow.binary(), _binary_object)),
+    ]
+}
+
+
+def arrow_array(column, type_code: int=None) -> pyarrow.Array:
+    """
+    Converts the column of the columnar query result page into Arrow array.
+
+    :param column: list or `array.array` object,
+    :param type_code: (optional) Ignite type code of the column values.
+     Arrow infers the type, if it is not given,
+    :return: `pyarrow.Array` object.
+    """
+    arrow_type, converter = ARROW_TYPES.get(type_code, (None, None))
+
+    if isinstance(column, array):
+        if column.typecode == 'B':
+            # Arrow packs booleans into bits
+            return pyarrow.array(
+                [bool(x) for x in column], type=pyarrow.bool_()
+            )
+        # numeric columns are shared with Arrow without copying
+        return pyarrow.Array.from_buffers(
+            arrow_type, len(column), [None, pyarrow.py_buffer(column)]
+        )
+
+    if converter is not None:
+        column = [None if x is None else converter(x) for x in column]
+    try:
+        return pyarrow.array(column, type=arrow_type)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, TypeError):
+        return pyarrow.array(
+            [None if x is None else str(x) for x in column],
+            type=pyarrow.string(),
+        )
+
+
+def record_batch(
+    names: list, columns: list, type_codes: list,
+) -> pyarrow.RecordBatch:
+    """
+    Converts the columnar query result page into Arrow record batch.
+
+    :param names: column names,
+    :param columns: list of columns (lists or `array.array` objects),
+    :param type_codes: list of the Ignite type codes of the columns,
+    :return: `pyarrow.RecordBatch` object.
+    """
+    return pyarrow.RecordBatch.from_arrays(
+        [
+            arrow_array(column, type_code)
+            for column, type_code in zip(columns, type_codes)
+        ],
+        names=names,
+    )
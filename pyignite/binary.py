@@ -26,13 +26,17 @@ You can get the examples of using Complex objects in the
 """
 
 from collections import OrderedDict
-from typing import Any
+from copy import deepcopy
+import ctypes
+import struct
+from typing import Any, Callable
 
 import attr
 
+from .constants import *
 from .datatypes import *
 from .exceptions import ParseError
-from .utils import entity_id, schema_id
+from .utils import c_struct, entity_id, hashcode, schema_id
 
 
 ALLOWED_FIELD_TYPES = [
@@ -48,11 +52,327 @@ ALLOWED_FIELD_TYPES = [
 ]
 
 
+FIXED_WIDTH_FIELD_TYPES = [
+    ByteObject, ShortObject, IntObject, LongObject, FloatObject,
+    DoubleObject, BoolObject,
+]
+
+
+class BinaryObjectCodec:
+    """
+    Specialized encoder/decoder for the Complex objects of one data class.
+
+    The schema of the class is compiled once: adjacent fixed-width fields
+    are packed and unpacked with one precomputed `struct.Struct`, field IDs
+    and relative offsets are calculated beforehand, and the footer of
+    the class, that has only fixed-width fields, is built only once.
+
+    Field values, that do not fit the precomputed format (e.g. None),
+    are serialized by their data types, just like without the codec,
+    so the resulting binary data is always the same.
+    """
+    header_struct = c_struct(
+        ctypes.c_byte, ctypes.c_byte, ctypes.c_short, ctypes.c_int,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    )
+    offset_formats = [
+        (BinaryObject.OFFSET_ONE_BYTE, 'B'),
+        (BinaryObject.OFFSET_TWO_BYTES, 'H'),
+        (0, 'I'),
+    ]
+
+    def __init__(self, data_class: 'GenericObjectMeta'):
+        """
+        Compile the data class schema.
+
+        :param data_class: data class with the schema.
+        """
+        self.type_code = int.from_bytes(
+            BinaryObject.type_code, byteorder=PROTOCOL_BYTE_ORDER
+        )
+        self.type_id = data_class.type_id
+        self.schema_id = data_class.schema_id
+        schema = data_class.schema
+        self.field_ids = [entity_id(field_name) for field_name in schema]
+
+        # each segment is either a run of fixed-width fields with
+        # a struct, or a single variable-width field without it
+        self.segments = []
+        run = []
+        for field_name, field_type in schema.items():
+            if field_type in FIXED_WIDTH_FIELD_TYPES:
+                run.append((field_name, field_type))
+                continue
+            if run:
+                self.segments.append(self._compile_run(run))
+                run = []
+            self.segments.append(self._compile_run([(field_name, field_type)]))
+        if run:
+            self.segments.append(self._compile_run(run))
+
+        self.fixed_width = all(
+            segment[2] is not None for segment in self.segments
+        )
+        self._footer_structs = {}
+        self._footers = {}
+
+    @staticmethod
+    def _compile_run(fields: list) -> tuple:
+        """
+        Prepares a segment of fields.
+
+        :param fields: list of (field name, field type) tuples,
+        :return: a tuple of field names, field types, defaults,
+         struct (or None for variable-width field), relative field
+         offsets and field type codes.
+        """
+        names = tuple(field_name for field_name, _ in fields)
+        field_types = tuple(field_type for _, field_type in fields)
+        defaults = tuple(
+            getattr(field_type, 'default', None) for field_type in field_types
+        )
+        if field_types[0] not in FIXED_WIDTH_FIELD_TYPES:
+            return names, field_types, defaults, None, None, None
+
+        fields_struct = c_struct(*[
+            c_type
+            for field_type in field_types
+            for c_type in (ctypes.c_byte, field_type.c_type)
+        ])
+        offsets = []
+        offset = 0
+        for field_type in field_types:
+            offsets.append(offset)
+            offset += 1 + ctypes.sizeof(field_type.c_type)
+        type_codes = tuple(
+            int.from_bytes(field_type.type_code, byteorder=PROTOCOL_BYTE_ORDER)
+            for field_type in field_types
+        )
+        return (
+            names, field_types, defaults, fields_struct, tuple(offsets),
+            type_codes,
+        )
+
+    def _build_footer(self, flags: int, offsets: list) -> bytes:
+        footer_struct = self._footer_structs.get(flags)
+        if footer_struct is None:
+            for offset_flag, offset_format in self.offset_formats:
+                if flags & offset_flag or not offset_flag:
+                    break
+            if flags & BinaryObject.COMPACT_FOOTER:
+                footer_format = offset_format * len(self.field_ids)
+            else:
+                footer_format = ('i' + offset_format) * len(self.field_ids)
+            footer_struct = struct.Struct('<' + footer_format)
+            self._footer_structs[flags] = footer_struct
+
+        if flags & BinaryObject.COMPACT_FOOTER:
+            return footer_struct.pack(*offsets)
+        return footer_struct.pack(*[
+            item
+            for field_id, offset in zip(self.field_ids, offsets)
+            for item in (field_id, offset)
+        ])
+
+    def encode(
+        self, value: object, client: 'Client', *args, **kwargs
+    ) -> bytes:
+        """
+        Serializes the data object. Does the same as
+        :py:meth:`~pyignite.datatypes.complex.BinaryObject.from_python`.
+
+        :param value: data object,
+        :param client: Ignite client,
+        :return: binary data.
+        """
+        header_size = self.header_struct.size
+        field_buffer = bytearray()
+        offsets = []
+        packed_all = True
+
+        for (
+            names, field_types, defaults, fields_struct, run_offsets,
+            type_codes,
+        ) in self.segments:
+            if fields_struct is not None:
+                values = []
+                for type_code, field_name, default in zip(
+                    type_codes, names, defaults
+                ):
+                    values.append(type_code)
+                    values.append(getattr(value, field_name, default))
+                try:
+                    data = fields_struct.pack(*values)
+                except (struct.error, OverflowError):
+                    packed_all = False
+                else:
+                    start = header_size + len(field_buffer)
+                    offsets.extend(start + offset for offset in run_offsets)
+                    field_buffer += data
+                    continue
+
+            for field_name, field_type, default in zip(
+                names, field_types, defaults
+            ):
+                offsets.append(header_size + len(field_buffer))
+                field_buffer += field_type.from_python(
+                    getattr(value, field_name, default),
+                    client, *args, **kwargs
+                )
+
+        # offsets are growing, so the last one is the largest
+        flags = BinaryObject.USER_TYPE | BinaryObject.HAS_SCHEMA
+        if client.compact_footer:
+            flags |= BinaryObject.COMPACT_FOOTER
+        max_offset = offsets[-1] if offsets else 0
+        if max_offset < 255:
+            flags |= BinaryObject.OFFSET_ONE_BYTE
+        elif max_offset < 65535:
+            flags |= BinaryObject.OFFSET_TWO_BYTES
+
+        # offsets of fixed-width fields never change
+        if self.fixed_width and packed_all:
+            footer = self._footers.get(flags)
+            if footer is None:
+                footer = self._build_footer(flags, offsets)
+                self._footers[flags] = footer
+        else:
+            footer = self._build_footer(flags, offsets)
+
+        schema_offset = header_size + len(field_buffer)
+        field_buffer += footer
+        return self.header_struct.pack(
+            self.type_code,
+            value.version,
+            flags,
+            self.type_id,
+            hashcode(field_buffer),
+            header_size + len(field_buffer),
+            self.schema_id,
+            schema_offset,
+        ) + field_buffer
+
+    def decode_fields(
+        self, result: object, buffer: memoryview, offset: int,
+        client: 'Client', *args, **kwargs
+    ) -> int:
+        """
+        Deserializes the fields of the Complex object into the data object.
+
+        :param result: data object to populate,
+        :param buffer: binary data,
+        :param offset: position of the first field in the buffer,
+        :param client: Ignite client,
+        :return: position of the footer.
+        """
+        for (
+            names, field_types, _, fields_struct, _, type_codes,
+        ) in self.segments:
+            if fields_struct is not None:
+                try:
+                    values = fields_struct.unpack_from(buffer, offset)
+                except struct.error:
+                    values = ()
+                # a run can be unpacked at once, unless it holds Nulls
+                if values[0::2] == type_codes:
+                    for field_name, field_value in zip(names, values[1::2]):
+                        setattr(result, field_name, field_value)
+                    offset += fields_struct.size
+                    continue
+
+            for field_name, field_type in zip(names, field_types):
+                field_value, offset = field_type.decode(
+                    buffer, offset, client, *args, **kwargs
+                )
+                setattr(result, field_name, field_value)
+        return offset
+
+
+class RawBinaryObject:
+    """
+    Opaque Complex object in binary form. Caches in binary mode (see
+    :py:meth:`~pyignite.cache.Cache.with_keep_binary`) return Complex objects
+    this way. The value can be put into any cache as is, without
+    serialization.
+
+    The binary type of the object must be known to the cluster, that
+    it is put into.
+    """
+    __slots__ = ('data', )
+
+    header_struct = c_struct(
+        ctypes.c_byte, ctypes.c_byte, ctypes.c_short, ctypes.c_int,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    )
+
+    def __init__(self, data: bytes):
+        """
+        :param data: serialized Complex object.
+        """
+        self.data = bytes(data)
+
+    @classmethod
+    def from_wrapped(cls, wrapped: tuple) -> 'RawBinaryObject':
+        """
+        Takes the root Complex object out of the wrapped binary data,
+        without decoding it.
+
+        :param wrapped: `WrappedDataObject` value,
+        :return: :class:`RawBinaryObject` object.
+        """
+        blob, offset = wrapped
+        length = cls.header_struct.unpack_from(blob, offset)[5]
+        return cls(blob[offset:offset + length])
+
+    def _header(self) -> tuple:
+        return self.header_struct.unpack_from(self.data)
+
+    @property
+    def type_id(self) -> int:
+        """ Binary object type ID. """
+        return self._header()[3]
+
+    @property
+    def schema_id(self) -> int:
+        """ Binary object schema ID. """
+        return self._header()[6]
+
+    @property
+    def hash_code(self) -> int:
+        """ Binary object hash code. """
+        return self._header()[4]
+
+    def deserialize(self, client: 'Client') -> object:
+        """
+        Decodes the Complex object.
+
+        :param client: Ignite client to look up the binary type with,
+        :return: data object.
+        """
+        return BinaryObject.decode(memoryview(self.data), 0, client)[0]
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.data == other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return '{}(type_id={}, schema_id={}, length={})'.format(
+            type(self).__name__, self.type_id, self.schema_id, len(self.data)
+        )
+
+
 class GenericObjectPropsMixin:
     """
     This class is mixed both to metaclass and to resulting class to make class
     properties universally available. You should not subclass it directly.
     """
+    # do not add `__dict__` to the data objects with `__slots__`
+    __slots__ = ()
+
     @property
     def type_name(self) -> str:
         """ Binary object type name. """
@@ -61,7 +381,7 @@ class GenericObjectPropsMixin:
     @property
     def type_id(self) -> int:
         """ Binary object type ID. """
-        return entity_id(self._type_name)
+        return self._type_id
 
     @property
     def schema(self) -> OrderedDict:
@@ -71,22 +391,83 @@ class GenericObjectPropsMixin:
     @property
     def schema_id(self) -> int:
         """ Binary object schema ID. """
-        return schema_id(self._schema)
+        return self._schema_id
 
-    def __new__(cls, *args, **kwargs) -> Any:
-        # allow all items in Binary Object schema to be populated as optional
-        # arguments to `__init__()` with sensible defaults.
-        if cls is not GenericObjectMeta:
-            attributes = {
-                k: attr.ib(
-                    type=getattr(v, 'pythonic', type(None)),
-                    default=getattr(v, 'default', None),
-                ) for k, v in cls.schema.items()
-            }
-            attributes.update({'version': attr.ib(type=int, default=1)})
-            cls = attr.s(cls, these=attributes)
-        # skip parameters
-        return super().__new__(cls)
+
+class LazyObjectMixin:
+    """
+    This class is mixed to the data classes with `lazy` option, as well as
+    to the data classes, that are created from the binary types, fetched
+    from the server. The data objects of such class, that are deserialized
+    lazily, keep the binary data and decode each field on the first access.
+    You should not subclass it directly.
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the attributes, that are not set yet. The threads,
+        # that access the same field at once, may both decode it, but they
+        # store the same value, so no lock is needed
+        try:
+            lazy_fields = object.__getattribute__(self, '_lazy_fields')
+        except AttributeError:
+            lazy_fields = None
+        field_offset = None
+        if lazy_fields is not None:
+            binary_data, field_offsets, client, args, kwargs = lazy_fields
+            field_offset = field_offsets.get(name)
+        if field_offset is None:
+            try:
+                # another thread may have decoded the field meanwhile
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                raise AttributeError(
+                    '{!r} object has no attribute {!r}'.format(
+                        type(self).__name__, name
+                    )
+                ) from None
+
+        value, _ = type(self)._schema[name].decode(
+            memoryview(binary_data), field_offset, client, *args, **kwargs
+        )
+        setattr(self, name, value)
+        field_offsets.pop(name, None)
+        if not field_offsets:
+            # all fields are decoded, release the binary data
+            self._lazy_fields = None
+        return value
+
+    def __copy__(self) -> Any:
+        return self._copy(lambda value: value)
+
+    def __deepcopy__(self, memo: dict) -> Any:
+        return self._copy(lambda value: deepcopy(value, memo))
+
+    def _copy(self, copy_value: Callable[[Any], Any]) -> Any:
+        # the copy shares the binary data and the client, but has its own
+        # offsets of the fields, that are not decoded yet
+        cls = type(self)
+        result = cls.__new__(cls)
+        names = set(cls._schema) | {'version'}
+        names.update(getattr(self, '__dict__', ()))
+        names.discard('_lazy_fields')
+        for name in names:
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                # the field is not decoded yet
+                continue
+            setattr(result, name, copy_value(value))
+        try:
+            lazy_fields = object.__getattribute__(self, '_lazy_fields')
+        except AttributeError:
+            lazy_fields = None
+        if lazy_fields is not None:
+            binary_data, field_offsets, client, args, kwargs = lazy_fields
+            result._lazy_fields = (
+                binary_data, dict(field_offsets), client, args, kwargs,
+            )
+        return result
 
 
 class GenericObjectMeta(type, GenericObjectPropsMixin):
@@ -96,16 +477,28 @@ class GenericObjectMeta(type, GenericObjectPropsMixin):
     :class:`~pyignite.datatypes.complex.BinaryObject` Ignite data type.
     """
     _schema = None
+    _schema_id = None
     _type_name = None
+    _type_id = None
+    _codec = None
+    _lazy = False
     version = None
 
     def __new__(
-        mcs: Any, name: str, base_classes: tuple, namespace: dict, **kwargs
+        mcs: Any, name: str, base_classes: tuple, namespace: dict,
+        schema: OrderedDict=None, slots: bool=False, lazy: bool=False,
+        **kwargs
     ) -> Any:
         """ Sort out class creation arguments. """
-        return super().__new__(
-            mcs, name, (GenericObjectPropsMixin, )+base_classes, namespace
-        )
+        mixins = (GenericObjectPropsMixin, )
+        if lazy:
+            mixins += (LazyObjectMixin, )
+        if slots:
+            namespace = dict(namespace)
+            namespace['__slots__'] = tuple(schema or ()) + ('version', )
+            if lazy:
+                namespace['__slots__'] += ('_lazy_fields', )
+        return super().__new__(mcs, name, mixins+base_classes, namespace)
 
     @staticmethod
     def _validate_schema(schema: dict):
@@ -117,7 +510,9 @@ class GenericObjectMeta(type, GenericObjectPropsMixin):
 
     def __init__(
         cls, name: str, base_classes: tuple, namespace: dict,
-        type_name: str=None, schema: OrderedDict=None, **kwargs
+        type_name: str=None, schema: OrderedDict=None,
+        slots: bool=False, lazy: bool=False, compiled: bool=False,
+        **kwargs
     ):
         """
         Initializes binary object class.
@@ -125,6 +520,16 @@ class GenericObjectMeta(type, GenericObjectPropsMixin):
         :param type_name: (optional) binary object name. Defaults to class
          name,
         :param schema: (optional) a dict of field names: field types,
+        :param slots: (optional) store the field values in `__slots__`
+         instead of `__dict__`, to save memory on large amounts of objects.
+         Field names must be valid Python identifiers. Default is False,
+        :param lazy: (optional) deserialized objects keep the binary data
+         and decode each field only when it is accessed for the first time.
+         Saves time and memory on wide objects, when only some
+         of their fields are used. The asyncio client decodes such
+         objects at once. Default is False,
+        :param compiled: (optional) compile the schema into a specialized
+         encoder/decoder (see :py:meth:`compile`). Default is False,
         :raise: ParseError if one or more binary field types
          did not recognized.
         """
@@ -133,4 +538,35 @@ class GenericObjectMeta(type, GenericObjectPropsMixin):
         schema = schema or OrderedDict()
         cls._validate_schema(schema)
         cls._schema = schema
+        # IDs are calculated once per class
+        cls._schema_id = schema_id(schema)
+        cls._lazy = lazy
+        # do not inherit the codec of the base class with another schema
+        cls._codec = None
         super().__init__(name, base_classes, namespace)
+
+        # allow all items in Binary Object schema to be populated as optional
+        # arguments to `__init__()` with sensible defaults. The class is
+        # finalized once, not on every instantiation
+        attributes = {
+            k: attr.ib(
+                type=getattr(v, 'pythonic', type(None)),
+                default=getattr(v, 'default', None),
+            ) for k, v in schema.items()
+        }
+        attributes.update({'version': attr.ib(type=int, default=1)})
+        attr.s(cls, these=attributes)
+        if compiled:
+            cls.compile()
+
+    def compile(cls) -> BinaryObjectCodec:
+        """
+        Compiles the class schema into a specialized encoder/decoder,
+        that is then used to serialize and deserialize the objects
+        of this class. The codec is built once and cached on the class.
+
+        :return: :class:`BinaryObjectCodec` object.
+        """
+        if cls._codec is None:
+            cls._codec = BinaryObjectCodec(cls)
+        return cls._codec
@@ -13,13 +13,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import copy
+from functools import partial
+from queue import Empty, Queue
+from threading import Event, Thread
 from typing import Any, Iterable, Optional, Union
 
+from .binary import RawBinaryObject
 from .datatypes import prop_codes
+from .datatypes.internal import infer_from_python
 from .exceptions import (
     CacheCreationError, CacheError, ParameterError, SQLError,
 )
-from .utils import cache_id, is_wrapped, status_to_exception, unwrap_binary
+from .coalescing import RequestCoalescer
+from .near_cache import NearCache
+from .prefetch import (
+    CursorPages, close_cursor, cursor_checkin, cursor_checkout,
+)
+from .streamer import DataStreamer
+from .utils import (
+    cache_id, is_hinted, is_wrapped, status_to_exception, unwrap_binary,
+)
+from .api.result import APIResult
 from .api.cache_config import (
     cache_create, cache_create_with_config,
     cache_get_or_create, cache_get_or_create_with_config,
@@ -35,6 +50,7 @@ from .api.key_value import (
     cache_remove_if_equals, cache_replace_if_equals, cache_get_size,
 )
 from .api.sql import scan, scan_cursor_get_page, sql, sql_cursor_get_page
+from .queries.pipeline import Pipeline
 
 
 PROP_CODES = set([
@@ -67,6 +83,9 @@ class Cache:
     _name = None
     _client = None
     _settings = None
+    _binary = False
+    _near_cache = None
+    _coalescer = None
 
     @staticmethod
     def _validate_settings(
@@ -90,7 +109,7 @@ class Cache:
 
     def __init__(
         self, client: 'Client', settings: Union[str, dict]=None,
-        with_get: bool=False, get_only: bool=False,
+        with_get: bool=False, get_only: bool=False, binary: bool=False,
     ):
         """
         Initialize cache object.
@@ -102,9 +121,13 @@ class Cache:
         :param with_get: (optional) do not raise exception, if the cache
          is already exists. Defaults to False,
         :param get_only: (optional) do not communicate with Ignite server
-         at all, only create Cache instance. Defaults to False.
+         at all, only create Cache instance. Defaults to False,
+        :param binary: (optional) keep the Complex objects in binary form
+         (see :py:meth:`~pyignite.cache.Cache.with_keep_binary`). Defaults
+         to False.
         """
         self._client = client
+        self._binary = binary
         self._validate_settings(settings)
         if type(settings) == str:
             self._name = settings
@@ -168,6 +191,158 @@ class Cache:
         """
         return self._cache_id
 
+    @property
+    def binary(self) -> bool:
+        """
+        Binary mode flag.
+
+        :return: True if the Complex objects are kept in binary form.
+        """
+        return self._binary
+
+    @property
+    def near_cache(self) -> Optional[NearCache]:
+        """
+        Near cache of this cache object, if it is enabled (see
+        :py:meth:`~pyignite.cache.Cache.with_near_cache`). Holds the hit,
+        miss and eviction counters.
+
+        :return: :class:`~pyignite.near_cache.NearCache` object or None.
+        """
+        return self._near_cache
+
+    def with_keep_binary(self) -> 'Cache':
+        """
+        Returns the same cache in binary mode. Complex objects, retrieved
+        from it, are not deserialized, but returned as opaque
+        :class:`~pyignite.binary.RawBinaryObject` values. They can be put
+        to this or any other cache as is, which saves a decode/encode cycle
+        when the data is only copied around.
+
+        The near cache is not inherited, since it holds the decoded values.
+
+        :return: :class:`~pyignite.cache.Cache` object.
+        """
+        cache = copy(self)
+        cache._binary = True
+        cache._near_cache = None
+        if self._coalescer is not None:
+            cache._coalescer = RequestCoalescer(
+                cache, self._coalescer.window, self._coalescer.max_batch,
+            )
+        return cache
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """
+        Request coalescer of this cache object, if it is enabled (see
+        :py:meth:`~pyignite.cache.Cache.with_coalescing`). Holds the call
+        and request counters.
+
+        :return: :class:`~pyignite.coalescing.RequestCoalescer` object
+         or None.
+        """
+        return self._coalescer
+
+    def with_coalescing(
+        self, window: float=0.0002, max_batch: int=256,
+    ) -> 'Cache':
+        """
+        Returns the same cache, that merges the concurrent `get` and
+        `contains_key` calls of different threads into `get_all` and
+        `contains_keys` requests, and sends one request per key, that
+        is requested by several threads at once. Each call waits for
+        at most `window` seconds for the others to join. Use it with
+        :class:`~pyignite.pool.ClientPool` to raise the throughput under
+        the fan-in load. See :py:mod:`pyignite.coalescing`.
+
+        :param window: (optional) time (in seconds) to wait for other calls
+         to join the batch. Defaults to 200 µs,
+        :param max_batch: (optional) maximum number of keys in one request.
+         Defaults to 256,
+        :return: :class:`~pyignite.cache.Cache` object.
+        """
+        cache = copy(self)
+        cache._coalescer = RequestCoalescer(cache, window, max_batch)
+        return cache
+
+    def with_near_cache(
+        self, max_size: int=1024, ttl: float=None,
+    ) -> 'Cache':
+        """
+        Returns the same cache with the near cache: `get` and `get_all`
+        keep the values, they have read, in the bounded in-process map,
+        and serve the following reads of the same keys from it.
+
+        The near cache is shared by all the cache objects of the same
+        client and cache (and binary mode), so the parameters are only
+        applied when it is created. The writes, done through this client,
+        invalidate the respective entries. The writes of other clients
+        are not tracked, so use `ttl` to limit the staleness. Mutable values
+        (lists, dicts, Complex objects) are copied on each read, so that
+        changing a value, that has been read, does not change the cached
+        one.
+
+        :param max_size: (optional) maximum number of entries. The least
+         recently used entries are evicted first. Defaults to 1024,
+        :param ttl: (optional) entry time to live, in seconds. Default is
+         None (no expiration),
+        :return: :class:`~pyignite.cache.Cache` object.
+        """
+        near_caches = self._client._near_caches.setdefault(
+            self._cache_id, {}
+        )
+        near_cache = near_caches.get(self._binary)
+        if near_cache is None:
+            near_cache = near_caches.setdefault(
+                self._binary, NearCache(max_size, ttl)
+            )
+        cache = copy(self)
+        cache._near_cache = near_cache
+        return cache
+
+    def _near_cache_key(self, key, key_hint: object=None) -> bytes:
+        """
+        Serializes the key, the way it is sent to the server.
+
+        :param key: key or (key, key_hint) tuple,
+        :param key_hint: (optional) Ignite data type of the key,
+        :return: bytes.
+        """
+        if key_hint is not None:
+            key = key, key_hint
+        return bytes(infer_from_python(key, self._client))
+
+    def _invalidate(self, keys: Iterable=None):
+        """
+        Drops the entries from the near caches of this cache, if any.
+
+        :param keys: (optional) keys or (key, key_hint) tuples. Defaults
+         to all entries.
+        """
+        if keys is not None and self._client._near_caches.get(
+            self._cache_id
+        ):
+            keys = [self._near_cache_key(key) for key in keys]
+        self._invalidate_serialized(keys)
+
+    def _invalidate_serialized(self, keys: Iterable[bytes]=None):
+        """
+        Counts the write and drops the entries from the near caches of this
+        cache, if any.
+
+        :param keys: (optional) serialized keys. Defaults to all entries.
+        """
+        # let the request coalescers tell the reads, that have started
+        # before the write
+        self._client._count_write(self._cache_id)
+
+        near_caches = self._client._near_caches.get(self._cache_id)
+        if not near_caches:
+            return
+        for near_cache in list(near_caches.values()):
+            near_cache.invalidate(keys)
+
     def _process_binary(self, value: Any) -> Any:
         """
         Detects and recursively unwraps Binary Object.
@@ -177,15 +352,35 @@ class Cache:
          left intact.
         """
         if is_wrapped(value):
+            if self._binary:
+                return RawBinaryObject.from_wrapped(value)
             return unwrap_binary(self._client, value)
         return value
 
+    def pipeline(self) -> 'CachePipeline':
+        """
+        Creates a pipeline, that queues `get`, `put` and `contains_key`
+        operations and sends them to the server in one batch on exit
+        from the context::
+
+            with my_cache.pipeline() as pipe:
+                pipe.put('a', 1)
+                pipe.get('a')
+                pipe.contains_key('b')
+            print(pipe.results)  # [None, 1, False]
+
+        :return: :class:`~pyignite.cache.CachePipeline` object.
+        """
+        return CachePipeline(self)
+
     @status_to_exception(CacheError)
     def destroy(self):
         """
         Destroys cache with a given name.
         """
-        return cache_destroy(self._client, self._cache_id)
+        result = cache_destroy(self._client, self._cache_id)
+        self._invalidate()
+        return result
 
     @status_to_exception(CacheError)
     def get(self, key, key_hint: object=None) -> Any:
@@ -197,8 +392,25 @@ class Cache:
          should be converted,
         :return: value retrieved.
         """
-        result = cache_get(self._client, self._cache_id, key, key_hint=key_hint)
-        result.value = self._process_binary(result.value)
+        near_cache = self._near_cache
+        if near_cache is not None:
+            near_key = self._near_cache_key(key, key_hint)
+            hit, value = near_cache.lookup(near_key)
+            if hit:
+                return APIResult.from_values(0, None, value=value)
+            generation = near_cache.generation
+
+        result = None
+        if self._coalescer is not None:
+            result = self._coalescer.get(key, key_hint)
+        if result is None:
+            result = cache_get(
+                self._client, self._cache_id, key, key_hint=key_hint,
+                binary=self._binary,
+            )
+            result.value = self._process_binary(result.value)
+        if near_cache is not None and result.status == 0:
+            near_cache.store(near_key, result.value, generation)
         return result
 
     @status_to_exception(CacheError)
@@ -214,10 +426,12 @@ class Cache:
         :param value_hint: (optional) Ignite data type, for which the given
          value should be converted.
         """
-        return cache_put(
+        result = cache_put(
             self._client, self._cache_id, key, value,
             key_hint=key_hint, value_hint=value_hint
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
+        return result
 
     @status_to_exception(CacheError)
     def get_all(self, keys: list) -> list:
@@ -227,10 +441,52 @@ class Cache:
         :param keys: list of keys or tuples of (key, key_hint),
         :return: a dict of key-value pairs.
         """
-        result = cache_get_all(self._client, self._cache_id, keys)
-        if result.value:
-            for key, value in result.value.items():
-                result.value[key] = self._process_binary(value)
+        near_cache = self._near_cache
+        if near_cache is None:
+            result = cache_get_all(
+                self._client, self._cache_id, keys, binary=self._binary,
+            )
+            if result.value:
+                for key, value in result.value.items():
+                    result.value[key] = self._process_binary(value)
+            return result
+
+        # serve the cached keys and request only the missing ones
+        values = {}
+        missing_keys = []
+        near_keys = {}
+        for key in keys:
+            near_key = self._near_cache_key(key)
+            plain_key = key[0] if is_hinted(key) else key
+            hit, value = near_cache.lookup(near_key)
+            if not hit:
+                missing_keys.append(key)
+                try:
+                    near_keys[plain_key] = near_key
+                except TypeError:
+                    # unhashable keys are not cached
+                    pass
+            elif value is not None:
+                values[plain_key] = value
+        if not missing_keys:
+            return APIResult.from_values(0, None, value=values)
+
+        generation = near_cache.generation
+        result = cache_get_all(
+            self._client, self._cache_id, missing_keys, binary=self._binary,
+        )
+        if result.status != 0:
+            return result
+        for key, value in (result.value or {}).items():
+            value = self._process_binary(value)
+            values[key] = value
+            near_key = near_keys.pop(key, None)
+            if near_key is not None:
+                near_cache.store(near_key, value, generation)
+        # the keys, that are not in the cache
+        for near_key in near_keys.values():
+            near_cache.store(near_key, None, generation)
+        result.value = values
         return result
 
     @status_to_exception(CacheError)
@@ -243,7 +499,31 @@ class Cache:
          to save. Each key or value can be an item of representable
          Python type or a tuple of (item, hint),
         """
-        return cache_put_all(self._client, self._cache_id, pairs)
+        result = cache_put_all(self._client, self._cache_id, pairs)
+        self._invalidate(pairs)
+        return result
+
+    def streamer(
+        self, batch_size: int=1024, batch_bytes: int=4 << 20,
+        max_in_flight: int=None,
+    ) -> DataStreamer:
+        """
+        Returns the data streamer, that loads the added entries into this
+        cache in `put_all` batches. With
+        :class:`~pyignite.pool.ClientPool`, several batches are sent
+        at once. Use it as a context manager to load the remaining entries
+        on exit. See :py:mod:`pyignite.streamer`.
+
+        :param batch_size: (optional) maximum number of entries in a batch.
+         Defaults to 1024,
+        :param batch_bytes: (optional) maximum size of a batch in bytes.
+         Defaults to 4 MiB,
+        :param max_in_flight: (optional) maximum number of batches, that are
+         sent at once. Defaults to the pool size, or to 1 for other
+         clients,
+        :return: :class:`~pyignite.streamer.DataStreamer` object.
+        """
+        return DataStreamer(self, batch_size, batch_bytes, max_in_flight)
 
     @status_to_exception(CacheError)
     def replace(
@@ -261,8 +541,9 @@ class Cache:
         """
         result = cache_replace(
             self._client, self._cache_id, key, value,
-            key_hint=key_hint, value_hint=value_hint
+            key_hint=key_hint, value_hint=value_hint, binary=self._binary,
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
         result.value = self._process_binary(result.value)
         return result
 
@@ -275,9 +556,12 @@ class Cache:
          hint) tuples to clear (default: clear all).
         """
         if keys:
-            return cache_clear_keys(self._client, self._cache_id, keys)
+            result = cache_clear_keys(self._client, self._cache_id, keys)
+            self._invalidate(keys)
         else:
-            return cache_clear(self._client, self._cache_id)
+            result = cache_clear(self._client, self._cache_id)
+            self._invalidate()
+        return result
 
     @status_to_exception(CacheError)
     def clear_key(self, key, key_hint: object=None):
@@ -288,9 +572,11 @@ class Cache:
         :param key_hint: (optional) Ignite data type, for which the given key
          should be converted,
         """
-        return cache_clear_key(
+        result = cache_clear_key(
             self._client, self._cache_id, key, key_hint=key_hint
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
+        return result
 
     @status_to_exception(CacheError)
     def contains_key(self, key, key_hint=None) -> bool:
@@ -302,6 +588,10 @@ class Cache:
          should be converted,
         :return: boolean `True` when key is present, `False` otherwise.
         """
+        if self._coalescer is not None:
+            result = self._coalescer.contains_key(key, key_hint)
+            if result is not None:
+                return result
         return cache_contains_key(
             self._client, self._cache_id, key, key_hint=key_hint
         )
@@ -331,8 +621,10 @@ class Cache:
         :return: old value or None.
         """
         result = cache_get_and_put(
-            self._client, self._cache_id, key, value, key_hint, value_hint
+            self._client, self._cache_id, key, value, key_hint, value_hint,
+            binary=self._binary,
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
         result.value = self._process_binary(result.value)
         return result
 
@@ -353,8 +645,10 @@ class Cache:
         :return: old value or None.
         """
         result = cache_get_and_put_if_absent(
-            self._client, self._cache_id, key, value, key_hint, value_hint
+            self._client, self._cache_id, key, value, key_hint, value_hint,
+            binary=self._binary,
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
         result.value = self._process_binary(result.value)
         return result
 
@@ -371,9 +665,11 @@ class Cache:
         :param value_hint: (optional) Ignite data type, for which the given
          value should be converted.
         """
-        return cache_put_if_absent(
+        result = cache_put_if_absent(
             self._client, self._cache_id, key, value, key_hint, value_hint
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
+        return result
 
     @status_to_exception(CacheError)
     def get_and_remove(self, key, key_hint=None) -> Any:
@@ -386,8 +682,9 @@ class Cache:
         :return: old value or None.
         """
         result = cache_get_and_remove(
-            self._client, self._cache_id, key, key_hint
+            self._client, self._cache_id, key, key_hint, binary=self._binary,
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
         result.value = self._process_binary(result.value)
         return result
 
@@ -409,8 +706,10 @@ class Cache:
         :return: old value or None.
         """
         result = cache_get_and_replace(
-            self._client, self._cache_id, key, value, key_hint, value_hint
+            self._client, self._cache_id, key, value, key_hint, value_hint,
+            binary=self._binary,
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
         result.value = self._process_binary(result.value)
         return result
 
@@ -423,7 +722,11 @@ class Cache:
         :param key_hint: (optional) Ignite data type, for which the given key
          should be converted,
         """
-        return cache_remove_key(self._client, self._cache_id, key, key_hint)
+        result = cache_remove_key(
+            self._client, self._cache_id, key, key_hint
+        )
+        self._invalidate([(key, key_hint) if key_hint else key])
+        return result
 
     @status_to_exception(CacheError)
     def remove_keys(self, keys: list):
@@ -433,14 +736,18 @@ class Cache:
 
         :param keys: list of keys or tuples of (key, key_hint) to remove.
         """
-        return cache_remove_keys(self._client, self._cache_id, keys)
+        result = cache_remove_keys(self._client, self._cache_id, keys)
+        self._invalidate(keys)
+        return result
 
     @status_to_exception(CacheError)
     def remove_all(self):
         """
         Removes all cache entries, notifying listeners and cache writers.
         """
-        return cache_remove_all(self._client, self._cache_id)
+        result = cache_remove_all(self._client, self._cache_id)
+        self._invalidate()
+        return result
 
     @status_to_exception(CacheError)
     def remove_if_equals(self, key, sample, key_hint=None, sample_hint=None):
@@ -455,9 +762,11 @@ class Cache:
         :param sample_hint: (optional) Ignite data type, for whic
          the given sample should be converted.
         """
-        return cache_remove_if_equals(
+        result = cache_remove_if_equals(
             self._client, self._cache_id, key, sample, key_hint, sample_hint
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
+        return result
 
     @status_to_exception(CacheError)
     def replace_if_equals(
@@ -481,8 +790,9 @@ class Cache:
         """
         result = cache_replace_if_equals(
             self._client, self._cache_id, key, sample, value,
-            key_hint, sample_hint, value_hint
+            key_hint, sample_hint, value_hint, binary=self._binary,
         )
+        self._invalidate([(key, key_hint) if key_hint else key])
         result.value = self._process_binary(result.value)
         return result
 
@@ -498,7 +808,10 @@ class Cache:
         """
         return cache_get_size(self._client, self._cache_id, peek_modes)
 
-    def scan(self, page_size: int=1, partitions: int=-1, local: bool=False):
+    def scan(
+        self, page_size: int=1, partitions: int=-1, local: bool=False,
+        prefetch: int=0,
+    ):
         """
         Returns all key-value pairs from the cache, similar to `get_all`, but
         with internal pagination, which is slower, but safer.
@@ -509,32 +822,266 @@ class Cache:
          (negative to query entire cache),
         :param local: (optional) pass True if this query should be executed
          on local node only. Defaults to False,
+        :param prefetch: (optional) number of pages to read ahead, while
+         the current page is being processed. Defaults to 0 (no read-ahead).
+         See :py:mod:`pyignite.prefetch`,
         :return: generator with key-value pairs.
         """
-        result = scan(self._client, self._cache_id, page_size, partitions, local)
-        if result.status != 0:
-            raise CacheError(result.message)
-
-        cursor = result.value['cursor']
-        for k, v in result.value['data'].items():
-            k = self._process_binary(k)
-            v = self._process_binary(v)
-            yield k, v
-
-        while result.value['more']:
-            result = scan_cursor_get_page(self._client, cursor)
+        # cursor pages must be read from the node, that has opened it
+        conn = cursor_checkout(self._client, prefetch)
+        pages = None
+        try:
+            result = scan(
+                conn, self._cache_id, page_size, partitions, local,
+                binary=self._binary,
+            )
             if result.status != 0:
                 raise CacheError(result.message)
 
+            pages = CursorPages(
+                conn, result.value['cursor'], scan_cursor_get_page,
+                result.value['more'], prefetch,
+                partial(cursor_checkin, self._client, conn),
+            )
+            pages.start()
             for k, v in result.value['data'].items():
                 k = self._process_binary(k)
                 v = self._process_binary(v)
                 yield k, v
 
+            for result in pages:
+                if result.status != 0:
+                    raise CacheError(result.message)
+
+                for k, v in result.value['data'].items():
+                    k = self._process_binary(k)
+                    v = self._process_binary(v)
+                    yield k, v
+        finally:
+            if pages is not None:
+                pages.close()
+            else:
+                cursor_checkin(self._client, conn)
+
+    def parallel_scan(
+        self, workers: int=None, page_size: int=1024,
+        partition_count: int=1024, local: bool=False,
+    ):
+        """
+        Returns all key-value pairs from the cache, like
+        :py:meth:`~pyignite.cache.Cache.scan`, but reads the partitions
+        in parallel, each over its own connection of
+        :class:`~pyignite.pool.ClientPool`. Each worker opens a scan
+        cursor for the next partition, that is not read yet, and hands its
+        entries over to the generator, so the pairs come grouped
+        by partition, in no particular order of the partitions.
+
+        Each worker reads a whole partition before returning
+        the connection to the pool, so the memory use is about
+        `2 × workers` partitions, and the pool stays usable while
+        the pairs are being processed.
+
+        A plain :class:`~pyignite.client.Client` has only one connection,
+        so nothing is read in parallel: the partitions are scanned one
+        after another, with one `scan` cursor per partition, which is
+        slower than a single :py:meth:`~pyignite.cache.Cache.scan`.
+        It is only supported, so that the same code runs with both kinds
+        of clients.
+
+        The parameters are checked, when the method is called, and
+        the partitions are read, when the pairs are iterated over.
+
+        :param workers: (optional) number of partitions, that are read
+         at once. Defaults to the pool size, or to 1 for other clients,
+         that do not support more,
+        :param page_size: (optional) page size. Defaults to 1024,
+        :param partition_count: (optional) number of partitions
+         of the cache. Must match the cache affinity function. Defaults
+         to 1024 (the default of the rendezvous affinity function),
+        :param local: (optional) pass True if this query should be executed
+         on local node only. Defaults to False,
+        :return: generator with key-value pairs.
+        """
+        pooled = hasattr(self._client, 'pool_size')
+        if workers is None:
+            workers = self._client.pool_size if pooled else 1
+        if workers < 1 or partition_count < 1:
+            raise ParameterError(
+                'The numbers of workers and partitions must be positive.'
+            )
+        if workers > 1 and not pooled:
+            raise ParameterError(
+                'Only a connection pool can read several partitions at once.'
+            )
+        return self._parallel_scan(
+            pooled, workers, page_size, partition_count, local
+        )
+
+    def _parallel_scan(
+        self, pooled: bool, workers: int, page_size: int,
+        partition_count: int, local: bool,
+    ):
+        """
+        `parallel_scan` generator.
+        """
+        if not pooled:
+            for partition in range(partition_count):
+                yield from self.scan(page_size, partition, local)
+            return
+
+        partitions = Queue()
+        for partition in range(partition_count):
+            partitions.put(partition)
+        # lists of pairs, exceptions, or None, when the worker is done
+        pages = Queue(workers)
+        stop = Event()
+        threads = [
+            Thread(
+                target=self._scan_partitions,
+                args=(partitions, pages, stop, page_size, local),
+                daemon=True,
+            )
+            for _ in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        running = workers
+        try:
+            while running:
+                page = pages.get()
+                if page is None:
+                    running -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                for k, v in page:
+                    yield self._process_binary(k), self._process_binary(v)
+        finally:
+            stop.set()
+            for thread in threads:
+                while thread.is_alive():
+                    # unblock the worker, that waits for the room to put
+                    # a partition
+                    try:
+                        while True:
+                            pages.get_nowait()
+                    except Empty:
+                        pass
+                    thread.join(0.01)
+
+    def _scan_partitions(
+        self, partitions: Queue, pages: Queue, stop: Event, page_size: int,
+        local: bool,
+    ):
+        """
+        `parallel_scan` worker. Reads the partitions from the queue
+        until it is empty or the scan is stopped.
+        """
+        try:
+            while not stop.is_set():
+                try:
+                    partition = partitions.get_nowait()
+                except Empty:
+                    break
+
+                pairs = []
+                conn = self._client.checkout()
+                more = False
+                try:
+                    result = scan(
+                        conn, self._cache_id, page_size, partition, local,
+                        binary=self._binary,
+                    )
+                    if result.status != 0:
+                        raise CacheError(result.message)
+                    cursor = result.value['cursor']
+                    more = result.value['more']
+                    pairs.extend(result.value['data'].items())
+                    while more and not stop.is_set():
+                        result = scan_cursor_get_page(conn, cursor)
+                        if result.status != 0:
+                            raise CacheError(result.message)
+                        more = result.value['more']
+                        pairs.extend(result.value['data'].items())
+                finally:
+                    # the cursor is left open by an error or by the stop
+                    # of the scan
+                    if more:
+                        close_cursor(conn, cursor)
+                    self._client.checkin(conn)
+                if more:
+                    return
+                if pairs:
+                    pages.put(pairs)
+        except Exception as e:
+            pages.put(e)
+        finally:
+            pages.put(None)
+
+    def scan_to_arrow(
+        self, page_size: int=1024, partitions: int=-1, local: bool=False,
+    ):
+        """
+        Returns all key-value pairs from the cache as a stream of Apache
+        Arrow record batches with `key` and `value` columns, one batch
+        per cursor page. Requires pyarrow.
+
+        See :py:mod:`pyignite.arrow` for the mapping of the column types.
+        Complex objects are kept in the serialized form.
+
+        :param page_size: (optional) page size. Defaults to 1024,
+        :param partitions: (optional) number of partitions to query
+         (negative to query entire cache),
+        :param local: (optional) pass True if this query should be executed
+         on local node only. Defaults to False,
+        :return: generator of `pyarrow.RecordBatch` objects.
+        """
+        from .arrow import record_batch
+
+        names = ['key', 'value']
+        # cursor pages must be read from the node, that has opened it
+        conn = self._client.checkout()
+        more = False
+        try:
+            result = scan(
+                conn, self._cache_id, page_size, partitions, local,
+                binary=self._binary, columnar=True,
+            )
+            if result.status != 0:
+                raise CacheError(result.message)
+
+            cursor = result.value['cursor']
+            more = result.value['more']
+            type_codes = result.value['type_codes']
+            yield record_batch(names, result.value['data'], type_codes)
+
+            while more:
+                result = scan_cursor_get_page(conn, cursor, columnar=True)
+                if result.status != 0:
+                    raise CacheError(result.message)
+                more = result.value['more']
+
+                type_codes = [
+                    type_code if type_code is not None else known
+                    for type_code, known in zip(
+                        result.value['type_codes'], type_codes
+                    )
+                ]
+                yield record_batch(names, result.value['data'], type_codes)
+        finally:
+            # the cursor is left open on error or early exit; the generator
+            # may be closed by the garbage collector in the middle of
+            # another query, so it is closed later
+            if more:
+                conn.defer_cursor_close(cursor)
+            self._client.checkin(conn)
+
     def select_row(
         self, query_str: str, page_size: int=1,
         query_args: Optional[list]=None, distributed_joins: bool=False,
-        replicated_only: bool=False, local: bool=False, timeout: int=0
+        replicated_only: bool=False, local: bool=False, timeout: int=0,
+        prefetch: int=0,
     ):
         """
         Executes a simplified SQL SELECT query over data stored in the cache.
@@ -552,44 +1099,161 @@ class Cache:
          on local node only. Defaults to False,
         :param timeout: (optional) non-negative timeout value in ms. Zero
          disables timeout (default),
+        :param prefetch: (optional) number of pages to read ahead, while
+         the current page is being processed. Defaults to 0 (no read-ahead).
+         See :py:mod:`pyignite.prefetch`,
         :return: generator with key-value pairs.
         """
-        def generate_result(value):
-            cursor = value['cursor']
-            more = value['more']
-            for k, v in value['data'].items():
-                k = self._process_binary(k)
-                v = self._process_binary(v)
-                yield k, v
-
-            while more:
-                inner_result = sql_cursor_get_page(self._client, cursor)
-                if result.status != 0:
-                    raise SQLError(result.message)
-                more = inner_result.value['more']
-                for k, v in inner_result.value['data'].items():
+        def generate_result(value, pages):
+            try:
+                pages.start()
+                for k, v in value['data'].items():
                     k = self._process_binary(k)
                     v = self._process_binary(v)
                     yield k, v
 
+                for inner_result in pages:
+                    if inner_result.status != 0:
+                        raise SQLError(inner_result.message)
+                    for k, v in inner_result.value['data'].items():
+                        k = self._process_binary(k)
+                        v = self._process_binary(v)
+                        yield k, v
+            finally:
+                pages.close()
+
         type_name = self.settings[
             prop_codes.PROP_QUERY_ENTITIES
         ][0]['value_type_name']
         if not type_name:
             raise SQLError('Value type is unknown')
-        result = sql(
-            self._client,
-            self._cache_id,
-            type_name,
-            query_str,
-            page_size,
-            query_args,
-            distributed_joins,
-            replicated_only,
-            local,
-            timeout
+        # cursor pages must be read from the node, that has opened it
+        conn = cursor_checkout(self._client, prefetch)
+        try:
+            result = sql(
+                conn,
+                self._cache_id,
+                type_name,
+                query_str,
+                page_size,
+                query_args,
+                distributed_joins,
+                replicated_only,
+                local,
+                timeout,
+                binary=self._binary,
+            )
+            if result.status != 0:
+                raise SQLError(result.message)
+        except Exception:
+            cursor_checkin(self._client, conn)
+            raise
+
+        if result.value['more']:
+            release = partial(cursor_checkin, self._client, conn)
+        else:
+            # the server has already closed the cursor, so the connection
+            # is not needed to read the rest of the result
+            cursor_checkin(self._client, conn)
+            conn = release = None
+
+        pages = CursorPages(
+            conn, result.value['cursor'], sql_cursor_get_page,
+            result.value['more'], prefetch, release,
         )
-        if result.status != 0:
-            raise SQLError(result.message)
+        return pages.attach(generate_result(result.value, pages))
+
+
+class CachePipeline:
+    """
+    Queue of key-value operations on a cache, that are performed in one
+    batch. Users should not instantiate this class directly, but use
+    :py:meth:`~pyignite.cache.Cache.pipeline` instead.
+    """
+
+    def __init__(self, cache: Cache):
+        """
+        :param cache: cache to perform the operations on.
+        """
+        self._cache = cache
+        self._pipeline = Pipeline(cache.client)
+        self._handlers = []
+        self.results = None
+
+    def __enter__(self) -> 'CachePipeline':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
 
-        return generate_result(result.value)
+    def __len__(self) -> int:
+        return len(self._pipeline)
+
+    def get(self, key, key_hint: object=None):
+        """
+        Queues the retrieval of a value from cache by key.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted.
+        """
+        cache_get(
+            self._pipeline, self._cache.cache_id, key, key_hint=key_hint,
+            binary=self._cache.binary,
+        )
+        self._handlers.append(self._cache._process_binary)
+
+    def put(self, key, value, key_hint: object=None, value_hint: object=None):
+        """
+        Queues putting a value with a given key to cache.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted.
+        """
+        cache_put(
+            self._pipeline, self._cache.cache_id, key, value,
+            key_hint=key_hint, value_hint=value_hint
+        )
+        key = (key, key_hint) if key_hint else key
+
+        def invalidate(value):
+            self._cache._invalidate([key])
+            return value
+
+        self._handlers.append(invalidate)
+
+    def contains_key(self, key, key_hint=None):
+        """
+        Queues the check whether given key is present in cache.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted.
+        """
+        cache_contains_key(
+            self._pipeline, self._cache.cache_id, key, key_hint=key_hint
+        )
+        self._handlers.append(None)
+
+    def execute(self) -> list:
+        """
+        Performs the queued operations. Raises `CacheError` if any
+        of them failed.
+
+        :return: list of the operations' results in the order they
+         were queued. The list is also kept in `results` attribute.
+        """
+        handlers, self._handlers = self._handlers, []
+        self.results = []
+        for result, handler in zip(self._pipeline.execute(), handlers):
+            if result.status != 0:
+                raise CacheError(result.message)
+            if handler is not None:
+                result.value = handler(result.value)
+            self.results.append(result.value)
+        return self.results
@@ -41,6 +41,8 @@ the local (class-wise) registry for Ignite Complex objects.
 """
 
 from collections import defaultdict, OrderedDict
+from functools import partial
+from threading import Lock
 from typing import Iterable, Type, Union
 
 from .api.binary import get_binary_type, put_binary_type
@@ -49,11 +51,18 @@ from .api.sql import sql_fields, sql_fields_cursor_get_page
 from .cache import Cache
 from .connection import Connection
 from .constants import *
-from .datatypes import BinaryObject
-from .datatypes.internal import tc_map
-from .exceptions import BinaryTypeError, CacheError, SQLError
-from .utils import entity_id, schema_id, status_to_exception
-from .binary import GenericObjectMeta
+from .datatypes import prop_codes
+from .datatypes.primitive_arrays import PRIMITIVE_ARRAY_TYPES
+from .exceptions import (
+    BinaryTypeError, CacheError, ParameterError, SQLError,
+)
+from .prefetch import (
+    CursorPages, close_cursor, cursor_checkin, cursor_checkout,
+)
+from .queries.pipeline import Pipeline
+from .utils import entity_id, is_wrapped, schema_id, status_to_exception
+from .binary import GenericObjectMeta, LazyObjectMixin, RawBinaryObject
+from .type_store import BinaryTypeStore, field_type_class
 
 
 __all__ = ['Client']
@@ -73,11 +82,19 @@ class Client(Connection):
 
     _registry = defaultdict(dict)
     _compact_footer = None
+    binary_type_store = None
+    primitive_array_type = list
+    lazy_objects = False
+    # the client, that this connection is taken from, see `owner`
+    _owner = None
 
     def _transfer_params(self, to: 'Client'):
         super()._transfer_params(to)
         to._registry = self._registry
         to._compact_footer = self._compact_footer
+        to.binary_type_store = self.binary_type_store
+        to.primitive_array_type = self.primitive_array_type
+        to.lazy_objects = self.lazy_objects
 
     def __init__(self, compact_footer: bool=None, *args, **kwargs):
         """
@@ -88,9 +105,63 @@ class Client(Connection):
          Default is to use the same approach the server is using (None).
          Apache Ignite binary protocol documentation on this topic:
          https://apacheignite.readme.io/docs/binary-client-protocol-data-format#section-schema
+        :param binary_type_store: (optional) path to the file or
+         :class:`~pyignite.type_store.BinaryTypeStore` object, that keeps
+         the binary types between runs. It is loaded into the registry
+         now, looked up for the types, that are missing from the registry,
+         and updated with the types, that are fetched from the server
+         or registered. Default is not to store the binary types (None),
+        :param primitive_array_type: (optional) Python type of the primitive
+         arrays (like `LongArrayObject` or `DoubleArrayObject`), that are
+         received. Can be `list` (default), `array.array`, `memoryview`
+         or `numpy.ndarray` (requires `pyignite[numpy]`). Memoryviews
+         and NumPy arrays are read-only and refer to the received data
+         without copying it. Character arrays are always returned
+         as lists, as well as boolean arrays in the `array.array` mode,
+        :param lazy_objects: (optional) decode the Complex objects
+         of the data classes, that are created from the binary types
+         fetched from the server, lazily, like the objects of the classes
+         with `lazy` option (see :class:`~pyignite.binary.GenericObjectMeta`).
+         The fields of such objects are decoded on the first access. Default
+         is False.
         """
         self._compact_footer = compact_footer
+        store = kwargs.pop('binary_type_store', None)
+        if isinstance(store, str):
+            store = BinaryTypeStore(store)
+        self.binary_type_store = store
+        array_type = kwargs.pop('primitive_array_type', list)
+        if array_type not in PRIMITIVE_ARRAY_TYPES:
+            raise ParameterError(
+                'Primitive array type {} is not supported.'.format(array_type)
+            )
+        self.primitive_array_type = array_type
+        self.lazy_objects = kwargs.pop('lazy_objects', False)
+        # near caches by cache ID and binary mode, see
+        # :py:meth:`~pyignite.cache.Cache.with_near_cache`
+        self._near_caches = {}
+        # the numbers of writes by cache ID, see
+        # :py:class:`~pyignite.coalescing.RequestCoalescer`
+        self._write_counts = {}
+        self._write_counts_lock = Lock()
         super().__init__(*args, **kwargs)
+        if store is not None:
+            for type_id, type_info in store.load().items():
+                self._update_binary_registry(type_id, type_info)
+
+    def _count_write(self, cache_id: int):
+        """
+        Counts the write to the cache. The writes may be done by several
+        threads at once, and none of them must be lost, since the count
+        tells the reads, that have started before the write, see
+        :py:class:`~pyignite.coalescing.RequestCoalescer`.
+
+        :param cache_id: cache ID.
+        """
+        with self._write_counts_lock:
+            self._write_counts[cache_id] = (
+                self._write_counts.get(cache_id, 0) + 1
+            )
 
     @status_to_exception(BinaryTypeError)
     def get_binary_type(self, binary_type: Union[str, int]) -> dict:
@@ -112,14 +183,21 @@ class Client(Connection):
          - `schemas`: a list, containing the Complex object schemas in format:
            OrderedDict[field name: field type hint]. A schema can be empty.
         """
-        def convert_type(tc_type: int):
-            try:
-                return tc_map(tc_type.to_bytes(1, PROTOCOL_BYTE_ORDER))
-            except (KeyError, OverflowError):
-                # if conversion to char or type lookup failed,
-                # we probably have a binary object type ID
-                return BinaryObject
+        result = get_binary_type(self, binary_type)
+        if result.status == 0 and result.value['type_exists']:
+            result.value = self._convert_binary_type(result.value)
+        return result
 
+    @staticmethod
+    def _convert_binary_type(type_info: dict) -> dict:
+        """
+        Converts the binary type description, as it is returned by
+        :py:func:`~pyignite.api.binary.get_binary_type`, to the format
+        of :py:meth:`~pyignite.client.Client.get_binary_type`.
+
+        :param type_info: binary type description,
+        :return: the same dict, with the schemas converted.
+        """
         def convert_schema(
             field_ids: list, binary_fields: list
         ) -> OrderedDict:
@@ -130,23 +208,29 @@ class Client(Connection):
                     for x in binary_fields
                     if x['field_id'] == field_id
                 ][0]
-                converted_schema[binary_field['field_name']] = convert_type(
-                    binary_field['type_id']
+                converted_schema[binary_field['field_name']] = (
+                    field_type_class(binary_field['type_id'])
                 )
             return converted_schema
 
-        result = get_binary_type(self, binary_type)
-        if result.status != 0 or not result.value['type_exists']:
-            return result
-
-        binary_fields = result.value.pop('binary_fields')
-        old_format_schemas = result.value.pop('schema')
-        result.value['schemas'] = []
+        binary_fields = type_info.pop('binary_fields')
+        old_format_schemas = type_info.pop('schema')
+        type_info['schemas'] = []
         for s_id, field_ids in old_format_schemas.items():
-            result.value['schemas'].append(
+            type_info['schemas'].append(
                 convert_schema(field_ids, binary_fields)
             )
-        return result
+        return type_info
+
+    @property
+    def owner(self) -> 'Client':
+        """
+        The client, that this connection belongs to: the connection pool
+        for the pooled connections, or the client itself. Objects, that
+        outlive the query, like the lazy Complex objects, use it
+        to run the following queries.
+        """
+        return self._owner or self
 
     @property
     def compact_footer(self) -> bool:
@@ -210,7 +294,11 @@ class Client(Connection):
         :return: the resulting class.
         """
         schema = schema or {}
-        return GenericObjectMeta(type_name, (), {}, schema=schema)
+        # the objects of the generated classes may be decoded lazily,
+        # see `lazy_objects`
+        return GenericObjectMeta(
+            type_name, (LazyObjectMixin, ), {}, schema=schema
+        )
 
     def _sync_binary_registry(self, type_id: int):
         """
@@ -219,15 +307,52 @@ class Client(Connection):
 
         :param type_id: Complex object type ID.
         """
-        type_info = self.get_binary_type(type_id)
+        self._add_binary_type(type_id, self.get_binary_type(type_id))
+
+    def _add_binary_type(self, type_id: int, type_info: dict):
+        """
+        Puts Complex object description, fetched from Ignite server,
+        in registry and in binary type store.
+
+        :param type_id: Complex object type ID,
+        :param type_info: Complex object description.
+        """
+        self._update_binary_registry(type_id, type_info)
+        if self.binary_type_store is not None and type_info['type_exists']:
+            self.binary_type_store.save(
+                type_id, type_info['type_name'], type_info['schemas']
+            )
+
+    def _load_binary_type(self, type_id: int):
+        """
+        Reads Complex object description from the binary type store,
+        that may have been updated by other processes.
+
+        :param type_id: Complex object type ID.
+        """
+        if self.binary_type_store is not None:
+            type_info = self.binary_type_store.load(type_id).get(type_id)
+            if type_info:
+                self._update_binary_registry(type_id, type_info)
+
+    @classmethod
+    def _update_binary_registry(cls, type_id: int, type_info: dict):
+        """
+        Creates default Complex object classes from the description,
+        returned by :py:meth:`~pyignite.client.Client.get_binary_type`,
+        and puts them in registry, if not already there.
+
+        :param type_id: Complex object type ID,
+        :param type_info: Complex object description.
+        """
         if type_info['type_exists']:
             for schema in type_info['schemas']:
-                if not self._registry[type_id].get(schema_id(schema), None):
-                    data_class = self._create_dataclass(
+                if not cls._registry[type_id].get(schema_id(schema), None):
+                    data_class = cls._create_dataclass(
                         type_info['type_name'],
                         schema,
                     )
-                    self._registry[type_id][schema_id(schema)] = data_class
+                    cls._registry[type_id][schema_id(schema)] = data_class
 
     def register_binary_type(
         self, data_class: Type, affinity_key_field: str=None,
@@ -247,8 +372,26 @@ class Client(Connection):
                 affinity_key_field,
                 schema=data_class.schema,
             )
+            if self.binary_type_store is not None:
+                self.binary_type_store.save(
+                    data_class.type_id, data_class.type_name,
+                    [data_class.schema],
+                )
         self._registry[data_class.type_id][data_class.schema_id] = data_class
 
+    def ensure_binary_type(self, data_class: Type):
+        """
+        Registers the Complex object class, unless it is already registered.
+        Called before the objects of the class are serialized.
+
+        :param data_class: Complex object class.
+        """
+        registered = self._registry[data_class.type_id].get(
+            data_class.schema_id, None
+        )
+        if registered is not data_class:
+            self.register_binary_type(data_class)
+
     def query_binary_type(
         self, binary_type: Union[int, str], schema: Union[int, dict]=None,
         sync: bool=True
@@ -266,20 +409,80 @@ class Client(Connection):
         type_id = entity_id(binary_type)
         s_id = schema_id(schema)
 
-        if schema:
-            try:
-                result = self._registry[type_id][s_id]
-            except KeyError:
-                result = None
-        else:
-            result = self._registry[type_id]
+        def lookup():
+            if schema:
+                return self._registry[type_id].get(s_id, None)
+            return self._registry[type_id]
 
+        result = lookup()
         if sync and not result:
-            self._sync_binary_registry(type_id)
-            return self.query_binary_type(type_id, s_id, sync=False)
+            # other processes may have stored the type already
+            self._load_binary_type(type_id)
+            result = lookup()
+            if not result:
+                self._sync_binary_registry(type_id)
+                result = lookup()
 
         return result
 
+    def preload_binary_types(
+        self, binary_types: Iterable[Union[str, int]]=None,
+        caches: Iterable[Union[str, Cache]]=None,
+    ) -> list:
+        """
+        Fills the registry of Complex object classes ahead of time, so that
+        the queries, that return Complex objects, are not slowed down
+        by binary type lookups. The types, that are not in the registry
+        or in the binary type store, are fetched from Ignite server
+        with one pipelined burst of queries.
+
+        :param binary_types: (optional) Complex object type names or IDs,
+        :param caches: (optional) caches or cache names. Key and value
+         types of their query entities (`PROP_QUERY_ENTITIES`) are preloaded,
+        :return: list of type IDs, that are found in the registry after
+         preloading.
+        """
+        type_ids = [
+            entity_id(binary_type) for binary_type in binary_types or []
+        ]
+        for cache in caches or []:
+            if not isinstance(cache, Cache):
+                cache = self.get_cache(cache)
+            query_entities = cache.settings.get(
+                prop_codes.PROP_QUERY_ENTITIES, None
+            )
+            for query_entity in query_entities or []:
+                for type_name in (
+                    query_entity['key_type_name'],
+                    query_entity['value_type_name'],
+                ):
+                    if type_name:
+                        type_ids.append(entity_id(type_name))
+        type_ids = list(OrderedDict.fromkeys(type_ids))
+
+        missing = []
+        for type_id in type_ids:
+            if not self._registry[type_id]:
+                self._load_binary_type(type_id)
+            if not self._registry[type_id]:
+                missing.append(type_id)
+
+        if missing:
+            pipeline = self.pipeline()
+            results = [
+                get_binary_type(pipeline, type_id) for type_id in missing
+            ]
+            pipeline.execute()
+            for type_id, result in zip(missing, results):
+                if result.status != 0:
+                    raise BinaryTypeError(result.message)
+                if result.value['type_exists']:
+                    self._add_binary_type(
+                        type_id, self._convert_binary_type(result.value)
+                    )
+
+        return [type_id for type_id in type_ids if self._registry[type_id]]
+
     def create_cache(self, settings: Union[str, dict]) -> 'Cache':
         """
         Creates Ignite cache by name. Raises `CacheError` if such a cache is
@@ -317,6 +520,17 @@ class Client(Connection):
         """
         return Cache(self, settings, get_only=True)
 
+    def pipeline(self) -> Pipeline:
+        """
+        Creates a pipeline, that sends queries over this connection
+        back-to-back and matches the responses by query ID. Pass it
+        to the API functions instead of the client, then call its
+        :py:meth:`~pyignite.queries.pipeline.Pipeline.execute` method.
+
+        :return: :class:`~pyignite.queries.pipeline.Pipeline` object.
+        """
+        return Pipeline(self)
+
     @status_to_exception(CacheError)
     def get_cache_names(self) -> list:
         """
@@ -333,7 +547,8 @@ class Client(Connection):
         local: bool=False, replicated_only: bool=False,
         enforce_join_order: bool=False, collocated: bool=False,
         lazy: bool=False, include_field_names: bool=False,
-        max_rows: int=-1, timeout: int=0,
+        max_rows: int=-1, timeout: int=0, binary: bool=False,
+        prefetch: int=0,
     ):
         """
         Runs an SQL query and returns its result.
@@ -367,40 +582,277 @@ class Client(Connection):
          (all rows),
         :param timeout: (optional) non-negative timeout value in ms.
          Zero disables timeout (default),
+        :param binary: (optional) return Complex objects in binary form,
+         as :class:`~pyignite.binary.RawBinaryObject` values. Defaults
+         to False,
+        :param prefetch: (optional) number of pages to read ahead, while
+         the current page is being processed. Defaults to 0 (no read-ahead).
+         See :py:mod:`pyignite.prefetch`,
         :return: generator with result rows as a lists. If
          `include_field_names` was set, the first row will hold field names.
         """
-        def generate_result(value):
-            cursor = value['cursor']
-            more = value['more']
+        def process_line(line):
+            if binary:
+                return [
+                    RawBinaryObject.from_wrapped(x) if is_wrapped(x) else x
+                    for x in line
+                ]
+            return line
+
+        def generate_result(value, pages):
+            try:
+                pages.start()
+                if include_field_names:
+                    yield value['fields']
+                for line in value['data']:
+                    yield process_line(line)
+
+                for inner_result in pages:
+                    if inner_result.status != 0:
+                        raise SQLError(inner_result.message)
+                    for line in inner_result.value['data']:
+                        yield process_line(line)
+            finally:
+                pages.close()
+
+        schema = self.get_or_create_cache(schema)
+        # cursor pages must be read from the node, that has opened it
+        conn = cursor_checkout(self, prefetch)
+        try:
+            result = sql_fields(
+                conn, schema.cache_id, query_str,
+                page_size, query_args, schema.name,
+                statement_type, distributed_joins, local, replicated_only,
+                enforce_join_order, collocated, lazy, include_field_names,
+                max_rows, timeout, binary=binary,
+            )
+            if result.status != 0:
+                raise SQLError(result.message)
+        except Exception:
+            cursor_checkin(self, conn)
+            raise
+
+        if result.value['more']:
+            release = partial(cursor_checkin, self, conn)
+        else:
+            # the server has already closed the cursor, so the connection
+            # is not needed to read the rest of the result
+            cursor_checkin(self, conn)
+            conn = release = None
+
+        if include_field_names:
+            field_count = len(result.value['fields'])
+        else:
+            field_count = result.value['field_count']
+        pages = CursorPages(
+            conn, result.value['cursor'],
+            lambda page_conn, cursor: sql_fields_cursor_get_page(
+                page_conn, cursor, field_count
+            ),
+            result.value['more'], prefetch, release,
+        )
+        return pages.attach(generate_result(result.value, pages))
+
+    def sql_to_columns(
+        self, query_str: str, page_size: int=1024, query_args: Iterable=None,
+        schema: Union[int, str]='PUBLIC', **kwargs
+    ) -> OrderedDict:
+        """
+        Runs an SQL query and fetches the whole result into NumPy arrays,
+        one per column. The pages are decoded right into the typed column
+        buffers, without building the rows. Requires NumPy.
+
+        The columns of the SQL numeric and boolean types are the arrays
+        of the respective NumPy types. Other columns (strings, dates,
+        objects), as well as the columns with nulls, are arrays of
+        `object` type.
 
-            if include_field_names:
-                yield value['fields']
-                field_count = len(value['fields'])
-            else:
-                field_count = value['field_count']
-            for line in value['data']:
-                yield line
+        :param query_str: SQL query string,
+        :param page_size: (optional) cursor page size. Defaults to 1024,
+        :param query_args: (optional) query arguments. List of values or
+         (value, type hint) tuples,
+        :param schema: (optional) schema for the query. Defaults to `PUBLIC`,
+        :param kwargs: (optional) other parameters of
+         :py:meth:`~pyignite.client.Client.sql`, except
+         `include_field_names` and `binary`,
+        :return: dict of {field name: NumPy array}, in the order
+         of the fields.
+        """
+        import numpy
+
+        schema = self.get_or_create_cache(schema)
+        conn = self.checkout()
+        more = False
+        try:
+            result = sql_fields(
+                conn, schema.cache_id, query_str, page_size, query_args,
+                schema.name, include_field_names=True, columnar=True,
+                **kwargs
+            )
+            if result.status != 0:
+                raise SQLError(result.message)
+            fields = result.value['fields']
+            columns = result.value['data']
+            cursor = result.value['cursor']
+            more = result.value['more']
 
             while more:
-                inner_result = sql_fields_cursor_get_page(
-                    self, cursor, field_count
+                page = sql_fields_cursor_get_page(
+                    conn, cursor, len(fields), columnar=True,
                 )
-                if inner_result.status != 0:
-                    raise SQLError(result.message)
-                more = inner_result.value['more']
-                for line in inner_result.value['data']:
-                    yield line
+                if page.status != 0:
+                    raise SQLError(page.message)
+                more = page.value['more']
+                for i, page_column in enumerate(page.value['data']):
+                    columns[i] = self._extend_column(columns[i], page_column)
+        except Exception:
+            if more:
+                close_cursor(conn, cursor)
+            raise
+        finally:
+            self.checkin(conn)
+
+        return OrderedDict(
+            (field, self._column_to_numpy(numpy, column))
+            for field, column in zip(fields, columns)
+        )
+
+    def sql_to_dataframe(
+        self, query_str: str, page_size: int=1024, query_args: Iterable=None,
+        schema: Union[int, str]='PUBLIC', **kwargs
+    ) -> 'pandas.DataFrame':
+        """
+        Runs an SQL query and fetches the whole result into pandas
+        `DataFrame`. Requires pandas. Parameters are the same as
+        of :py:meth:`~pyignite.client.Client.sql_to_columns`.
+
+        :return: `pandas.DataFrame` object with the columns named
+         after the query fields.
+        """
+        import pandas
+
+        return pandas.DataFrame(self.sql_to_columns(
+            query_str, page_size, query_args, schema, **kwargs
+        ))
+
+    def sql_to_arrow(
+        self, query_str: str, page_size: int=1024, query_args: Iterable=None,
+        schema: Union[int, str]='PUBLIC', **kwargs
+    ):
+        """
+        Runs an SQL query and returns its result as a stream of Apache Arrow
+        record batches, one per cursor page, so that the memory use
+        is bounded by the page size. Requires pyarrow.
+
+        The columns are named after the query fields. See
+        :py:mod:`pyignite.arrow` for the mapping of the column types.
+
+        :param query_str: SQL query string,
+        :param page_size: (optional) cursor page size. Defaults to 1024,
+        :param query_args: (optional) query arguments. List of values or
+         (value, type hint) tuples,
+        :param schema: (optional) schema for the query. Defaults to `PUBLIC`,
+        :param kwargs: (optional) other parameters of
+         :py:meth:`~pyignite.client.Client.sql`, except
+         `include_field_names`,
+        :return: generator of `pyarrow.RecordBatch` objects.
+        """
+        from .arrow import record_batch
+
+        def generate_result(conn, value):
+            more = value['more']
+            try:
+                fields = value['fields']
+                type_codes = value['type_codes']
+                yield record_batch(fields, value['data'], type_codes)
+
+                while more:
+                    page = sql_fields_cursor_get_page(
+                        conn, value['cursor'], len(fields), columnar=True,
+                    )
+                    if page.status != 0:
+                        raise SQLError(page.message)
+                    more = page.value['more']
+                    # keep the types of the columns, that are null
+                    # on this page
+                    type_codes = [
+                        type_code if type_code is not None else known
+                        for type_code, known in zip(
+                            page.value['type_codes'], type_codes
+                        )
+                    ]
+                    yield record_batch(fields, page.value['data'], type_codes)
+            finally:
+                if conn is not None:
+                    # the cursor is left open on error or early exit;
+                    # the generator may be closed by the garbage collector
+                    # in the middle of another query, so it is closed later
+                    if more:
+                        conn.defer_cursor_close(value['cursor'])
+                    self.checkin(conn)
 
         schema = self.get_or_create_cache(schema)
-        result = sql_fields(
-            self, schema.cache_id, query_str,
-            page_size, query_args, schema.name,
-            statement_type, distributed_joins, local, replicated_only,
-            enforce_join_order, collocated, lazy, include_field_names,
-            max_rows, timeout,
-        )
-        if result.status != 0:
-            raise SQLError(result.message)
+        # cursor pages must be read from the node, that has opened it
+        conn = self.checkout()
+        try:
+            result = sql_fields(
+                conn, schema.cache_id, query_str, page_size, query_args,
+                schema.name, include_field_names=True, columnar=True,
+                **kwargs
+            )
+            if result.status != 0:
+                raise SQLError(result.message)
+        except Exception:
+            self.checkin(conn)
+            raise
+
+        if not result.value['more']:
+            # the server has already closed the cursor
+            self.checkin(conn)
+            conn = None
+        return generate_result(conn, result.value)
 
-        return generate_result(result.value)
+    @staticmethod
+    def _extend_column(column, page_column):
+        """
+        Appends the page data to the column, that is either a list
+        or `array.array` object.
+        """
+        if not page_column:
+            return column
+        if not column:
+            return page_column
+        if (
+            getattr(column, 'typecode', None)
+            != getattr(page_column, 'typecode', None)
+        ):
+            # the types of the pages differ, fall back to list
+            if not isinstance(column, list):
+                column = column.tolist()
+        column.extend(page_column)
+        return column
+
+    _numpy_dtypes = {
+        'b': 'int8',
+        'h': 'int16',
+        'i': 'int32',
+        'q': 'int64',
+        'f': 'float32',
+        'd': 'float64',
+        'B': 'bool',
+    }
+
+    @classmethod
+    def _column_to_numpy(cls, numpy, column) -> 'numpy.ndarray':
+        """
+        Converts the column (list or `array.array`) to NumPy array.
+        """
+        if not isinstance(column, list):
+            return numpy.frombuffer(
+                column, dtype=cls._numpy_dtypes[column.typecode]
+            )
+        result = numpy.empty(len(column), dtype=object)
+        # assign one by one, so that the sequence values are not broadcast
+        for i, value in enumerate(column):
+            result[i] = value
+        return result
@@ -0,0 +1,334 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `RequestCoalescer` class, that merges the concurrent
+single-key reads of one cache into multi-key requests.
+
+It is enabled per cache with
+:py:meth:`~pyignite.cache.Cache.with_coalescing` and is useful, when
+the cache object is shared by many threads, that use
+:class:`~pyignite.pool.ClientPool`::
+
+    cache = pool.get_or_create_cache('my cache').with_coalescing()
+    # `get` calls of the threads are now sent as `get_all` requests
+
+The first call of a batch waits for `window` seconds (or until the batch
+is full), while the calls of the other threads join the batch. Then
+the batch is sent as one request, and its result is fanned out
+to the callers. The calls for a key, that is already requested, wait
+for that request instead of sending another one, unless there were
+writes to the cache through the same client since the request was
+queued.
+"""
+
+from collections import OrderedDict
+from threading import Event, Lock
+from typing import Optional, Tuple
+
+from .api.key_value import (
+    cache_contains_key, cache_contains_keys, cache_get, cache_get_all,
+)
+from .api.result import APIResult
+from .datatypes.internal import infer_from_python
+from .queries.pipeline import Pipeline
+
+
+__all__ = ['RequestCoalescer']
+
+
+GET = 'get'
+CONTAINS_KEY = 'contains_key'
+
+
+class Call:
+    """
+    The call, that waits for a batch to complete.
+    """
+    __slots__ = ('key', 'key_hint', 'generation', 'result', 'error', 'done')
+
+    def __init__(self, key, key_hint: object=None, generation: int=0):
+        self.key = key
+        self.key_hint = key_hint
+        # the number of writes to the cache, done before the call
+        self.generation = generation
+        self.result = None
+        self.error = None
+        self.done = Event()
+
+    @property
+    def item(self):
+        """
+        The key in the form of the multi-key API functions.
+        """
+        if self.key_hint is None:
+            return self.key
+        return self.key, self.key_hint
+
+    def wait(self) -> APIResult:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class Batch:
+    """
+    The calls of the same kind, that are sent together.
+    """
+
+    def __init__(self):
+        # serialized key → call
+        self.calls = OrderedDict()
+        # key → serialized key; keys, that are equal in Python (like `1`
+        # and `True`) can not share the batch, since the multi-key
+        # responses are dicts
+        self.keys = {}
+        self.full = Event()
+
+
+class CoalescerBase:
+    """
+    Batch bookkeeping, shared by the synchronous and the asynchronous
+    request coalescers.
+    """
+    call_class = Call
+    batch_class = Batch
+
+    def __init__(self, cache, window: float=0.0002, max_batch: int=256):
+        """
+        :param cache: cache object,
+        :param window: (optional) time (in seconds) to wait for other calls
+         to join the batch. Defaults to 200 µs,
+        :param max_batch: (optional) maximum number of keys in the batch.
+         Defaults to 256.
+        """
+        self.cache = cache
+        self.window = window
+        self.max_batch = max_batch
+        # the number of calls and the number of requests, that were sent
+        # for them
+        self.calls = 0
+        self.requests = 0
+        self._lock = Lock()
+        self._open_batches = {}
+        self._in_flight = {}
+
+    def __repr__(self) -> str:
+        return '<{} calls={} requests={}>'.format(
+            self.__class__.__name__, self.calls, self.requests,
+        )
+
+    def _join(
+        self, kind: str, key, key_hint: object=None,
+    ) -> Tuple[Optional[Call], Optional[Batch]]:
+        """
+        Adds the call to the open batch or starts a new batch.
+
+        :param kind: call kind, `GET` or `CONTAINS_KEY`,
+        :param key: key,
+        :param key_hint: (optional) Ignite data type of the key,
+        :return: the call and the batch, if the caller should send it
+         (the call is None, if it can not be coalesced).
+        """
+        try:
+            hash(key)
+            item = key if key_hint is None else (key, key_hint)
+            serialized_key = bytes(
+                infer_from_python(item, self.cache.client)
+            )
+        except (TypeError, ValueError):
+            return None, None
+
+        with self._lock:
+            generation = self._generation()
+            batch = self._open_batches.get(kind)
+            # the call can share the request for the same key, unless
+            # the request may have been sent before the last write
+            call = self._in_flight.get((kind, serialized_key))
+            if call is not None and (
+                call.generation == generation
+                or batch is not None and (
+                    batch.calls.get(serialized_key) is call
+                )
+            ):
+                self.calls += 1
+                return call, None
+
+            if batch is not None and batch.keys.get(
+                key, serialized_key
+            ) != serialized_key:
+                return None, None
+            self.calls += 1
+            call = self.call_class(key, key_hint, generation)
+            self._in_flight[kind, serialized_key] = call
+            leader = batch is None
+            if leader:
+                batch = self._open_batches[kind] = self.batch_class()
+            batch.calls[serialized_key] = call
+            batch.keys[key] = serialized_key
+            if len(batch.calls) >= self.max_batch:
+                self._close(kind, batch)
+                batch.full.set()
+            return call, batch if leader else None
+
+    def _close(self, kind: str, batch: Batch):
+        """
+        Stops the batch from accepting new calls. Must be called with
+        the lock held.
+        """
+        if self._open_batches.get(kind) is batch:
+            del self._open_batches[kind]
+
+    def _complete(self, kind: str, batch: Batch):
+        """
+        Lets the new calls for the batch keys to be sent again.
+        """
+        with self._lock:
+            for serialized_key, call in batch.calls.items():
+                # the newer call for the key may be in flight already
+                if self._in_flight.get((kind, serialized_key)) is call:
+                    del self._in_flight[kind, serialized_key]
+
+    def _generation(self) -> int:
+        """
+        The number of writes to the cache, that are done through
+        the client.
+        """
+        return self.cache.client._write_counts.get(self.cache.cache_id, 0)
+
+    def _count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def _fan_out_get(self, batch: Batch, result: APIResult) -> list:
+        """
+        Splits the `get_all` result into the `get` results.
+        """
+        calls = list(batch.calls.values())
+        if result.status != 0:
+            return [result] * len(calls)
+        values = result.value or {}
+        return [
+            APIResult.from_values(
+                result.status, result.query_id, value=values.get(call.key),
+            )
+            for call in calls
+        ]
+
+
+class RequestCoalescer(CoalescerBase):
+    """
+    Merges the concurrent `get` and `contains_key` calls of the cache
+    into `get_all` and `contains_keys` requests. Thread-safe.
+    """
+
+    def get(self, key, key_hint: object=None) -> Optional[APIResult]:
+        """
+        Coalesced counterpart
+        of :py:func:`~pyignite.api.key_value.cache_get`. The value is
+        already processed by the cache.
+
+        :return: API result data object, or None, if the key can not
+         be coalesced (like the unhashable Complex objects).
+        """
+        return self._call(GET, key, key_hint)
+
+    def contains_key(
+        self, key, key_hint: object=None,
+    ) -> Optional[APIResult]:
+        """
+        Coalesced counterpart
+        of :py:func:`~pyignite.api.key_value.cache_contains_key`.
+
+        :return: API result data object, or None, if the key can not
+         be coalesced.
+        """
+        return self._call(CONTAINS_KEY, key, key_hint)
+
+    def _call(self, kind: str, key, key_hint: object=None):
+        call, batch = self._join(kind, key, key_hint)
+        if call is None:
+            return None
+        if batch is not None:
+            batch.full.wait(self.window)
+            with self._lock:
+                self._close(kind, batch)
+            self._send(kind, batch)
+        return call.wait()
+
+    def _send(self, kind: str, batch: Batch):
+        calls = list(batch.calls.values())
+        try:
+            if kind == GET:
+                results = self._get(batch)
+            else:
+                results = self._contains_key(batch)
+            for call, result in zip(calls, results):
+                call.result = result
+        except Exception as e:
+            for call in calls:
+                call.error = e
+        finally:
+            self._complete(kind, batch)
+            for call in calls:
+                call.done.set()
+
+    def _get(self, batch: Batch) -> list:
+        cache = self.cache
+        calls = list(batch.calls.values())
+        self._count_request()
+        if len(calls) == 1:
+            result = cache_get(
+                cache.client, cache.cache_id, calls[0].key,
+                key_hint=calls[0].key_hint, binary=cache.binary,
+            )
+            result.value = cache._process_binary(result.value)
+            return [result]
+
+        result = cache_get_all(
+            cache.client, cache.cache_id, [call.item for call in calls],
+            binary=cache.binary,
+        )
+        results = self._fan_out_get(batch, result)
+        for result in results:
+            result.value = cache._process_binary(result.value)
+        return results
+
+    def _contains_key(self, batch: Batch) -> list:
+        cache = self.cache
+        calls = list(batch.calls.values())
+        self._count_request()
+        if len(calls) == 1:
+            return [cache_contains_key(
+                cache.client, cache.cache_id, calls[0].key,
+                key_hint=calls[0].key_hint,
+            )]
+
+        result = cache_contains_keys(
+            cache.client, cache.cache_id, [call.item for call in calls],
+        )
+        if result.status != 0 or result.value:
+            return [result] * len(calls)
+
+        # some of the keys are missing, check them one by one
+        # in a single round trip
+        self._count_request()
+        pipeline = Pipeline(cache.client)
+        for call in calls:
+            cache_contains_key(
+                pipeline, cache.cache_id, call.key, key_hint=call.key_hint,
+            )
+        return pipeline.execute()
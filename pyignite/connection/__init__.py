@@ -33,7 +33,9 @@ This module contains `Connection` class, that wraps TCP socket handling,
 as well as Ignite protocol handshaking.
 """
 
+import ctypes
 import socket
+from typing import Union
 
 from pyignite.constants import *
 from pyignite.exceptions import (
@@ -41,7 +43,7 @@ from pyignite.exceptions import (
 )
 
 from pyignite.utils import is_iterable
-from .handshake import HandshakeRequest, read_response
+from .handshake import HandshakeRequest, get_error_text, read_response
 from .ssl import wrap
 
 
@@ -67,6 +69,12 @@ class Connection:
     prefetch = None
     username = None
     password = None
+    single_pass_decoding = False
+    frame_reader = True
+    _buffer = None
+    _buffer_pos = 0
+    _buffer_end = 0
+    _deferred_cursors = ()
 
     @staticmethod
     def _check_kwargs(kwargs):
@@ -81,6 +89,8 @@ class Connection:
             'ssl_ca_certfile',
             'username',
             'password',
+            'single_pass_decoding',
+            'frame_reader',
         ]
         for kw in kwargs:
             if kw not in expected_args:
@@ -125,16 +135,27 @@ class Connection:
          (server-side) certificate,
         :param username: (optional) user name to authenticate to Ignite
          cluster,
-        :param password: (optional) password to authenticate to Ignite cluster.
+        :param password: (optional) password to authenticate to Ignite cluster,
+        :param single_pass_decoding: (optional) set to True to read each
+         response frame in full and decode it directly from the receive
+         buffer, without building intermediate ctypes objects. Defaults
+         to False,
+        :param frame_reader: (optional) set to False to read only the bytes
+         requested by the parser from the socket. By default, socket data
+         is read ahead into the reusable buffer with as few system calls
+         as possible, usually one per response frame.
         """
         self.prefetch = prefetch
         self._check_kwargs(kwargs)
         self.timeout = kwargs.pop('timeout', None)
         self.username = kwargs.pop('username', None)
         self.password = kwargs.pop('password', None)
+        self.single_pass_decoding = kwargs.pop('single_pass_decoding', False)
+        self.frame_reader = kwargs.pop('frame_reader', True)
         if all([self.username, self.password, 'use_ssl' not in kwargs]):
             kwargs['use_ssl'] = True
         self.init_kwargs = kwargs
+        self._deferred_cursors = []
 
     read_response = read_response
     _wrap = wrap
@@ -162,31 +183,15 @@ class Connection:
         self._socket.settimeout(self.timeout)
         self._socket = self._wrap(self.socket)
         self._socket.connect((host, port))
+        # discard any data left from the previous socket
+        self._buffer_pos = self._buffer_end = 0
 
         hs_request = HandshakeRequest(self.username, self.password)
         self.send(hs_request)
         hs_response = self.read_response()
         if hs_response['op_code'] == 0:
             self.close()
-            error_text = 'Handshake error: {}'.format(hs_response['message'])
-            # if handshake fails for any reason other than protocol mismatch
-            # (i.e. authentication error), server version is 0.0.0
-            if any([
-                hs_response['version_major'],
-                hs_response['version_minor'],
-                hs_response['version_patch'],
-            ]):
-                error_text += (
-                    ' Server expects binary protocol version '
-                    '{version_major}.{version_minor}.{version_patch}. Client '
-                    'provides {client_major}.{client_minor}.{client_patch}.'
-                ).format(
-                    client_major=PROTOCOL_VERSION_MAJOR,
-                    client_minor=PROTOCOL_VERSION_MINOR,
-                    client_patch=PROTOCOL_VERSION_PATCH,
-                    **hs_response
-                )
-            raise HandshakeError(error_text)
+            raise HandshakeError(get_error_text(hs_response))
         self.host, self.port = host, port
 
     def connect(self, *args):
@@ -235,8 +240,11 @@ class Connection:
 
         :param target: connection object to transfer parameters to.
         """
+        to.timeout = self.timeout
         to.username = self.username
         to.password = self.password
+        to.single_pass_decoding = self.single_pass_decoding
+        to.frame_reader = self.frame_reader
         to.nodes = self.nodes
 
     def clone(self, prefetch: bytes=b'') -> 'Connection':
@@ -252,29 +260,73 @@ class Connection:
         clone.prefetch = prefetch
         return clone
 
-    def send(self, data: bytes, flags=None):
+    def checkout(self) -> 'Connection':
+        """
+        Takes the connection to run a series of queries on, that must go
+        to the same node, like the cursor page queries. This connection
+        is itself such a connection; pools take one of their connections.
+
+        :return: `Connection` object.
+        """
+        return self
+
+    def checkin(self, conn: 'Connection'):
+        """
+        Returns the connection, that has been taken with
+        :py:meth:`~pyignite.connection.Connection.checkout`.
+
+        :param conn: `Connection` object.
+        """
+        pass
+
+    def defer_cursor_close(self, cursor: int):
+        """
+        Queues the cursor, that is no longer read, to be closed before
+        the next query on this connection. Unlike closing it right away,
+        this is safe, while the connection is in the middle of another
+        query, as it is, when a cursor is abandoned by the garbage
+        collector.
+
+        :param cursor: cursor ID.
+        """
+        self._deferred_cursors.append(cursor)
+
+    def close_deferred_cursors(self):
+        """
+        Closes the cursors, that have been queued by
+        :py:meth:`~pyignite.connection.Connection.defer_cursor_close`.
+        """
+        from pyignite.api.sql import resource_close
+
+        while self._deferred_cursors:
+            resource_close(self, self._deferred_cursors.pop())
+
+    def send(self, data: Union[bytes, bytearray, memoryview], flags=None):
         """
         Send data down the socket.
 
-        :param data: bytes to send,
+        :param data: bytes-like object to send. Other objects are converted
+         to bytes,
         :param flags: (optional) OS-specific flags.
         """
         kwargs = {}
         if flags is not None:
             kwargs['flags'] = flags
-        data = bytes(data)
-        total_bytes_sent = 0
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+        # advance a view on partial sends instead of slicing the data
+        view = memoryview(data).cast('B')
 
-        while total_bytes_sent < len(data):
+        while view:
             try:
-                bytes_sent = self.socket.send(data[total_bytes_sent:], **kwargs)
+                bytes_sent = self.socket.send(view, **kwargs)
             except OSError:
                 self._socket = self.host = self.port = None
                 raise
             if bytes_sent == 0:
                 self.socket.close()
                 raise SocketError('Socket connection broken.')
-            total_bytes_sent += bytes_sent
+            view = view[bytes_sent:]
 
     def recv(self, buffersize, flags=None) -> bytes:
         """
@@ -299,10 +351,106 @@ class Connection:
             self.prefetch = self.prefetch[buffersize:]
             return result
 
+    def recv_frame(self) -> memoryview:
+        """
+        Receive the whole response frame, which is prefixed with its length.
+
+        :return: memoryview of the frame data, including the length prefix.
+        """
+        if not self.frame_reader or self.prefetch:
+            length_buffer = self.recv(ctypes.sizeof(ctypes.c_int))
+            length = int.from_bytes(
+                length_buffer, byteorder=PROTOCOL_BYTE_ORDER
+            )
+            return memoryview(length_buffer + self.recv(length))
+
+        try:
+            self._fill_buffer(ctypes.sizeof(ctypes.c_int))
+            length = int.from_bytes(
+                self._buffer[
+                    self._buffer_pos:
+                    self._buffer_pos + ctypes.sizeof(ctypes.c_int)
+                ],
+                byteorder=PROTOCOL_BYTE_ORDER,
+            )
+            return memoryview(
+                self._read_buffer(ctypes.sizeof(ctypes.c_int) + length)
+            )
+        except (SocketError, OSError):
+            self._socket = self.host = self.port = None
+            raise
+
+    def _fill_buffer(self, size: int, flags=None):
+        """
+        Make sure the receive buffer holds at least `size` unread bytes.
+        Reads as much data as the socket can give, so the whole response
+        frame is usually received with a single system call.
+
+        :param size: number of unread bytes required,
+        :param flags: (optional) OS-specific flags.
+        """
+        available = self._buffer_end - self._buffer_pos
+        if available >= size:
+            return
+
+        if self._buffer is None:
+            self._buffer = bytearray(max(size, RECV_BUFFER_SIZE))
+        if self._buffer_pos:
+            # move unread data to the beginning of the buffer
+            self._buffer[:available] = self._buffer[
+                self._buffer_pos:self._buffer_end
+            ]
+            self._buffer_pos, self._buffer_end = 0, available
+        if len(self._buffer) < size:
+            self._buffer.extend(
+                bytes(max(size, 2 * len(self._buffer)) - len(self._buffer))
+            )
+
+        kwargs = {}
+        if flags is not None:
+            kwargs['flags'] = flags
+        view = memoryview(self._buffer)
+        try:
+            while self._buffer_end < size:
+                bytes_rcvd = self.socket.recv_into(
+                    view[self._buffer_end:], **kwargs
+                )
+                if bytes_rcvd == 0:
+                    self.socket.close()
+                    raise SocketError('Socket connection broken.')
+                self._buffer_end += bytes_rcvd
+        finally:
+            view.release()
+
+    def _read_buffer(self, size: int, flags=None) -> bytes:
+        """
+        Read data through the receive buffer.
+
+        :param size: bytes to read,
+        :param flags: (optional) OS-specific flags,
+        :return: data read.
+        """
+        self._fill_buffer(size, flags)
+        # the buffer is reused for the next responses, so the data is copied
+        # out of it, once
+        with memoryview(self._buffer) as view:
+            result = view[self._buffer_pos:self._buffer_pos + size].tobytes()
+        self._buffer_pos += size
+        if self._buffer_pos == self._buffer_end:
+            self._buffer_pos = self._buffer_end = 0
+            if len(self._buffer) > RECV_BUFFER_MAX_SIZE:
+                # do not hold the memory of a large response for the life
+                # of the connection
+                self._buffer = None
+        return result
+
     def _recv(self, buffersize, flags=None) -> bytes:
         """
         Handle socket data reading.
         """
+        if self.frame_reader:
+            return self._read_buffer(buffersize, flags)
+
         kwargs = {}
         if flags is not None:
             kwargs['flags'] = flags
@@ -89,3 +89,55 @@ def read_response(client):
         end = end_class.from_buffer_copy(end_buffer)
         data.update(response_end.to_python(end))
     return data
+
+
+def decode_response(buffer: memoryview) -> dict:
+    """
+    Decodes the handshake response from the whole received frame.
+
+    :param buffer: handshake response frame, including its length,
+    :return: dict of response fields, as returned by `read_response`.
+    """
+    response_start = Struct([
+        ('length', Int),
+        ('op_code', Byte),
+    ])
+    data, offset = response_start.decode(buffer, 0)
+    if data['op_code'] == 0:
+        response_end = Struct([
+            ('version_major', Short),
+            ('version_minor', Short),
+            ('version_patch', Short),
+            ('message', String),
+        ])
+        end, _ = response_end.decode(buffer, offset)
+        data.update(end)
+    return data
+
+
+def get_error_text(hs_response: dict) -> str:
+    """
+    Composes the description of the failed handshake.
+
+    :param hs_response: handshake response fields,
+    :return: error text.
+    """
+    error_text = 'Handshake error: {}'.format(hs_response['message'])
+    # if handshake fails for any reason other than protocol mismatch
+    # (i.e. authentication error), server version is 0.0.0
+    if any([
+        hs_response['version_major'],
+        hs_response['version_minor'],
+        hs_response['version_patch'],
+    ]):
+        error_text += (
+            ' Server expects binary protocol version '
+            '{version_major}.{version_minor}.{version_patch}. Client '
+            'provides {client_major}.{client_minor}.{client_patch}.'
+        ).format(
+            client_major=PROTOCOL_VERSION_MAJOR,
+            client_minor=PROTOCOL_VERSION_MINOR,
+            client_patch=PROTOCOL_VERSION_PATCH,
+            **hs_response
+        )
+    return error_text
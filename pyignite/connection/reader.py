@@ -0,0 +1,79 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Type, Union
+
+from pyignite.exceptions import ParseError
+
+
+__all__ = ['BufferReader']
+
+
+class BufferReader:
+    """
+    Stands for the connection, when the data to parse is already
+    in memory, like a whole response frame or a wrapped binary object.
+
+    The parsers read the data with `recv`, just like from the socket,
+    while the binary types are looked up through the client. Its socket
+    is not in the middle of a response, so it can be used for that
+    right away.
+    """
+
+    def __init__(
+        self, client: 'Client', buffer: Union[bytes, memoryview],
+        offset: int=0,
+    ):
+        """
+        :param client: Ignite client to look up the binary types with,
+        :param buffer: data to parse,
+        :param offset: (optional) position of the data in the buffer.
+        """
+        self.client = client
+        self.buffer = memoryview(buffer)
+        self.pos = offset
+        self.prefetch = b''
+
+    def recv(self, buffersize: int, flags=None) -> bytes:
+        """
+        Read data from the pushed back bytes or the buffer.
+
+        :param buffersize: bytes to read,
+        :param flags: (optional) ignored,
+        :return: data read.
+        """
+        result = self.prefetch[:buffersize]
+        self.prefetch = self.prefetch[buffersize:]
+        size = buffersize - len(result)
+        if size:
+            if self.pos + size > len(self.buffer):
+                raise ParseError('Unexpected end of data.')
+            result += bytes(self.buffer[self.pos:self.pos + size])
+            self.pos += size
+        return result
+
+    def query_binary_type(self, *args, **kwargs) -> Type:
+        """
+        See :py:meth:`~pyignite.client.Client.query_binary_type`.
+        """
+        return self.client.query_binary_type(*args, **kwargs)
+
+    @property
+    def compact_footer(self) -> bool:
+        return self.client.compact_footer
+
+    @compact_footer.setter
+    def compact_footer(self, value: bool):
+        self.client.compact_footer = value
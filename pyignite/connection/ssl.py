@@ -37,3 +37,28 @@ def wrap(client, _socket):
             ca_certs=client.init_kwargs.get('ssl_ca_certfile', None),
         )
     return _socket
+
+
+def create_context(init_kwargs: dict):
+    """
+    Create SSL context for the use with asyncio streams.
+
+    :param init_kwargs: connection parameters,
+    :return: `ssl.SSLContext` object or None, if SSL is not used.
+    """
+    if not init_kwargs.get('use_ssl', None):
+        return None
+
+    context = ssl.SSLContext(
+        init_kwargs.get('ssl_version', SSL_DEFAULT_VERSION)
+    )
+    context.set_ciphers(init_kwargs.get('ssl_ciphers', SSL_DEFAULT_CIPHERS))
+    context.verify_mode = init_kwargs.get('ssl_cert_reqs', ssl.CERT_NONE)
+    if init_kwargs.get('ssl_certfile', None):
+        context.load_cert_chain(
+            init_kwargs['ssl_certfile'],
+            init_kwargs.get('ssl_keyfile', None),
+        )
+    if init_kwargs.get('ssl_ca_certfile', None):
+        context.load_verify_locations(init_kwargs['ssl_ca_certfile'])
+    return context
@@ -26,7 +26,8 @@ __all__ = [
     'PROTOCOL_BYTE_ORDER', 'PROTOCOL_STRING_ENCODING',
     'PROTOCOL_CHAR_ENCODING', 'SSL_DEFAULT_VERSION', 'SSL_DEFAULT_CIPHERS',
     'FNV1_OFFSET_BASIS', 'FNV1_PRIME',
-    'IGNITE_DEFAULT_HOST', 'IGNITE_DEFAULT_PORT',
+    'IGNITE_DEFAULT_HOST', 'IGNITE_DEFAULT_PORT', 'RECV_BUFFER_SIZE',
+    'RECV_BUFFER_MAX_SIZE',
 ]
 
 PROTOCOL_VERSION_MAJOR = 1
@@ -50,3 +51,8 @@ FNV1_PRIME = 0x01000193
 
 IGNITE_DEFAULT_HOST = 'localhost'
 IGNITE_DEFAULT_PORT = 10800
+
+RECV_BUFFER_SIZE = 4096
+# the receive buffer, that has grown larger to hold a large response,
+# is shrunk back to `RECV_BUFFER_SIZE`
+RECV_BUFFER_MAX_SIZE = 1 << 20
@@ -15,6 +15,7 @@
 
 import ctypes
 
+from pyignite.utils import c_struct, layout
 from .prop_codes import *
 from .cache_config import (
     CacheMode, CacheAtomicityMode, PartitionLossPolicy, RebalanceMode,
@@ -80,15 +81,11 @@ class PropBase:
 
     @classmethod
     def build_header(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('prop_code', ctypes.c_short),
-                ],
-            }
+            [
+                ('prop_code', ctypes.c_short),
+            ],
         )
 
     @classmethod
@@ -96,15 +93,12 @@ class PropBase:
         header_class = cls.build_header()
         header_buffer = connection.recv(ctypes.sizeof(header_class))
         data_class, data_buffer = cls.prop_data_class.parse(connection)
-        prop_class = type(
+        prop_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('data', data_class),
-                ],
-            }
+            [
+                ('data', data_class),
+            ],
+            base=header_class,
         )
         return prop_class, header_buffer + data_buffer
 
@@ -115,7 +109,13 @@ class PropBase:
         )
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        return cls.prop_data_class.decode(
+            buffer, offset + ctypes.sizeof(ctypes.c_short), *args, **kwargs
+        )
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         header_class = cls.build_header()
         header = header_class()
         header.prop_code = cls.prop_code
@@ -275,7 +275,7 @@ class PropStatisticsEnabled(PropBase):
 class AnyProperty(PropBase):
 
     @classmethod
-    def from_python(cls, value):
+    def from_python(cls, value, *args, **kwargs):
         raise Exception(
             'You must choose a certain type '
             'for your cache configuration property'
@@ -285,3 +285,10 @@ class AnyProperty(PropBase):
     def to_python(cls, ctype_object, *args, **kwargs):
         prop_data_class = prop_map(ctype_object.prop_code)
         return prop_data_class.to_python(ctype_object.data, *args, **kwargs)
+
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        prop_code = c_struct(ctypes.c_short).unpack_from(buffer, offset)[0]
+        return prop_map(prop_code).decode(
+            buffer, offset + ctypes.sizeof(ctypes.c_short), *args, **kwargs
+        )
@@ -15,11 +15,10 @@
 
 from collections import OrderedDict
 import ctypes
-import inspect
 
 from pyignite.constants import *
 from pyignite.exceptions import ParseError
-from pyignite.utils import entity_id, hashcode, is_hinted
+from pyignite.utils import c_struct, entity_id, hashcode, is_hinted, layout
 from .base import IgniteDataType
 from .internal import AnyDataObject, infer_from_python
 from .type_codes import *
@@ -41,17 +40,13 @@ class ObjectArrayObject(IgniteDataType):
 
     @classmethod
     def build_header(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('type_id', ctypes.c_int),
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('type_id', ctypes.c_int),
+                ('length', ctypes.c_int),
+            ],
         )
 
     @classmethod
@@ -66,13 +61,10 @@ class ObjectArrayObject(IgniteDataType):
             buffer += buffer_fragment
             fields.append(('element_{}'.format(i), c_type))
 
-        final_class = type(
+        final_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
+            fields,
+            base=header_class,
         )
         return final_class, buffer
 
@@ -89,7 +81,28 @@ class ObjectArrayObject(IgniteDataType):
         return getattr(ctype_object, cls.type_or_id_name), result
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        decoder = c_struct(ctypes.c_byte, ctypes.c_int, ctypes.c_int)
+        _, type_id, length = decoder.unpack_from(buffer, offset)
+        result, offset = cls.decode_elements(
+            buffer, offset + decoder.size, length, *args, **kwargs
+        )
+        return (type_id, result), offset
+
+    @staticmethod
+    def decode_elements(
+        buffer: memoryview, offset: int, length: int, *args, **kwargs
+    ):
+        result = []
+        for i in range(length):
+            value, offset = AnyDataObject.decode(
+                buffer, offset, *args, **kwargs
+            )
+            result.append(value)
+        return result, offset
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         type_or_id, value = value
         header_class = cls.build_header()
         header = header_class()
@@ -104,11 +117,11 @@ class ObjectArrayObject(IgniteDataType):
             length = 1
         header.length = length
         setattr(header, cls.type_or_id_name, type_or_id)
-        buffer = bytes(header)
+        buffer = bytearray(header)
 
         for x in value:
-            buffer += infer_from_python(x)
-        return buffer
+            buffer += infer_from_python(x, *args, **kwargs)
+        return bytes(buffer)
 
 
 class WrappedDataObject(IgniteDataType):
@@ -124,16 +137,12 @@ class WrappedDataObject(IgniteDataType):
 
     @classmethod
     def build_header(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('length', ctypes.c_int),
+            ],
         )
 
     @classmethod
@@ -142,16 +151,13 @@ class WrappedDataObject(IgniteDataType):
         buffer = client.recv(ctypes.sizeof(header_class))
         header = header_class.from_buffer_copy(buffer)
 
-        final_class = type(
+        final_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('payload', ctypes.c_byte*header.length),
-                    ('offset', ctypes.c_int),
-                ],
-            }
+            [
+                ('payload', ctypes.c_byte*header.length),
+                ('offset', ctypes.c_int),
+            ],
+            base=header_class,
         )
         buffer += client.recv(
             ctypes.sizeof(final_class) - ctypes.sizeof(header_class)
@@ -163,7 +169,17 @@ class WrappedDataObject(IgniteDataType):
         return bytes(ctype_object.payload), ctype_object.offset
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        header_decoder = c_struct(ctypes.c_byte, ctypes.c_int)
+        _, length = header_decoder.unpack_from(buffer, offset)
+        offset += header_decoder.size
+        payload = bytes(buffer[offset:offset + length])
+        offset += length
+        payload_offset = c_struct(ctypes.c_int).unpack_from(buffer, offset)[0]
+        return (payload, payload_offset), offset + ctypes.sizeof(ctypes.c_int)
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         raise ParseError('Send unwrapped data.')
 
 
@@ -182,18 +198,23 @@ class CollectionObject(ObjectArrayObject):
 
     @classmethod
     def build_header(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                    ('type', ctypes.c_byte),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('length', ctypes.c_int),
+                ('type', ctypes.c_byte),
+            ],
+        )
+
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        decoder = c_struct(ctypes.c_byte, ctypes.c_int, ctypes.c_byte)
+        _, length, type_hint = decoder.unpack_from(buffer, offset)
+        result, offset = cls.decode_elements(
+            buffer, offset + decoder.size, length, *args, **kwargs
         )
+        return (type_hint, result), offset
 
 
 class Map(IgniteDataType):
@@ -208,15 +229,11 @@ class Map(IgniteDataType):
 
     @classmethod
     def build_header(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('length', ctypes.c_int),
+            ],
         )
 
     @classmethod
@@ -231,13 +248,10 @@ class Map(IgniteDataType):
             buffer += buffer_fragment
             fields.append(('element_{}'.format(i), c_type))
 
-        final_class = type(
+        final_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
+            fields,
+            base=header_class,
         )
         return final_class, buffer
 
@@ -259,7 +273,28 @@ class Map(IgniteDataType):
         return result
 
     @classmethod
-    def from_python(cls, value, type_id=None):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        length = c_struct(ctypes.c_int).unpack_from(buffer, offset)[0]
+        return cls.decode_pairs(
+            buffer, offset + ctypes.sizeof(ctypes.c_int), length,
+            cls.HASH_MAP, *args, **kwargs
+        )
+
+    @classmethod
+    def decode_pairs(
+        cls, buffer: memoryview, offset: int, length: int, map_type: int,
+        *args, **kwargs
+    ):
+        result = OrderedDict() if map_type == cls.LINKED_HASH_MAP else {}
+
+        for i in range(length):
+            k, offset = AnyDataObject.decode(buffer, offset, *args, **kwargs)
+            v, offset = AnyDataObject.decode(buffer, offset, *args, **kwargs)
+            result[k] = v
+        return result, offset
+
+    @classmethod
+    def from_python(cls, value, *args, type_id=None, **kwargs):
         header_class = cls.build_header()
         header = header_class()
         length = len(value)
@@ -271,12 +306,12 @@ class Map(IgniteDataType):
             )
         if hasattr(header, 'type'):
             header.type = type_id
-        buffer = bytes(header)
+        buffer = bytearray(header)
 
         for k, v in value.items():
-            buffer += infer_from_python(k)
-            buffer += infer_from_python(v)
-        return buffer
+            buffer += infer_from_python(k, *args, **kwargs)
+            buffer += infer_from_python(v, *args, **kwargs)
+        return bytes(buffer)
 
 
 class MapObject(Map):
@@ -293,17 +328,13 @@ class MapObject(Map):
 
     @classmethod
     def build_header(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                    ('type', ctypes.c_byte),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('length', ctypes.c_int),
+                ('type', ctypes.c_byte),
+            ],
         )
 
     @classmethod
@@ -313,9 +344,18 @@ class MapObject(Map):
         )
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        decoder = c_struct(ctypes.c_byte, ctypes.c_int, ctypes.c_byte)
+        _, length, map_type = decoder.unpack_from(buffer, offset)
+        result, offset = cls.decode_pairs(
+            buffer, offset + decoder.size, length, map_type, *args, **kwargs
+        )
+        return (map_type, result), offset
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         type_id, value = value
-        return super().from_python(value, type_id)
+        return super().from_python(value, *args, type_id=type_id, **kwargs)
 
 
 class BinaryObject(IgniteDataType):
@@ -330,22 +370,18 @@ class BinaryObject(IgniteDataType):
 
     @classmethod
     def build_header(cls):
-        return type(
+        return layout(
             cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('version', ctypes.c_byte),
-                    ('flags', ctypes.c_short),
-                    ('type_id', ctypes.c_int),
-                    ('hash_code', ctypes.c_int),
-                    ('length', ctypes.c_int),
-                    ('schema_id', ctypes.c_int),
-                    ('schema_offset', ctypes.c_int),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('version', ctypes.c_byte),
+                ('flags', ctypes.c_short),
+                ('type_id', ctypes.c_int),
+                ('hash_code', ctypes.c_int),
+                ('length', ctypes.c_int),
+                ('schema_id', ctypes.c_int),
+                ('schema_offset', ctypes.c_int),
+            ],
         )
 
     @classmethod
@@ -360,24 +396,59 @@ class BinaryObject(IgniteDataType):
     def schema_type(cls, flags: int):
         if flags & cls.COMPACT_FOOTER:
             return cls.offset_c_type(flags)
-        return type(
+        return layout(
             'SchemaElement',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('field_id', ctypes.c_int),
-                    ('offset', cls.offset_c_type(flags)),
-                ],
-            },
+            [
+                ('field_id', ctypes.c_int),
+                ('offset', cls.offset_c_type(flags)),
+            ],
         )
 
+    @classmethod
+    def field_offsets(
+        cls, buffer: memoryview, offset: int, flags: int,
+        schema_offset: int, field_names: list,
+    ) -> dict:
+        """
+        Reads the field offsets from the footer of the Complex object.
+
+        :param buffer: binary data,
+        :param offset: position of the Complex object in the buffer,
+        :param flags: Complex object flags,
+        :param schema_offset: position of the footer in the object,
+        :param field_names: names of the fields in the schema,
+        :return: dict of {field name: field position in the object},
+         or None if the object has no footer or it does not match
+         the schema.
+        """
+        if not flags & cls.HAS_SCHEMA:
+            return None
+        offset_type = cls.offset_c_type(flags)
+        offset += schema_offset
+        if flags & cls.COMPACT_FOOTER:
+            offsets = c_struct(
+                *[offset_type] * len(field_names)
+            ).unpack_from(buffer, offset)
+            return dict(zip(field_names, offsets))
+
+        items = c_struct(
+            *[ctypes.c_int, offset_type] * len(field_names)
+        ).unpack_from(buffer, offset)
+        field_ids = {
+            entity_id(field_name): field_name for field_name in field_names
+        }
+        result = {}
+        for field_id, field_offset in zip(items[0::2], items[1::2]):
+            if field_id not in field_ids:
+                return None
+            result[field_ids[field_id]] = field_offset
+        return result
+
     @staticmethod
     def get_dataclass(client: 'Client', header) -> OrderedDict:
-        # get field names from outer space
-        temp_conn = client.clone()
-        result = temp_conn.query_binary_type(header.type_id, header.schema_id)
-        temp_conn.close()
+        # get field names from outer space. The data is parsed from memory
+        # (see `BufferReader`), so the client is free to query the server
+        result = client.query_binary_type(header.type_id, header.schema_id)
         if not result:
             raise ParseError('Binary type is not registered')
         return result
@@ -404,13 +475,10 @@ class BinaryObject(IgniteDataType):
             buffer += client.recv(ctypes.sizeof(schema))
             final_class_fields.append(('schema', schema))
 
-        final_class = type(
+        final_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': final_class_fields,
-            }
+            final_class_fields,
+            base=header_class,
         )
         # register schema encoding approach
         client.compact_footer = bool(header.flags & cls.COMPACT_FOOTER)
@@ -441,38 +509,97 @@ class BinaryObject(IgniteDataType):
         return result
 
     @classmethod
-    def from_python(cls, value: object):
-
-        def find_client():
-            """
-            A nice hack. Extracts the nearest `Client` instance from the
-            call stack.
-            """
-            from pyignite import Client
-
-            frame = None
-            try:
-                for rec in inspect.stack()[2:]:
-                    frame = rec[0]
-                    code = frame.f_code
-                    for varname in code.co_varnames:
-                        suspect = frame.f_locals[varname]
-                        if isinstance(suspect, Client):
-                            return suspect
-            finally:
-                del frame
-
-        compact_footer = True  # this is actually used
-        client = find_client()
-        if client:
-            # if no client can be found, the class of the `value` is discarded
-            # and the new dataclass is automatically registered later on
-            client.register_binary_type(value.__class__)
-            compact_footer = client.compact_footer
+    def decode(
+        cls, buffer: memoryview, offset: int, client: 'Client'=None,
+        *args, **kwargs
+    ):
+        header_decoder = c_struct(
+            ctypes.c_byte, ctypes.c_byte, ctypes.c_short, ctypes.c_int,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        )
+        (
+            _, version, flags, type_id, _, length, schema_id, schema_offset,
+        ) = header_decoder.unpack_from(buffer, offset)
+
+        if not client:
+            raise ParseError(
+                'Can not query binary type {}'.format(type_id)
+            )
+
+        # the response frame is already received, so the binary type
+        # can be queried using the same connection
+        data_class = client.query_binary_type(type_id, schema_id)
+        if not data_class:
+            raise ParseError('Binary type is not registered')
+
+        # register schema encoding approach
+        client.compact_footer = bool(flags & cls.COMPACT_FOOTER)
+
+        # data class may be lazy (see `GenericObjectMeta`), or the client
+        # may decode the objects of the generated data classes lazily (see
+        # `Client.lazy_objects`): keep the binary data and decode the fields
+        # on access. The fields may need binary type lookups, so the object
+        # keeps the client or the pool, that owns the connection, rather
+        # than the connection, that may be used by another thread by then.
+        # The asyncio client can not look up the types synchronously, so its
+        # objects are decoded at once
+        owner = getattr(client, 'owner', None)
+        lazy = getattr(data_class, '_lazy', False)
+        if not lazy and getattr(owner, 'lazy_objects', False):
+            from pyignite.binary import LazyObjectMixin
+
+            lazy = issubclass(data_class, LazyObjectMixin)
+        if lazy and owner is not None:
+            field_offsets = cls.field_offsets(
+                buffer, offset, flags, schema_offset,
+                list(data_class.schema),
+            )
+            if field_offsets is not None:
+                result = data_class.__new__(data_class)
+                result.version = version
+                result._lazy_fields = (
+                    bytes(buffer[offset:offset + length]), field_offsets,
+                    owner, args, kwargs,
+                )
+                return result, offset + length
+
+        result = data_class()
+        result.version = version
+        field_offset = offset + header_decoder.size
+        # data class may be compiled (see `GenericObjectMeta.compile`)
+        codec = getattr(data_class, '_codec', None)
+        if codec is not None:
+            codec.decode_fields(
+                result, buffer, field_offset, client, *args, **kwargs
+            )
         else:
+            for field_name, field_type in data_class.schema.items():
+                value, field_offset = field_type.decode(
+                    buffer, field_offset, client, *args, **kwargs
+                )
+                setattr(result, field_name, value)
+        return result, offset + length
+
+    @classmethod
+    def from_python(
+        cls, value: object, client: 'Client'=None, *args, **kwargs
+    ):
+        from pyignite.binary import RawBinaryObject
+
+        # Complex object in binary form is sent as is
+        if isinstance(value, RawBinaryObject):
+            return value.data
+        if client is None:
             raise Warning(
                 'Can not register binary type {}'.format(value.type_name)
             )
+        # the class of the `value` is registered on the first use,
+        # and then is found in the registry
+        client.ensure_binary_type(value.__class__)
+        codec = getattr(value.__class__, '_codec', None)
+        if codec is not None:
+            return codec.encode(value, client, *args, **kwargs)
+        compact_footer = client.compact_footer
 
         # prepare header
         header_class = cls.build_header()
@@ -490,24 +617,26 @@ class BinaryObject(IgniteDataType):
         header.schema_id = value.schema_id
 
         # create fields and calculate offsets
-        field_buffer = b''
+        field_buffer = bytearray()
         offsets = [ctypes.sizeof(header_class)]
         schema_items = list(value.schema.items())
         for field_name, field_type in schema_items:
             partial_buffer = field_type.from_python(
                 getattr(
                     value, field_name, getattr(field_type, 'default', None)
-                )
+                ),
+                client, *args, **kwargs
             )
-            offsets.append(max(offsets) + len(partial_buffer))
+            offsets.append(offsets[-1] + len(partial_buffer))
             field_buffer += partial_buffer
 
         offsets = offsets[:-1]
 
-        # create footer
-        if max(offsets, default=0) < 255:
+        # create footer; offsets are growing, so the last one is the largest
+        max_offset = offsets[-1] if offsets else 0
+        if max_offset < 255:
             header.flags |= cls.OFFSET_ONE_BYTE
-        elif max(offsets) < 65535:
+        elif max_offset < 65535:
             header.flags |= cls.OFFSET_TWO_BYTES
         schema_class = cls.schema_type(header.flags) * len(offsets)
         schema = schema_class()
@@ -521,6 +650,7 @@ class BinaryObject(IgniteDataType):
         # calculate size and hash code
         header.schema_offset = ctypes.sizeof(header_class) + len(field_buffer)
         header.length = header.schema_offset + ctypes.sizeof(schema_class)
-        header.hash_code = hashcode(field_buffer + bytes(schema))
+        field_buffer += schema
+        header.hash_code = hashcode(field_buffer)
 
-        return bytes(header) + field_buffer + bytes(schema)
+        return bytes(header) + field_buffer
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from array import array
 from collections import OrderedDict
 import ctypes
 import decimal
@@ -22,9 +23,14 @@ import uuid
 
 import attr
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from pyignite.constants import *
 from pyignite.exceptions import ParseError
-from pyignite.utils import is_binary, is_hinted, is_iterable
+from pyignite.utils import c_struct, is_binary, is_hinted, is_iterable, layout
 from .type_codes import *
 
 
@@ -116,15 +122,11 @@ class StructArray:
     defaults = attr.ib(type=dict, default={})
 
     def build_header_class(self):
-        return type(
+        return layout(
             self.__class__.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('length', self.counter_type),
-                ],
-            },
+            [
+                ('length', self.counter_type),
+            ],
         )
 
     def parse(self, client: 'Client'):
@@ -137,13 +139,10 @@ class StructArray:
             buffer += buffer_fragment
             fields.append(('element_{}'.format(i), c_type))
 
-        data_class = type(
+        data_class = layout(
             'StructArray',
-            (self.build_header_class(),),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            },
+            fields,
+            base=self.build_header_class(),
         )
 
         return data_class, buffer
@@ -162,20 +161,32 @@ class StructArray:
             )
         return result
 
-    def from_python(self, value):
+    def decode(self, buffer: memoryview, offset: int, *args, **kwargs):
+        length = c_struct(self.counter_type).unpack_from(buffer, offset)[0]
+        offset += ctypes.sizeof(self.counter_type)
+        element_struct = Struct(self.following, dict_type=dict)
+        result = []
+        for i in range(length):
+            value, offset = element_struct.decode(
+                buffer, offset, *args, **kwargs
+            )
+            result.append(value)
+        return result, offset
+
+    def from_python(self, value, *args, **kwargs):
         length = len(value)
         header_class = self.build_header_class()
         header = header_class()
         header.length = length
-        buffer = bytes(header)
+        buffer = bytearray(header)
 
         for i, v in enumerate(value):
             for default_key, default_value in self.defaults.items():
                 v.setdefault(default_key, default_value)
             for name, el_class in self.following:
-                buffer += el_class.from_python(v[name])
+                buffer += el_class.from_python(v[name], *args, **kwargs)
 
-        return buffer
+        return bytes(buffer)
 
 
 @attr.s
@@ -195,13 +206,9 @@ class Struct:
 
             fields.append((name, c_type))
 
-        data_class = type(
+        data_class = layout(
             'Struct',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            },
+            fields,
         )
 
         return data_class, buffer
@@ -215,16 +222,26 @@ class Struct:
             )
         return result
 
-    def from_python(self, value) -> bytes:
-        buffer = b''
+    def decode(
+        self, buffer: memoryview, offset: int, *args, **kwargs
+    ) -> Tuple[Any, int]:
+        result = self.dict_type()
+        for name, c_type in self.fields:
+            result[name], offset = c_type.decode(
+                buffer, offset, *args, **kwargs
+            )
+        return result, offset
+
+    def from_python(self, value, *args, **kwargs) -> bytes:
+        buffer = bytearray()
 
         for default_key, default_value in self.defaults.items():
             value.setdefault(default_key, default_value)
 
         for name, el_class in self.fields:
-            buffer += el_class.from_python(value[name])
+            buffer += el_class.from_python(value[name], *args, **kwargs)
 
-        return buffer
+        return bytes(buffer)
 
 
 class AnyDataObject:
@@ -234,6 +251,8 @@ class AnyDataObject:
     """
     _python_map = None
     _python_array_map = None
+    _array_type_code_map = None
+    _numpy_dtype_map = None
 
     @staticmethod
     def get_subtype(iterable, allow_none=False):
@@ -287,6 +306,15 @@ class AnyDataObject:
         data_class = tc_map(type_code)
         return data_class.to_python(ctype_object)
 
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        type_code = bytes(buffer[offset:offset + ctypes.sizeof(ctypes.c_byte)])
+        try:
+            data_class = tc_map(type_code)
+        except KeyError:
+            raise ParseError('Unknown type code: `{}`'.format(type_code))
+        return data_class.decode(buffer, offset, *args, **kwargs)
+
     @classmethod
     def _init_python_map(cls):
         """
@@ -319,11 +347,32 @@ class AnyDataObject:
         Optimizes  Python types→Ignite array types map creation for speed.
         """
         from pyignite.datatypes import (
-            LongArrayObject, DoubleArrayObject, StringArrayObject,
-            BoolArrayObject, UUIDArrayObject, DateArrayObject, TimeArrayObject,
-            DecimalArrayObject,
+            ByteArrayObject, ShortArrayObject, IntArrayObject,
+            LongArrayObject, FloatArrayObject, DoubleArrayObject,
+            StringArrayObject, BoolArrayObject, UUIDArrayObject,
+            DateArrayObject, TimeArrayObject, DecimalArrayObject,
         )
 
+        # `array.array` type codes
+        cls._array_type_code_map = {
+            'b': ByteArrayObject,
+            'h': ShortArrayObject,
+            'i': IntArrayObject,
+            'q': LongArrayObject,
+            'f': FloatArrayObject,
+            'd': DoubleArrayObject,
+        }
+        # NumPy dtype kinds and item sizes
+        cls._numpy_dtype_map = {
+            ('i', 1): ByteArrayObject,
+            ('i', 2): ShortArrayObject,
+            ('i', 4): IntArrayObject,
+            ('i', 8): LongArrayObject,
+            ('f', 4): FloatArrayObject,
+            ('f', 8): DoubleArrayObject,
+            ('b', 1): BoolArrayObject,
+        }
+
         cls._python_array_map = {
             int: LongArrayObject,
             float: DoubleArrayObject,
@@ -342,6 +391,7 @@ class AnyDataObject:
         from pyignite.datatypes import (
             MapObject, ObjectArrayObject, BinaryObject,
         )
+        from pyignite.binary import RawBinaryObject
 
         if cls._python_map is None:
             cls._init_python_map()
@@ -349,6 +399,22 @@ class AnyDataObject:
             cls._init_python_array_map()
 
         value_type = type(value)
+        if (
+            value_type is array
+            and value.typecode in cls._array_type_code_map
+        ):
+            return cls._array_type_code_map[value.typecode]
+
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            dtype_key = (value.dtype.kind, value.dtype.itemsize)
+            if value.ndim != 1 or dtype_key not in cls._numpy_dtype_map:
+                raise TypeError(
+                    'NumPy array of shape {} and type {} is invalid'.format(
+                        value.shape, value.dtype
+                    )
+                )
+            return cls._numpy_dtype_map[dtype_key]
+
         if is_iterable(value) and value_type is not str:
             value_subtype = cls.get_subtype(value)
             if value_subtype in cls._python_array_map:
@@ -375,7 +441,7 @@ class AnyDataObject:
                 'Type `array of {}` is invalid'.format(value_subtype)
             )
 
-        if is_binary(value):
+        if is_binary(value) or isinstance(value, RawBinaryObject):
             return BinaryObject
 
         if value_type in cls._python_map:
@@ -385,22 +451,24 @@ class AnyDataObject:
         )
 
     @classmethod
-    def from_python(cls, value):
-        return cls.map_python_type(value).from_python(value)
+    def from_python(cls, value, *args, **kwargs):
+        return cls.map_python_type(value).from_python(value, *args, **kwargs)
 
 
-def infer_from_python(value: Any):
+def infer_from_python(value: Any, *args, **kwargs):
     """
     Convert pythonic value to ctypes buffer, type hint-aware.
 
     :param value: pythonic value or (value, type_hint) tuple,
+    :param args: serialization context, usually the client, that is passed
+     to the type's `from_python` method,
     :return: bytes.
     """
     if is_hinted(value):
         value, data_type = value
     else:
         data_type = AnyDataObject
-    return data_type.from_python(value)
+    return data_type.from_python(value, *args, **kwargs)
 
 
 @attr.s
@@ -411,15 +479,11 @@ class AnyDataArray(AnyDataObject):
     counter_type = attr.ib(default=ctypes.c_int)
 
     def build_header(self):
-        return type(
+        return layout(
             self.__class__.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('length', self.counter_type),
-                ],
-            }
+            [
+                ('length', self.counter_type),
+            ],
         )
 
     def parse(self, client: 'Client'):
@@ -433,13 +497,10 @@ class AnyDataArray(AnyDataObject):
             buffer += buffer_fragment
             fields.append(('element_{}'.format(i), c_type))
 
-        final_class = type(
+        final_class = layout(
             self.__class__.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
+            fields,
+            base=header_class,
         )
         return final_class, buffer
 
@@ -455,7 +516,16 @@ class AnyDataArray(AnyDataObject):
             )
         return result
 
-    def from_python(self, value):
+    def decode(self, buffer: memoryview, offset: int, *args, **kwargs):
+        length = c_struct(self.counter_type).unpack_from(buffer, offset)[0]
+        offset += ctypes.sizeof(self.counter_type)
+        result = []
+        for i in range(length):
+            value, offset = super().decode(buffer, offset, *args, **kwargs)
+            result.append(value)
+        return result, offset
+
+    def from_python(self, value, *args, **kwargs):
         header_class = self.build_header()
         header = header_class()
 
@@ -465,8 +535,8 @@ class AnyDataArray(AnyDataObject):
             value = [value]
             length = 1
         header.length = length
-        buffer = bytes(header)
+        buffer = bytearray(header)
 
         for x in value:
-            buffer += infer_from_python(x)
-        return buffer
+            buffer += infer_from_python(x, *args, **kwargs)
+        return bytes(buffer)
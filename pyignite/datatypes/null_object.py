@@ -58,6 +58,10 @@ class Null(IgniteDataType):
     def to_python(*args, **kwargs):
         return None
 
+    @staticmethod
+    def decode(buffer: memoryview, offset: int, *args, **kwargs):
+        return None, offset + ctypes.sizeof(ctypes.c_byte)
+
     @staticmethod
     def from_python(*args):
         return TC_NULL
@@ -16,6 +16,7 @@
 import ctypes
 
 from pyignite.constants import *
+from pyignite.utils import c_struct
 from .base import IgniteDataType
 
 
@@ -50,7 +51,14 @@ class Primitive(IgniteDataType):
         return ctype_object
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        return (
+            c_struct(cls.c_type).unpack_from(buffer, offset)[0],
+            offset + ctypes.sizeof(cls.c_type),
+        )
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         return bytes(cls.c_type(value))
 
 
@@ -89,7 +97,12 @@ class Char(Primitive):
         ).decode(PROTOCOL_CHAR_ENCODING)
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        end = offset + ctypes.sizeof(cls.c_type)
+        return bytes(buffer[offset:end]).decode(PROTOCOL_CHAR_ENCODING), end
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         if type(value) is str:
             value = value.encode(PROTOCOL_CHAR_ENCODING)
         # assuming either a bytes or an integer
@@ -13,9 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from array import array
 import ctypes
+import struct
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from pyignite.constants import *
+from pyignite.utils import C_TYPE_FORMATS, c_struct, layout
 from .base import IgniteDataType
 from .primitive import *
 from .type_codes import *
@@ -28,6 +37,14 @@ __all__ = [
     'CharArray', 'CharArrayObject', 'BoolArray', 'BoolArrayObject',
 ]
 
+# `array.array` type codes, that match the primitive type formats
+ARRAY_TYPE_CODES = 'bhiqfd'
+
+# Python types of the received primitive arrays
+PRIMITIVE_ARRAY_TYPES = [list, array, memoryview]
+if numpy is not None:
+    PRIMITIVE_ARRAY_TYPES.append(numpy.ndarray)
+
 
 class PrimitiveArray(IgniteDataType):
     """
@@ -38,15 +55,11 @@ class PrimitiveArray(IgniteDataType):
 
     @classmethod
     def build_header_class(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('length', ctypes.c_int),
+            ],
         )
 
     @classmethod
@@ -54,15 +67,12 @@ class PrimitiveArray(IgniteDataType):
         header_class = cls.build_header_class()
         buffer = client.recv(ctypes.sizeof(header_class))
         header = header_class.from_buffer_copy(buffer)
-        final_class = type(
+        final_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('data', cls.primitive_type.c_type * header.length),
-                ],
-            }
+            [
+                ('data', cls.primitive_type.c_type * header.length),
+            ],
+            base=header_class,
         )
         buffer += client.recv(
             ctypes.sizeof(final_class) - ctypes.sizeof(header_class)
@@ -70,14 +80,99 @@ class PrimitiveArray(IgniteDataType):
         return final_class, buffer
 
     @classmethod
-    def to_python(cls, ctype_object, *args, **kwargs):
-        result = []
-        for i in range(ctype_object.length):
-            result.append(ctype_object.data[i])
-        return result
+    def _type_format(cls) -> str:
+        return C_TYPE_FORMATS[cls.primitive_type.c_type]
+
+    @classmethod
+    def _build_array(cls, data, client: 'Client'=None):
+        """
+        Converts the packed array data into the Python sequence of the type,
+        that is configured in the client (see `primitive_array_type`
+        parameter of :py:meth:`~pyignite.client.Client.__init__`).
+
+        :param data: bytes-like object with little-endian array data,
+        :param client: (optional) Ignite client,
+        :return: list, `array.array`, read-only memoryview or NumPy array.
+        """
+        type_format = cls._type_format()
+        item_size = ctypes.sizeof(cls.primitive_type.c_type)
+        array_type = getattr(client, 'primitive_array_type', list)
+        if numpy is not None and array_type is numpy.ndarray:
+            # read-only view of the received data
+            return numpy.frombuffer(data, dtype='<' + type_format)
+        if array_type is memoryview and sys.byteorder == 'little':
+            data = memoryview(data)
+            if not data.readonly:
+                data = memoryview(bytes(data))
+            # no copying, if the data is a part of the received frame
+            return data.cast('B').cast(type_format)
+        if (
+            array_type is array
+            and type_format in ARRAY_TYPE_CODES
+            and array(type_format).itemsize == item_size
+        ):
+            result = array(type_format)
+            result.frombytes(data)
+            if sys.byteorder != 'little':
+                result.byteswap()
+            return result
+        return list(struct.unpack(
+            '<{}{}'.format(len(data) // item_size, type_format), data
+        ))
+
+    @classmethod
+    def to_python(cls, ctype_object, client: 'Client'=None, *args, **kwargs):
+        return cls._build_array(bytes(ctype_object.data), client)
+
+    @classmethod
+    def decode(
+        cls, buffer: memoryview, offset: int, client: 'Client'=None,
+        *args, **kwargs
+    ):
+        length = c_struct(ctypes.c_int).unpack_from(buffer, offset)[0]
+        offset += ctypes.sizeof(ctypes.c_int)
+        end = offset + length * ctypes.sizeof(cls.primitive_type.c_type)
+        return cls._build_array(buffer[offset:end], client), end
+
+    @classmethod
+    def _pack(cls, value) -> bytes:
+        """
+        Packs the array data at once.
+
+        :param value: sequence of values,
+        :return: little-endian array data.
+        """
+        type_format = cls._type_format()
+        item_size = ctypes.sizeof(cls.primitive_type.c_type)
+        if type_format == 'b' and isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            return value.astype('<' + type_format, copy=False).tobytes()
+        if sys.byteorder == 'little':
+            # copy the data of the native arrays of the same type as is
+            if all([
+                isinstance(value, array),
+                getattr(value, 'typecode', None) == type_format,
+                getattr(value, 'itemsize', None) == item_size,
+            ]) or all([
+                isinstance(value, memoryview),
+                getattr(value, 'format', '').lstrip('<=@') == type_format,
+                getattr(value, 'itemsize', None) == item_size,
+            ]):
+                return value.tobytes()
+        try:
+            return struct.pack(
+                '<{}{}'.format(len(value), type_format), *value
+            )
+        except (struct.error, OverflowError):
+            # let the primitive type deal with the values, that do not
+            # fit the format (like characters or integer overflows)
+            return b''.join(
+                cls.primitive_type.from_python(x) for x in value
+            )
 
     @classmethod
-    def from_python(cls, value):
+    def from_python(cls, value, *args, **kwargs):
         header_class = cls.build_header_class()
         header = header_class()
         if hasattr(header, 'type_code'):
@@ -85,13 +180,8 @@ class PrimitiveArray(IgniteDataType):
                 cls.type_code,
                 byteorder=PROTOCOL_BYTE_ORDER
             )
-        length = len(value)
-        header.length = length
-        buffer = bytes(header)
-
-        for x in value:
-            buffer += cls.primitive_type.from_python(x)
-        return buffer
+        header.length = len(value)
+        return bytes(header) + cls._pack(value)
 
 
 class ByteArray(PrimitiveArray):
@@ -141,18 +231,21 @@ class PrimitiveArrayObject(PrimitiveArray):
     pythonic = list
     default = []
 
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        # skip type code
+        return super().decode(
+            buffer, offset + ctypes.sizeof(ctypes.c_byte), *args, **kwargs
+        )
+
     @classmethod
     def build_header_class(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('length', ctypes.c_int),
+            ],
         )
 
 
@@ -192,7 +285,8 @@ class CharArrayObject(PrimitiveArrayObject):
 
     @classmethod
     def to_python(cls, ctype_object, *args, **kwargs):
-        values = super().to_python(ctype_object, *args, **kwargs)
+        # characters are always returned as a list
+        values = super().to_python(ctype_object)
         return [
             v.to_bytes(
                 ctypes.sizeof(cls.primitive_type.c_type),
@@ -202,6 +296,19 @@ class CharArrayObject(PrimitiveArrayObject):
             ) for v in values
         ]
 
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        # characters are always returned as a list
+        values, offset = super().decode(buffer, offset)
+        return [
+            v.to_bytes(
+                ctypes.sizeof(cls.primitive_type.c_type),
+                byteorder=PROTOCOL_BYTE_ORDER
+            ).decode(
+                PROTOCOL_CHAR_ENCODING
+            ) for v in values
+        ], offset
+
 
 class BoolArrayObject(PrimitiveArrayObject):
     primitive_type = Bool
@@ -16,6 +16,7 @@
 import ctypes
 
 from pyignite.constants import *
+from pyignite.utils import c_struct
 from .base import IgniteDataType
 from .type_codes import *
 
@@ -65,7 +66,16 @@ class DataObject(IgniteDataType):
         return ctype_object.value
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        # skip type code
+        offset += ctypes.sizeof(ctypes.c_byte)
+        return (
+            c_struct(cls.c_type).unpack_from(buffer, offset)[0],
+            offset + ctypes.sizeof(cls.c_type),
+        )
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         data_type = cls.build_c_type()
         data_object = data_type()
         data_object.type_code = int.from_bytes(
@@ -138,7 +148,13 @@ class CharObject(DataObject):
         ).decode(PROTOCOL_CHAR_ENCODING)
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        start = offset + ctypes.sizeof(ctypes.c_byte)
+        end = start + ctypes.sizeof(cls.c_type)
+        return bytes(buffer[start:end]).decode(PROTOCOL_CHAR_ENCODING), end
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         if type(value) is str:
             value = value.encode(PROTOCOL_CHAR_ENCODING)
         # assuming either a bytes or an integer
@@ -19,6 +19,7 @@ import decimal
 import uuid
 
 from pyignite.constants import *
+from pyignite.utils import c_struct, layout
 from .base import IgniteDataType
 from .type_codes import *
 from .null_object import Null
@@ -57,6 +58,18 @@ class StandardObject(IgniteDataType):
         buffer = tc_type + client.recv(ctypes.sizeof(c_type) - len(tc_type))
         return c_type, buffer
 
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        if buffer[offset:offset + 1] == TC_NULL:
+            return Null.decode(buffer, offset)
+        return cls.decode_not_null(
+            buffer, offset + ctypes.sizeof(ctypes.c_byte)
+        )
+
+    @classmethod
+    def decode_not_null(cls, buffer: memoryview, offset: int):
+        raise NotImplementedError('This object is generic')
+
 
 class String(IgniteDataType):
     """
@@ -68,17 +81,13 @@ class String(IgniteDataType):
 
     @classmethod
     def build_c_type(cls, length: int):
-        return type(
+        return layout(
             cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                    ('data', ctypes.c_char * length),
-                ],
-            },
+            [
+                ('type_code', ctypes.c_byte),
+                ('length', ctypes.c_int),
+                ('data', ctypes.c_char * length),
+            ],
         )
 
     @classmethod
@@ -106,8 +115,18 @@ class String(IgniteDataType):
         else:
             return ''
 
+    @staticmethod
+    def decode(buffer: memoryview, offset: int, *args, **kwargs):
+        if buffer[offset:offset + 1] == TC_NULL:
+            return Null.decode(buffer, offset)
+        offset += ctypes.sizeof(ctypes.c_byte)
+        length = c_struct(ctypes.c_int).unpack_from(buffer, offset)[0]
+        offset += ctypes.sizeof(ctypes.c_int)
+        end = offset + length
+        return bytes(buffer[offset:end]).decode(PROTOCOL_STRING_ENCODING), end
+
     @classmethod
-    def from_python(cls, value):
+    def from_python(cls, value, *args, **kwargs):
         if value is None:
             return Null.from_python()
 
@@ -132,17 +151,13 @@ class DecimalObject(IgniteDataType):
 
     @classmethod
     def build_c_header(cls):
-        return type(
+        return layout(
             cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('scale', ctypes.c_int),
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('scale', ctypes.c_int),
+                ('length', ctypes.c_int),
+            ],
         )
 
     @classmethod
@@ -158,15 +173,12 @@ class DecimalObject(IgniteDataType):
             - len(tc_type)
         )
         header = header_class.from_buffer_copy(buffer)
-        data_type = type(
+        data_type = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('data', ctypes.c_char * header.length),
-                ],
-            }
+            [
+                ('data', ctypes.c_char * header.length),
+            ],
+            base=header_class,
         )
         buffer += client.recv(
             ctypes.sizeof(data_type)
@@ -193,7 +205,29 @@ class DecimalObject(IgniteDataType):
         return result
 
     @classmethod
-    def from_python(cls, value: decimal.Decimal):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        if buffer[offset:offset + 1] == TC_NULL:
+            return Null.decode(buffer, offset)
+        offset += ctypes.sizeof(ctypes.c_byte)
+        scale, length = c_struct(ctypes.c_int, ctypes.c_int).unpack_from(
+            buffer, offset
+        )
+        offset += 2 * ctypes.sizeof(ctypes.c_int)
+        end = offset + length
+        data = bytes(buffer[offset:end])
+
+        sign = 1 if data[0] & 0x80 else 0
+        data = bytes([data[0] & 0x7f]) + data[1:]
+        result = decimal.Decimal(data.decode(PROTOCOL_STRING_ENCODING))
+        # apply scale
+        result = result * decimal.Decimal('10') ** decimal.Decimal(scale)
+        if sign:
+            # apply sign
+            result = -result
+        return result, end
+
+    @classmethod
+    def from_python(cls, value: decimal.Decimal, *args, **kwargs):
         if value is None:
             return Null.from_python()
 
@@ -205,15 +239,12 @@ class DecimalObject(IgniteDataType):
             data[0] &= 0x7f
         length = len(digits)
         header_class = cls.build_c_header()
-        data_class = type(
+        data_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('data', ctypes.c_char * length),
-                ],
-            }
+            [
+                ('data', ctypes.c_char * length),
+            ],
+            base=header_class,
         )
         data_object = data_class()
         data_object.type_code = int.from_bytes(
@@ -251,7 +282,7 @@ class UUIDObject(StandardObject):
         return cls._object_c_type
 
     @classmethod
-    def from_python(cls, value: uuid.UUID):
+    def from_python(cls, value: uuid.UUID, *args, **kwargs):
         data_type = cls.build_c_type()
         data_object = data_type()
         data_object.type_code = int.from_bytes(
@@ -271,6 +302,11 @@ class UUIDObject(StandardObject):
             return None
         return uuid.UUID(bytes=bytes(ctypes_object.value))
 
+    @classmethod
+    def decode_not_null(cls, buffer: memoryview, offset: int):
+        end = offset + 16
+        return uuid.UUID(bytes=bytes(buffer[offset:end])), end
+
 
 class TimestampObject(StandardObject):
     """
@@ -306,7 +342,7 @@ class TimestampObject(StandardObject):
         return cls._object_c_type
 
     @classmethod
-    def from_python(cls, value: tuple):
+    def from_python(cls, value: tuple, *args, **kwargs):
         if value is None:
             return Null.from_python()
         data_type = cls.build_c_type()
@@ -331,6 +367,15 @@ class TimestampObject(StandardObject):
             ctypes_object.fraction
         )
 
+    @classmethod
+    def decode_not_null(cls, buffer: memoryview, offset: int):
+        decoder = c_struct(ctypes.c_longlong, ctypes.c_int)
+        epoch, fraction = decoder.unpack_from(buffer, offset)
+        return (
+            (datetime.fromtimestamp(epoch/1000), fraction),
+            offset + decoder.size,
+        )
+
 
 class DateObject(StandardObject):
     """
@@ -361,7 +406,7 @@ class DateObject(StandardObject):
         return cls._object_c_type
 
     @classmethod
-    def from_python(cls, value: [date, datetime]):
+    def from_python(cls, value: [date, datetime], *args, **kwargs):
         if value is None:
             return Null.from_python()
         if type(value) is date:
@@ -384,6 +429,14 @@ class DateObject(StandardObject):
             return None
         return datetime.fromtimestamp(ctypes_object.epoch/1000)
 
+    @classmethod
+    def decode_not_null(cls, buffer: memoryview, offset: int):
+        epoch = c_struct(ctypes.c_longlong).unpack_from(buffer, offset)[0]
+        return (
+            datetime.fromtimestamp(epoch/1000),
+            offset + ctypes.sizeof(ctypes.c_longlong),
+        )
+
 
 class TimeObject(StandardObject):
     """
@@ -413,7 +466,7 @@ class TimeObject(StandardObject):
         return cls._object_c_type
 
     @classmethod
-    def from_python(cls, value: timedelta):
+    def from_python(cls, value: timedelta, *args, **kwargs):
         if value is None:
             return Null.from_python()
         data_type = cls.build_c_type()
@@ -434,6 +487,14 @@ class TimeObject(StandardObject):
             return None
         return timedelta(milliseconds=ctypes_object.value)
 
+    @classmethod
+    def decode_not_null(cls, buffer: memoryview, offset: int):
+        value = c_struct(ctypes.c_longlong).unpack_from(buffer, offset)[0]
+        return (
+            timedelta(milliseconds=value),
+            offset + ctypes.sizeof(ctypes.c_longlong),
+        )
+
 
 class EnumObject(StandardObject):
     """
@@ -464,7 +525,7 @@ class EnumObject(StandardObject):
         return cls._object_c_type
 
     @classmethod
-    def from_python(cls, value: tuple):
+    def from_python(cls, value: tuple, *args, **kwargs):
         if value is None:
             return Null.from_python()
 
@@ -488,6 +549,11 @@ class EnumObject(StandardObject):
             return None
         return ctypes_object.type_id, ctypes_object.ordinal
 
+    @classmethod
+    def decode_not_null(cls, buffer: memoryview, offset: int):
+        decoder = c_struct(ctypes.c_int, ctypes.c_int)
+        return decoder.unpack_from(buffer, offset), offset + decoder.size
+
 
 class BinaryEnumObject(EnumObject):
     """
@@ -505,15 +571,11 @@ class StandardArray(IgniteDataType):
 
     @classmethod
     def build_header_class(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('length', ctypes.c_int),
+            ],
         )
 
     @classmethod
@@ -527,13 +589,10 @@ class StandardArray(IgniteDataType):
             buffer += buffer_fragment
             fields.append(('element_{}'.format(i), c_type))
 
-        final_class = type(
+        final_class = layout(
             cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
+            fields,
+            base=header_class,
         )
         return final_class, buffer
 
@@ -550,7 +609,19 @@ class StandardArray(IgniteDataType):
         return result
 
     @classmethod
-    def from_python(cls, value):
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        length = c_struct(ctypes.c_int).unpack_from(buffer, offset)[0]
+        offset += ctypes.sizeof(ctypes.c_int)
+        result = []
+        for i in range(length):
+            value, offset = cls.standard_type.decode(
+                buffer, offset, *args, **kwargs
+            )
+            result.append(value)
+        return result, offset
+
+    @classmethod
+    def from_python(cls, value, *args, **kwargs):
         header_class = cls.build_header_class()
         header = header_class()
         if hasattr(header, 'type_code'):
@@ -560,11 +631,11 @@ class StandardArray(IgniteDataType):
             )
         length = len(value)
         header.length = length
-        buffer = bytes(header)
+        buffer = bytearray(header)
 
         for x in value:
             buffer += cls.standard_type.from_python(x)
-        return buffer
+        return bytes(buffer)
 
 
 class StringArray(StandardArray):
@@ -605,18 +676,21 @@ class StandardArrayObject(StandardArray):
     pythonic = list
     default = []
 
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        # skip type code
+        return super().decode(
+            buffer, offset + ctypes.sizeof(ctypes.c_byte), *args, **kwargs
+        )
+
     @classmethod
     def build_header_class(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('length', ctypes.c_int),
+            ],
         )
 
 
@@ -668,21 +742,17 @@ class EnumArrayObject(StandardArrayObject):
 
     @classmethod
     def build_header_class(cls):
-        return type(
+        return layout(
             cls.__name__+'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('type_id', ctypes.c_int),
-                    ('length', ctypes.c_int),
-                ],
-            }
+            [
+                ('type_code', ctypes.c_byte),
+                ('type_id', ctypes.c_int),
+                ('length', ctypes.c_int),
+            ],
         )
 
     @classmethod
-    def from_python(cls, value):
+    def from_python(cls, value, *args, **kwargs):
         type_id, value = value
         header_class = cls.build_header_class()
         header = header_class()
@@ -694,17 +764,28 @@ class EnumArrayObject(StandardArrayObject):
         length = len(value)
         header.length = length
         header.type_id = type_id
-        buffer = bytes(header)
+        buffer = bytearray(header)
 
         for x in value:
             buffer += cls.standard_type.from_python(x)
-        return buffer
+        return bytes(buffer)
 
     @classmethod
     def to_python(cls, ctype_object, *args, **kwargs):
         type_id = ctype_object.type_id
         return type_id, super().to_python(ctype_object, *args, **kwargs)
 
+    @classmethod
+    def decode(cls, buffer: memoryview, offset: int, *args, **kwargs):
+        offset += ctypes.sizeof(ctypes.c_byte)
+        type_id = c_struct(ctypes.c_int).unpack_from(buffer, offset)[0]
+        offset += ctypes.sizeof(ctypes.c_int)
+        # type code is already skipped
+        result, offset = super(StandardArrayObject, cls).decode(
+            buffer, offset, *args, **kwargs
+        )
+        return (type_id, result), offset
+
 
 class BinaryEnumArrayObject(EnumArrayObject):
     standard_type = BinaryEnumObject
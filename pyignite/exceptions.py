@@ -78,3 +78,11 @@ class SQLError(CacheError):
     An error in SQL query.
     """
     pass
+
+
+class PoolTimeoutError(Exception):
+    """
+    This exception is raised, when no connection in the pool becomes
+    available within the checkout timeout.
+    """
+    pass
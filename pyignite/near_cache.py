@@ -0,0 +1,183 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `NearCache` class, a bounded in-process map
+of the recently read cache entries.
+
+The near cache is enabled per cache with
+:py:meth:`~pyignite.cache.Cache.with_near_cache`::
+
+    cache = client.get_or_create_cache('my cache').with_near_cache(
+        max_size=4096, ttl=30,
+    )
+    cache.get('hot key')  # server round trip
+    cache.get('hot key')  # served from the near cache
+    print(cache.near_cache.hits, cache.near_cache.misses)
+
+The entries are invalidated by the writes, that are done through the same
+client. The writes of other clients are not tracked, so the entries can be
+stale for up to `ttl` seconds.
+
+Each reader gets its own copy of a mutable value (a list, a dict,
+a Complex object), so that changing it does not change the value, that
+the other readers get. Immutable values (numbers, strings, dates, etc.)
+are shared.
+"""
+
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from threading import Lock
+from time import monotonic
+from typing import Any, Iterable, Tuple
+from uuid import UUID
+
+from .binary import RawBinaryObject
+
+
+__all__ = ['NearCache']
+
+
+# the values of these types can be shared by the readers
+IMMUTABLE_TYPES = frozenset([
+    type(None), bool, int, float, str, bytes, Decimal, UUID,
+    date, datetime, time, timedelta, RawBinaryObject,
+])
+
+
+def copy_value(value: Any) -> Any:
+    """
+    Copies the mutable value, so that the near cache and the readers
+    do not share it.
+
+    :param value: value,
+    :return: the value itself, if it is immutable, or its deep copy.
+    """
+    if type(value) in IMMUTABLE_TYPES:
+        return value
+    return deepcopy(value)
+
+
+class NearCache:
+    """
+    Serialized key → decoded value map with LRU eviction and optional
+    per-entry time to live. Thread-safe. The mutable values are copied,
+    when they are stored and looked up.
+
+    The counters are:
+
+    * `hits` − lookups, that found a live entry,
+    * `misses` − lookups, that did not,
+    * `evictions` − entries dropped to free space or due to expiration.
+    """
+
+    def __init__(self, max_size: int=1024, ttl: float=None):
+        """
+        :param max_size: (optional) maximum number of entries. Defaults
+         to 1024,
+        :param ttl: (optional) entry time to live, in seconds. Default is
+         None (entries are only evicted by size or invalidated).
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # the number of invalidations done, see `store`
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return '<{} size={}/{} hits={} misses={} evictions={}>'.format(
+            self.__class__.__name__, len(self), self.max_size,
+            self.hits, self.misses, self.evictions,
+        )
+
+    def lookup(self, key: bytes) -> Tuple[bool, Any]:
+        """
+        Looks up the entry and marks it as recently used.
+
+        :param key: serialized key,
+        :return: (True, value) if the live entry is found, (False, None)
+         otherwise. The value is a copy, if it is mutable.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                else:
+                    del self._entries[key]
+                    self.evictions += 1
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+        # the value is copied outside of the lock
+        return True, copy_value(value)
+
+    def store(self, key: bytes, value: Any, generation: int):
+        """
+        Stores the entry, that has been read from the server. The entry
+        is dropped, if there were invalidations since the read has
+        started, because the value can be already outdated.
+
+        :param key: serialized key,
+        :param value: value. It is copied, if it is mutable,
+        :param generation: the value of `generation`, taken before
+         the read.
+        """
+        expires = None
+        if self.ttl is not None:
+            expires = monotonic() + self.ttl
+        # the reader keeps the original
+        value = copy_value(value)
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = value, expires
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys: Iterable[bytes]=None):
+        """
+        Drops the entries.
+
+        :param keys: (optional) serialized keys. Defaults to all entries.
+        """
+        with self._lock:
+            self.generation += 1
+            if keys is None:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+
+    def reset_counters(self):
+        """
+        Sets the hit, miss and eviction counters to zero.
+        """
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,308 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `ClientPool` class, a thread-safe counterpart
+of :class:`~pyignite.client.Client`.
+
+A single `Client` owns one socket, so it can not be used by several
+threads at once. `ClientPool` has the same interface, but keeps a bounded
+set of connections and runs every query on a connection, that is not used
+by any other thread at the moment::
+
+    pool = ClientPool(pool_size=4)
+    pool.connect([('127.0.0.1', 10800), ('127.0.0.1', 10801)])
+    cache = pool.get_or_create_cache('my cache')
+    # the cache object can now be shared between threads
+"""
+
+import select
+from threading import Condition
+from time import monotonic
+from typing import Callable
+
+from .api.result import APIResult
+from .client import Client
+from .constants import *
+from .exceptions import ParameterError, PoolTimeoutError, SocketError
+from .queries import Query
+from .utils import is_iterable
+
+
+__all__ = ['ClientPool']
+
+
+class ClientPool(Client):
+    """
+    Thread-safe pool of connections to Ignite cluster.
+
+    Connections are created as needed, up to `pool_size`. A connection
+    is taken from the pool for each query and returned right after
+    the response is received. Cursors (`scan`, `select_row`, `sql`) hold
+    their connection until they are exhausted or closed, since their pages
+    can only be read from the node, that has opened them.
+
+    Broken connections are evicted when they are returned to the pool.
+    Idle connections are checked before they are taken, and the ones,
+    that have unread data, are evicted too. The connections, that have been
+    idle for a while, are also checked for being closed by the server.
+
+    All the connections share the binary type registry and the compact
+    footer state.
+    """
+
+    _nodes = None
+    _next_node = 0
+    _closed = True
+
+    def __init__(
+        self, pool_size: int=4, compact_footer: bool=None,
+        checkout_timeout: float=None, idle_check_interval: float=1.0,
+        **kwargs
+    ):
+        """
+        Initialize the pool. Accepts all the parameters of
+        :py:meth:`~pyignite.client.Client.__init__`, that are applied
+        to each connection.
+
+        :param pool_size: (optional) maximum number of connections.
+         Defaults to 4,
+        :param compact_footer: (optional) use compact (True, recommended) or
+         full (False) schema approach when serializing Complex objects,
+        :param checkout_timeout: (optional) time (in seconds) to wait for
+         a connection to become available. Default is None (wait forever),
+        :param idle_check_interval: (optional) time (in seconds), after which
+         an idle connection is polled for being closed by the server, before
+         it is taken. The connections, that have been used more recently,
+         are taken without a system call. Defaults to 1 second.
+        """
+        if pool_size < 1:
+            raise ParameterError('Pool size must be positive.')
+        super().__init__(compact_footer, **kwargs)
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.idle_check_interval = idle_check_interval
+        self._conn_kwargs = dict(
+            kwargs, compact_footer=compact_footer,
+            binary_type_store=self.binary_type_store,
+        )
+        self._lock = Condition()
+        self._idle = []
+        self._size = 0
+
+    def __repr__(self) -> str:
+        if self._closed:
+            return '<not connected>'
+        return ', '.join(
+            '{}:{}'.format(host, port) for host, port in self._nodes
+        )
+
+    @property
+    def compact_footer(self) -> bool:
+        """
+        Complex object schema encoding approach, shared with the pooled
+        connections. See :py:attr:`~pyignite.client.Client.compact_footer`.
+        """
+        return Client._compact_footer or Client._compact_footer is None
+
+    @compact_footer.setter
+    def compact_footer(self, value: bool):
+        if Client._compact_footer not in (value, None):
+            raise Warning('Can not change client schema approach.')
+        else:
+            Client._compact_footer = value
+
+    def connect(self, *args):
+        """
+        Connect to the server. Connection parameters may be either one node
+        (host and port), or list (or other iterable) of nodes. Each new
+        connection starts with the next node in the list and fails over
+        to the others, so the connections are spread over the nodes.
+
+        :param host: Ignite server host,
+        :param port: Ignite server port,
+        :param nodes: iterable of (host, port) tuples.
+        """
+        if len(args) == 0:
+            nodes = [(IGNITE_DEFAULT_HOST, IGNITE_DEFAULT_PORT)]
+        elif len(args) == 1 and is_iterable(args[0]):
+            nodes = list(args[0])
+        elif (
+            len(args) == 2
+            and isinstance(args[0], str)
+            and isinstance(args[1], int)
+        ):
+            nodes = [args]
+        else:
+            raise ConnectionError('Connection parameters are not valid.')
+        if not nodes:
+            raise ConnectionError('Connection parameters are not valid.')
+
+        with self._lock:
+            self._nodes = nodes
+            self._next_node = 0
+            self._closed = False
+        # make sure that the cluster is reachable
+        self.checkin(self.checkout())
+
+    def _create_connection(self, first_node: int) -> Client:
+        nodes = self._nodes[first_node:] + self._nodes[:first_node]
+        conn = Client(**self._conn_kwargs)
+        conn._owner = self
+        try:
+            conn.connect(nodes)
+        except OSError:
+            conn._reconnect()
+        return conn
+
+    def _is_healthy(self, conn: Client) -> bool:
+        """
+        Checks the idle connection.
+
+        :param conn: connection object,
+        :return: True if the connection can be used.
+        """
+        sock = conn._socket
+        if sock is None or conn.prefetch:
+            return False
+        if conn._buffer_end > conn._buffer_pos:
+            return False
+        if monotonic() - conn._idle_since < self.idle_check_interval:
+            # a connection, that has just been used, is not polled, so that
+            # the queries do not pay for a system call each
+            return True
+        # there is nothing to read from an idle connection, unless
+        # the server has closed it or a response is left unread
+        try:
+            if hasattr(sock, 'pending') and sock.pending():
+                return False
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def _discard(self, conn: Client):
+        """
+        Closes the connection and frees its place in the pool. Must be
+        called with the pool lock held.
+        """
+        self._size -= 1
+        self._lock.notify()
+        if conn._socket is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def checkout(self) -> Client:
+        """
+        Takes an idle connection from the pool, or creates a new one,
+        if the pool is not full. Waits for a connection to be returned
+        otherwise.
+
+        :return: :class:`~pyignite.client.Client` object.
+        """
+        deadline = None
+        if self.checkout_timeout is not None:
+            deadline = monotonic() + self.checkout_timeout
+
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise SocketError('Connection pool is closed.')
+                while self._idle:
+                    conn = self._idle.pop()
+                    if self._is_healthy(conn):
+                        return conn
+                    self._discard(conn)
+                if self._size < self.pool_size:
+                    break
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - monotonic()
+                    if timeout <= 0:
+                        raise PoolTimeoutError(
+                            'No connection is available in the pool.'
+                        )
+                self._lock.wait(timeout)
+
+            self._size += 1
+            first_node = self._next_node
+            self._next_node = (first_node + 1) % len(self._nodes)
+
+        try:
+            return self._create_connection(first_node)
+        except Exception:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+
+    def checkin(self, conn: Client):
+        """
+        Returns the connection to the pool. Broken connections are closed
+        and evicted.
+
+        :param conn: connection, that has been taken with
+         :py:meth:`~pyignite.pool.ClientPool.checkout`.
+        """
+        with self._lock:
+            if self._closed or conn._socket is None:
+                self._discard(conn)
+            else:
+                conn._idle_since = monotonic()
+                self._idle.append(conn)
+                self._lock.notify()
+
+    def defer_query(
+        self, query_id: int, send_buffer: bytes, response_struct: 'Response',
+        post_process: Callable=None,
+    ) -> APIResult:
+        """
+        Called by :py:meth:`~pyignite.queries.Query.perform`. Runs the query
+        on a connection from the pool.
+
+        :return: API result data object.
+        """
+        conn = self.checkout()
+        try:
+            return Query.exchange(
+                conn, send_buffer, response_struct, post_process
+            )
+        finally:
+            self.checkin(conn)
+
+    def clone(self, prefetch: bytes=b'') -> Client:
+        """
+        Clones one of the pooled connections.
+
+        :return: :class:`~pyignite.client.Client` object.
+        """
+        conn = self.checkout()
+        try:
+            return conn.clone(prefetch)
+        finally:
+            self.checkin(conn)
+
+    def close(self):
+        """
+        Close all the connections. The connections, that are in use,
+        are closed when they are returned to the pool.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for conn in idle:
+                self._discard(conn)
@@ -0,0 +1,218 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `CursorPages` class, that reads the pages of a scan
+or SQL cursor ahead of the consumer.
+
+The read-ahead is enabled with the `prefetch` argument of
+:py:meth:`~pyignite.cache.Cache.scan`,
+:py:meth:`~pyignite.cache.Cache.select_row`
+and :py:meth:`~pyignite.client.Client.sql`::
+
+    for k, v in cache.scan(page_size=1024, prefetch=2):
+        process(k, v)  # the next pages are being read meanwhile
+
+The pages are read by a helper thread, that owns the connection
+of the cursor, so the cursor needs a connection of its own: one
+of the pooled connections with :class:`~pyignite.pool.ClientPool`, or
+a clone of the `Client` connection.
+
+The thread is started, when the result is first iterated over. The thread
+is stopped, and the connection is returned, when the result is read till
+the end, closed, or garbage-collected. The cursor, that has not been read
+till the end, is closed with the next query on its connection, or with
+the connection itself, if it is a clone.
+"""
+
+from queue import Empty, Queue
+from threading import Event, Thread
+from typing import Callable, Generator
+from weakref import finalize
+
+from .api.result import APIResult
+from .api.sql import resource_close
+from .exceptions import ReconnectError
+
+
+__all__ = ['CursorPages']
+
+
+def close_cursor(conn: 'Client', cursor: int):
+    """
+    Closes the cursor, that has not been read till the end, on the server.
+    It is done on the way out of an error or an abandoned iteration, so
+    the connection errors are ignored.
+
+    :param conn: connection, that has opened the cursor,
+    :param cursor: cursor ID.
+    """
+    try:
+        resource_close(conn, cursor)
+    except (OSError, ReconnectError):
+        pass
+
+
+def cursor_checkout(client: 'Client', prefetch: int=0) -> 'Client':
+    """
+    Takes the connection to open a cursor on.
+
+    :param client: client or connection pool,
+    :param prefetch: (optional) read-ahead depth. The connection
+     of the client can not be shared with the helper thread, so it is
+     cloned, if the depth is not zero,
+    :return: connection.
+    """
+    conn = client.checkout()
+    if prefetch and conn is client:
+        conn = client.clone()
+        # the clone is closed with the cursor
+        conn._owner = client
+    return conn
+
+
+def cursor_checkin(client: 'Client', conn: 'Client'):
+    """
+    Returns the connection, that has been taken with `cursor_checkout`.
+
+    :param client: client or connection pool,
+    :param conn: connection.
+    """
+    if conn is client or hasattr(client, 'pool_size'):
+        client.checkin(conn)
+    else:
+        conn.close()
+
+
+class CursorPages:
+    """
+    Iterable of the cursor pages, that follow the first one. Yields
+    the API results of the page queries and stops after the last page
+    or the first error.
+
+    With non-zero `depth`, up to `depth` pages are read ahead by
+    the helper thread, that is started by `start`, so the next pages
+    are received, while the current one is being processed.
+
+    The pages own the cursor and its connection: `close` queues
+    the cursor, if it has not been read till the end, to be closed with
+    the next query on the connection, and returns the connection.
+    """
+
+    def __init__(
+        self, conn: 'Client', cursor: int,
+        get_page: Callable[['Client', int], APIResult], more: bool,
+        depth: int=0, release: Callable[[], None]=None,
+    ):
+        """
+        :param conn: connection, that has opened the cursor,
+        :param cursor: cursor ID,
+        :param get_page: function, that takes the connection and the cursor
+         ID, and queries the next page,
+        :param more: whether the first page is not the last one,
+        :param depth: (optional) number of pages to read ahead. Defaults
+         to 0 (read each page, when it is requested),
+        :param release: (optional) function, that returns the connection.
+        """
+        self.conn = conn
+        self.cursor = cursor
+        self.get_page = get_page
+        self.more = more
+        self.depth = depth
+        self.release = release
+        # whether the cursor is still open on the server
+        self._open = more
+        self._closed = False
+        self._pages = None
+        self._thread = None
+        self._stop = Event()
+
+    def __iter__(self):
+        while self.more:
+            if self._thread is None:
+                result = self._get_page()
+            else:
+                result = self._pages.get()
+                if isinstance(result, Exception):
+                    self.more = False
+                    raise result
+            self.more = result.status == 0 and result.value['more']
+            yield result
+
+    def _get_page(self) -> APIResult:
+        result = self.get_page(self.conn, self.cursor)
+        if result.status == 0 and not result.value['more']:
+            # the server closes the cursor with its last page
+            self._open = False
+        return result
+
+    def _read_ahead(self):
+        try:
+            more = True
+            while more and not self._stop.is_set():
+                result = self._get_page()
+                more = result.status == 0 and result.value['more']
+                self._pages.put(result)
+        except Exception as e:
+            self._pages.put(e)
+
+    def start(self):
+        """
+        Starts the helper thread, if the pages are read ahead.
+        """
+        if self.depth and self.more and self._thread is None:
+            self._pages = Queue(self.depth)
+            self._thread = Thread(target=self._read_ahead, daemon=True)
+            self._thread.start()
+
+    def attach(self, generator: Generator) -> Generator:
+        """
+        Makes the pages be closed, when the generator, that reads them,
+        is garbage-collected, even if it has never been started.
+
+        :param generator: generator of the query results,
+        :return: the same generator.
+        """
+        finalize(generator, self.close)
+        return generator
+
+    def close(self):
+        """
+        Stops the helper thread, queues the cursor to be closed, if it
+        has not been read till the end, and returns the connection. Does
+        nothing, if the pages are already closed.
+
+        No query is sent here: the pages may be closed by the garbage
+        collector, which can run, while another query is in progress
+        on the same connection.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.more = False
+        if self._thread is not None:
+            self._stop.set()
+            while self._thread.is_alive():
+                # unblock the thread, that waits for the room to put a page
+                try:
+                    while True:
+                        self._pages.get_nowait()
+                except Empty:
+                    pass
+                self._thread.join(0.01)
+        if self._open:
+            self.conn.defer_cursor_close(self.cursor)
+        if self.release is not None:
+            self.release()
@@ -21,25 +21,57 @@ used internally by :mod:`pyignite.api` module. They, in turn, based on
 :mod:`pyignite.datatypes` binary parser/generator classes.
 """
 
+from array import array
 from collections import OrderedDict
 import ctypes
 from random import randint
+from typing import Callable
 
 import attr
 
 from pyignite.api.result import APIResult
+from pyignite.connection.reader import BufferReader
 from pyignite.constants import *
 from pyignite.datatypes import (
     AnyDataObject, Bool, Int, Long, String, StringArray, Struct,
 )
+from pyignite.datatypes.binary import body_struct, enum_struct, schema_struct
+from pyignite.datatypes.type_codes import *
+from pyignite.utils import c_struct, layout
 from .op_codes import *
 
 
+# fixed-width cell types, that are collected into typed columns:
+# type code → (`array.array` type code, decoder)
+COLUMN_TYPES = {
+    int.from_bytes(type_code, byteorder=PROTOCOL_BYTE_ORDER): (
+        array_type_code, c_struct(c_type),
+    )
+    for type_code, array_type_code, c_type in [
+        (TC_BYTE, 'b', ctypes.c_byte),
+        (TC_SHORT, 'h', ctypes.c_short),
+        (TC_INT, 'i', ctypes.c_int),
+        (TC_LONG, 'q', ctypes.c_longlong),
+        (TC_FLOAT, 'f', ctypes.c_float),
+        (TC_DOUBLE, 'd', ctypes.c_double),
+        (TC_BOOL, 'B', ctypes.c_bool),
+    ]
+}
+
+
 @attr.s
 class Response:
     following = attr.ib(type=list, factory=list)
     _response_header = None
 
+    @property
+    def single_pass(self) -> bool:
+        """
+        True if the response can only be decoded in a single pass
+        (see :py:meth:`decode`).
+        """
+        return False
+
     def __attrs_post_init__(self):
         # replace None with empty list
         self.following = self.following or []
@@ -77,13 +109,10 @@ class Response:
             buffer += buffer_fragment
             fields.append(('error_message', c_type))
 
-        response_class = type(
+        response_class = layout(
             'Response',
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
+            fields,
+            base=header_class,
         )
         return response_class, buffer
 
@@ -98,6 +127,39 @@ class Response:
 
         return result if result else None
 
+    def decode(self, buffer: memoryview, client: 'Client'=None) -> APIResult:
+        """
+        Decodes the response frame in a single pass, reading values directly
+        from buffer offsets, without building intermediate ctypes objects.
+
+        :param buffer: the whole response frame, including its length,
+        :param client: (optional) connection to Ignite server, used to look up
+         binary types,
+        :return: instance of :class:`~pyignite.api.result.APIResult`.
+        """
+        header_decoder = c_struct(
+            ctypes.c_int, ctypes.c_longlong, ctypes.c_int
+        )
+        _, query_id, status_code = header_decoder.unpack_from(buffer, 0)
+        offset = header_decoder.size
+
+        if status_code != OP_SUCCESS:
+            message, _ = String.decode(buffer, offset)
+            return APIResult.from_values(status_code, query_id, message)
+
+        value, _ = self.decode_body(buffer, offset, client)
+        return APIResult.from_values(status_code, query_id, value=value)
+
+    def decode_body(self, buffer: memoryview, offset: int, *args, **kwargs):
+        result = OrderedDict()
+
+        for name, ignite_type in self.following:
+            result[name], offset = ignite_type.decode(
+                buffer, offset, *args, **kwargs
+            )
+
+        return (result if result else None), offset
+
 
 @attr.s
 class SQLResponse(Response):
@@ -109,6 +171,15 @@ class SQLResponse(Response):
     """
     include_field_names = attr.ib(type=bool, default=False)
     has_cursor = attr.ib(type=bool, default=False)
+    # cursor pages do not hold the fields, so their number is given
+    field_count = attr.ib(type=int, default=None)
+    # return the data as a list of columns instead of a list of rows
+    columnar = attr.ib(type=bool, default=False)
+
+    @property
+    def single_pass(self) -> bool:
+        # typed columns are built from the binary data
+        return self.columnar
 
     def fields_or_field_count(self):
         if self.include_field_names:
@@ -122,17 +193,18 @@ class SQLResponse(Response):
         fields = []
 
         if header.status_code == OP_SUCCESS:
-            following = [
-                self.fields_or_field_count(),
-                ('row_count', Int),
-            ]
+            following = [('row_count', Int)]
+            if self.field_count is None:
+                following.insert(0, self.fields_or_field_count())
             if self.has_cursor:
                 following.insert(0, ('cursor', Long))
             body_struct = Struct(following)
             body_class, body_buffer = body_struct.parse(client)
             body = body_class.from_buffer_copy(body_buffer)
 
-            if self.include_field_names:
+            if self.field_count is not None:
+                field_count = self.field_count
+            elif self.include_field_names:
                 field_count = body.fields.length
             else:
                 field_count = body.field_count
@@ -147,24 +219,16 @@ class SQLResponse(Response):
                     row_fields.append(('column_{}'.format(j), field_class))
                     row_buffer += field_buffer
 
-                row_class = type(
+                row_class = layout(
                     'SQLResponseRow',
-                    (ctypes.LittleEndianStructure,),
-                    {
-                        '_pack_': 1,
-                        '_fields_': row_fields,
-                    }
+                    row_fields,
                 )
                 data_fields.append(('row_{}'.format(i), row_class))
                 data_buffer += row_buffer
 
-            data_class = type(
+            data_class = layout(
                 'SQLResponseData',
-                (ctypes.LittleEndianStructure,),
-                {
-                    '_pack_': 1,
-                    '_fields_': data_fields,
-                }
+                data_fields,
             )
             fields += body_class._fields_ + [
                 ('data', data_class),
@@ -176,13 +240,10 @@ class SQLResponse(Response):
             buffer += buffer_fragment
             fields.append(('error_message', c_type))
 
-        final_class = type(
+        final_class = layout(
             'SQLResponse',
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
+            fields,
+            base=header_class,
         )
         buffer += client.recv(ctypes.sizeof(final_class) - len(buffer))
         return final_class, buffer
@@ -199,7 +260,7 @@ class SQLResponse(Response):
                 result['fields'] = StringArray.to_python(
                     ctype_object.fields, *args, **kwargs
                 )
-            else:
+            elif hasattr(ctype_object, 'field_count'):
                 result['field_count'] = Int.to_python(
                     ctype_object.field_count, *args, **kwargs
                 )
@@ -220,6 +281,181 @@ class SQLResponse(Response):
                 result['data'].append(row)
             return result
 
+    def decode_body(self, buffer: memoryview, offset: int, *args, **kwargs):
+        cursor = None
+        if self.has_cursor:
+            cursor, offset = Long.decode(buffer, offset)
+        if self.field_count is not None:
+            field_count = self.field_count
+        elif self.include_field_names:
+            fields, offset = StringArray.decode(buffer, offset)
+            field_count = len(fields)
+        else:
+            field_count, offset = Int.decode(buffer, offset)
+        row_count, offset = Int.decode(buffer, offset)
+
+        if self.columnar:
+            data, type_codes, offset = self.decode_columns(
+                buffer, offset, row_count, field_count, *args, **kwargs
+            )
+        else:
+            data = []
+            for i in range(row_count):
+                row = []
+                for j in range(field_count):
+                    value, offset = AnyDataObject.decode(
+                        buffer, offset, *args, **kwargs
+                    )
+                    row.append(value)
+                data.append(row)
+        more, offset = Bool.decode(buffer, offset)
+
+        result = {
+            'more': more,
+            'data': data,
+        }
+        if self.columnar:
+            result['type_codes'] = type_codes
+        # cursor pages do not repeat the fields
+        if self.field_count is None:
+            if self.include_field_names:
+                result['fields'] = fields
+            else:
+                result['field_count'] = field_count
+        if self.has_cursor:
+            result['cursor'] = cursor
+        return result, offset
+
+    @staticmethod
+    def decode_columns(
+        buffer: memoryview, offset: int, row_count: int, field_count: int,
+        *args, **kwargs
+    ) -> tuple:
+        """
+        Decodes the rows of the SQL response into columns. The columns
+        of the numeric and boolean types are collected into
+        `array.array` objects, other columns, or the columns with nulls
+        or mixed types, are lists.
+
+        :param buffer: response frame,
+        :param offset: position of the first row,
+        :param row_count: number of rows,
+        :param field_count: number of columns,
+        :return: list of columns, list of the type codes of the first
+         non-null value in each column (None if there is none), and
+         the position after the last row.
+        """
+        columns = [[] for _ in range(field_count)]
+        type_codes = [None] * field_count
+        # (type code, decoder) of each typed column
+        column_types = [None] * field_count
+        null_code = int.from_bytes(TC_NULL, byteorder=PROTOCOL_BYTE_ORDER)
+
+        for i in range(row_count):
+            for j in range(field_count):
+                type_code = buffer[offset]
+                if type_codes[j] is None and type_code != null_code:
+                    type_codes[j] = type_code
+                column_type = column_types[j]
+                if column_type is not None and column_type[0] == type_code:
+                    value = column_type[1].unpack_from(buffer, offset + 1)[0]
+                    columns[j].append(value)
+                    offset += column_type[1].size + 1
+                    continue
+
+                if i == 0 and type_code in COLUMN_TYPES:
+                    array_type_code, decoder = COLUMN_TYPES[type_code]
+                    column_types[j] = type_code, decoder
+                    columns[j] = array(array_type_code)
+                    value = decoder.unpack_from(buffer, offset + 1)[0]
+                    columns[j].append(value)
+                    offset += decoder.size + 1
+                    continue
+
+                if column_type is not None:
+                    # the type of the column is not consistent
+                    column_types[j] = None
+                    columns[j] = columns[j].tolist()
+                value, offset = AnyDataObject.decode(
+                    buffer, offset, *args, **kwargs
+                )
+                columns[j].append(value)
+
+        return columns, type_codes, offset
+
+
+@attr.s
+class BinaryTypeResponse(Response):
+    """
+    The response to the binary type query. The presence of its parts depends
+    on whether the type exists and whether it is an enum.
+    """
+
+    def __attrs_post_init__(self):
+        self.following = [('type_exists', Bool)]
+
+    def parse(self, client: 'Client'):
+        response_class, buffer = super().parse(client)
+        response = response_class.from_buffer_copy(buffer)
+        if response.status_code != OP_SUCCESS or not response.type_exists:
+            return response_class, buffer
+
+        fields = []
+        body_class, body_buffer = body_struct.parse(client)
+        fields.append(('body', body_class))
+        buffer += body_buffer
+        if body_class.from_buffer_copy(body_buffer).is_enum:
+            enum_class, enum_buffer = enum_struct.parse(client)
+            fields.append(('enums', enum_class))
+            buffer += enum_buffer
+        schema_class, schema_buffer = schema_struct.parse(client)
+        fields.append(('schema', schema_class))
+        buffer += schema_buffer
+
+        final_class = layout(
+            'GetBinaryTypeResponse',
+            fields,
+            base=response_class,
+        )
+        return final_class, buffer
+
+    @staticmethod
+    def convert_schema(schema: list) -> dict:
+        return {
+            x['schema_id']: [
+                z['schema_field_id'] for z in x['schema_fields']
+            ]
+            for x in schema
+        }
+
+    def to_python(self, ctype_object, *args, **kwargs):
+        result = {
+            'type_exists': ctype_object.type_exists
+        }
+        if hasattr(ctype_object, 'body'):
+            result.update(body_struct.to_python(ctype_object.body))
+        if hasattr(ctype_object, 'enums'):
+            result['enums'] = enum_struct.to_python(ctype_object.enums)
+        if hasattr(ctype_object, 'schema'):
+            result['schema'] = self.convert_schema(
+                schema_struct.to_python(ctype_object.schema)
+            )
+        return result
+
+    def decode_body(self, buffer: memoryview, offset: int, *args, **kwargs):
+        type_exists, offset = Bool.decode(buffer, offset)
+        result = {
+            'type_exists': type_exists
+        }
+        if type_exists:
+            body, offset = body_struct.decode(buffer, offset)
+            result.update(body)
+            if body['is_enum']:
+                result['enums'], offset = enum_struct.decode(buffer, offset)
+            schema, offset = schema_struct.decode(buffer, offset)
+            result['schema'] = self.convert_schema(schema)
+        return result, offset
+
 
 @attr.s
 class Query:
@@ -245,50 +481,94 @@ class Query:
             )
         return cls._query_c_type
 
-    def from_python(self, values: dict=None):
+    def from_python(self, values: dict=None, client: 'Client'=None):
         if values is None:
             values = {}
-        buffer = b''
 
         header_class = self.build_c_type()
         header = header_class()
         header.op_code = self.op_code
         if self.query_id is None:
             header.query_id = randint(MIN_LONG, MAX_LONG)
+        else:
+            header.query_id = self.query_id
 
+        # reserve space for the header and fill it in when the length
+        # of the query is known
+        buffer = bytearray(ctypes.sizeof(header_class))
         for name, c_type in self.following:
-            buffer += c_type.from_python(values[name])
+            buffer += c_type.from_python(values[name], client)
 
-        header.length = (
-            len(buffer)
-            + ctypes.sizeof(header_class)
-            - ctypes.sizeof(ctypes.c_int)
-        )
-        return header.query_id, bytes(header) + buffer
+        header.length = len(buffer) - ctypes.sizeof(ctypes.c_int)
+        buffer[:ctypes.sizeof(header_class)] = bytes(header)
+        return header.query_id, buffer
 
     def perform(
         self, conn: 'Connection', query_params: dict=None,
-        response_config: list=None,
+        response_config: list=None, response_struct: Response=None,
+        post_process: Callable=None,
     ) -> APIResult:
         """
         Perform query and process result.
 
-        :param conn: connection to Ignite server,
+        :param conn: connection to Ignite server, or an object, that defers
+         the query, like :class:`~pyignite.queries.pipeline.Pipeline`.
+         Such objects implement `defer_query` method, the return value
+         of which is returned as-is,
         :param query_params: (optional) dict of named query parameters.
          Defaults to no parameters,
         :param response_config: (optional) response configuration − list of
          (name, type_hint) tuples. Defaults to empty return value,
+        :param response_struct: (optional) response object, that is used
+         instead of the one built from `response_config`,
+        :param post_process: (optional) function to apply to the value
+         of the successful result,
         :return: instance of :class:`~pyignite.api.result.APIResult` with raw
          value (may undergo further processing in API functions).
         """
-        _, send_buffer = self.from_python(query_params)
+        # the connection is also the serialization context
+        # of the Complex objects
+        query_id, send_buffer = self.from_python(query_params, conn)
+        if response_struct is None:
+            response_struct = Response(response_config)
+        if hasattr(conn, 'defer_query'):
+            return conn.defer_query(
+                query_id, send_buffer, response_struct, post_process
+            )
+        return self.exchange(conn, send_buffer, response_struct, post_process)
+
+    @staticmethod
+    def exchange(
+        conn: 'Connection', send_buffer: bytes, response_struct: Response,
+        post_process: Callable=None,
+    ) -> APIResult:
+        """
+        Send the serialized query and receive its response.
+
+        :param conn: connection to Ignite server,
+        :param send_buffer: serialized query,
+        :param response_struct: response object,
+        :param post_process: (optional) function to apply to the value
+         of the successful result,
+        :return: instance of :class:`~pyignite.api.result.APIResult`.
+        """
+        if conn._deferred_cursors:
+            conn.close_deferred_cursors()
         conn.send(send_buffer)
-        response_struct = Response(response_config)
-        response_ctype, recv_buffer = response_struct.parse(conn)
-        response = response_ctype.from_buffer_copy(recv_buffer)
-        result = APIResult(response)
-        if result.status == 0:
-            result.value = response_struct.to_python(response)
+        if conn.single_pass_decoding or response_struct.single_pass:
+            result = response_struct.decode(conn.recv_frame(), conn)
+        else:
+            # parse the whole frame from memory, so that the binary types
+            # can be queried using the same connection
+            response_ctype, recv_buffer = response_struct.parse(
+                BufferReader(conn, conn.recv_frame())
+            )
+            response = response_ctype.from_buffer_copy(recv_buffer)
+            result = APIResult(response)
+            if result.status == 0:
+                result.value = response_struct.to_python(response)
+        if result.status == 0 and post_process is not None:
+            result.value = post_process(result.value)
         return result
 
 
@@ -316,24 +596,23 @@ class ConfigQuery(Query):
             )
         return cls._query_c_type
 
-    def from_python(self, values: dict = None):
+    def from_python(self, values: dict=None, client: 'Client'=None):
         if values is None:
             values = {}
-        buffer = b''
 
         header_class = self.build_c_type()
         header = header_class()
         header.op_code = self.op_code
         if self.query_id is None:
             header.query_id = randint(MIN_LONG, MAX_LONG)
+        else:
+            header.query_id = self.query_id
 
+        buffer = bytearray(ctypes.sizeof(header_class))
         for name, c_type in self.following:
-            buffer += c_type.from_python(values[name])
+            buffer += c_type.from_python(values[name], client)
 
-        header.length = (
-            len(buffer)
-            + ctypes.sizeof(header_class)
-            - ctypes.sizeof(ctypes.c_int)
-        )
+        header.length = len(buffer) - ctypes.sizeof(ctypes.c_int)
         header.config_length = header.length - ctypes.sizeof(header_class)
-        return header.query_id, bytes(header) + buffer
+        buffer[:ctypes.sizeof(header_class)] = bytes(header)
+        return header.query_id, buffer
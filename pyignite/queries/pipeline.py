@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `Pipeline` class, that sends several queries
+back-to-back and then matches their responses by query ID. This way
+the round-trip latency is paid once per batch instead of once per query.
+"""
+
+import ctypes
+from typing import Callable, Type
+
+from pyignite.api.result import APIResult
+from pyignite.exceptions import ParameterError, ParseError
+from pyignite.utils import c_struct
+
+
+__all__ = ['Pipeline']
+
+
+class Pipeline:
+    """
+    Queue of queries to be sent over the same connection in one batch.
+
+    Pass the pipeline object instead of the connection to the API functions,
+    that support pipelining (:py:func:`~pyignite.api.key_value.cache_get`,
+    :py:func:`~pyignite.api.key_value.cache_put`,
+    :py:func:`~pyignite.api.key_value.cache_contains_key`). Each of them
+    returns an empty :class:`~pyignite.api.result.APIResult`, that is filled
+    in by :py:meth:`execute`.
+
+    Responses are always decoded with the single-pass decoder, after all
+    of them are received.
+    """
+
+    def __init__(self, conn: 'Connection'):
+        """
+        :param conn: connection to Ignite server.
+        """
+        self.conn = conn
+        self.buffer = bytearray()
+        self.queue = []
+        self.query_ids = set()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    @property
+    def compact_footer(self) -> bool:
+        return self.conn.compact_footer
+
+    def ensure_binary_type(self, data_class: Type):
+        """
+        Registers the Complex object class through the connection, so that
+        the objects of this class can be put in the pipeline.
+
+        :param data_class: Complex object class.
+        """
+        self.conn.ensure_binary_type(data_class)
+
+    def defer_query(
+        self, query_id: int, send_buffer: bytes, response_struct: 'Response',
+        post_process: Callable=None,
+    ) -> APIResult:
+        """
+        Add the serialized query to the pipeline.
+
+        :param query_id: query ID, must be unique within the pipeline,
+        :param send_buffer: serialized query,
+        :param response_struct: response object to decode the result with,
+        :param post_process: (optional) function to apply to the value
+         of the successful result,
+        :return: API result data object, that holds no status or value
+         until the pipeline is executed.
+        """
+        if query_id in self.query_ids:
+            raise ParameterError(
+                'Duplicate query ID in pipeline: {}'.format(query_id)
+            )
+        self.query_ids.add(query_id)
+        result = APIResult.from_values(None, query_id)
+        self.buffer += send_buffer
+        self.queue.append((query_id, response_struct, post_process, result))
+        return result
+
+    def execute(self) -> list:
+        """
+        Send all the queued queries, receive and decode their responses.
+        The pipeline is empty afterwards and can be reused.
+
+        :return: list of API results in the order the queries were added.
+        """
+        queue, buffer = self.queue, self.buffer
+        self.queue, self.buffer = [], bytearray()
+        self.query_ids = set()
+        if not queue:
+            return []
+
+        conn = self.conn.checkout()
+        try:
+            return self._exchange(conn, buffer, queue)
+        finally:
+            self.conn.checkin(conn)
+
+    @staticmethod
+    def _exchange(conn: 'Connection', buffer: bytes, queue: list) -> list:
+        if conn._deferred_cursors:
+            conn.close_deferred_cursors()
+        conn.send(buffer)
+
+        # receive all the frames first, so that the binary types can be
+        # looked up over the same connection while decoding
+        id_decoder = c_struct(ctypes.c_longlong)
+        frames = {}
+        for _ in queue:
+            frame = conn.recv_frame()
+            query_id = id_decoder.unpack_from(
+                frame, ctypes.sizeof(ctypes.c_int)
+            )[0]
+            frames[query_id] = frame
+
+        results = []
+        for query_id, response_struct, post_process, result in queue:
+            try:
+                frame = frames[query_id]
+            except KeyError:
+                raise ParseError(
+                    'No response to query {} is received'.format(query_id)
+                ) from None
+            response = response_struct.decode(frame, conn)
+            if response.status == 0 and post_process is not None:
+                response.value = post_process(response.value)
+            result.__dict__.update(response.__dict__)
+            results.append(result)
+        return results
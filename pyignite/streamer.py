@@ -0,0 +1,305 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `DataStreamer` class, that loads large amounts
+of data into a cache::
+
+    with cache.streamer(batch_size=4096) as streamer:
+        for key, value in source:
+            streamer.add(key, value)
+    print(streamer.loaded, streamer.throughput)
+
+The entries are serialized as they are added, and are sent in `put_all`
+batches. With :class:`~pyignite.pool.ClientPool`, several batches are sent
+at once over the pooled connections, while the caller keeps adding
+the entries.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Iterable, Union
+
+from .datatypes import Byte, Int
+from .datatypes.internal import infer_from_python
+from .exceptions import CacheError, ParameterError
+from .queries import Query
+from .queries.op_codes import OP_CACHE_PUT_ALL
+
+
+__all__ = ['DataStreamer']
+
+
+class SerializedPairs:
+    """
+    `Map` payload of the key-value pairs, that are already serialized.
+    Its Python value is (number of pairs, serialized pairs) tuple.
+    """
+
+    @staticmethod
+    def from_python(value: tuple, *args, **kwargs) -> bytes:
+        length, data = value
+        return Int.from_python(length) + data
+
+
+class DataStreamer:
+    """
+    Buffers the entries and loads them into the cache in batches.
+
+    A batch is sent when it reaches `batch_size` entries or `batch_bytes`
+    bytes. Up to `max_in_flight` batches are sent at once; `add` blocks
+    while the limit is reached, so the memory use is bounded.
+
+    The order, in which the batches are applied, is not kept, so a key,
+    that is added more than once, may end up with any of its values.
+
+    The errors of the background batches are raised by the next call
+    of `add`, `flush` or `close`.
+    """
+
+    def __init__(
+        self, cache: 'Cache', batch_size: int=1024, batch_bytes: int=4 << 20,
+        max_in_flight: int=None,
+    ):
+        """
+        :param cache: cache to load the data into,
+        :param batch_size: (optional) maximum number of entries in a batch.
+         Defaults to 1024,
+        :param batch_bytes: (optional) maximum size of a batch in bytes
+         (exceeded by at most one entry). Defaults to 4 MiB,
+        :param max_in_flight: (optional) maximum number of batches, that are
+         sent at once. Defaults to the pool size of
+         :class:`~pyignite.pool.ClientPool`, or to 1 for other clients.
+         A `Client` sends the batches in the calling thread, one at a time.
+        """
+        client = cache.client
+        pooled = hasattr(client, 'pool_size')
+        if max_in_flight is None:
+            max_in_flight = client.pool_size if pooled else 1
+        if batch_size < 1 or batch_bytes < 1 or max_in_flight < 1:
+            raise ParameterError(
+                'Batch size and the number of batches must be positive.'
+            )
+        if max_in_flight > 1 and not pooled:
+            raise ParameterError(
+                'Only a connection pool can send several batches at once.'
+            )
+
+        self.cache = cache
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.max_in_flight = max_in_flight
+        # the numbers of entries added, loaded into the cache, and the number
+        # of batches loaded
+        self.added = 0
+        self.loaded = 0
+        self.batches = 0
+
+        self._query = Query(
+            OP_CACHE_PUT_ALL,
+            [
+                ('hash_code', Int),
+                ('flag', Byte),
+                ('data', SerializedPairs),
+            ],
+        )
+        self._data = bytearray()
+        self._length = 0
+        self._keys = []
+        self._lock = Lock()
+        self._slots = BoundedSemaphore(max_in_flight)
+        self._executor = None
+        if pooled:
+            self._executor = ThreadPoolExecutor(max_in_flight)
+        self._futures = set()
+        self._error = None
+        self._closed = False
+        self._started = monotonic()
+        self._finished = None
+
+    def __enter__(self) -> 'DataStreamer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(cancel=exc_type is not None)
+
+    def __repr__(self) -> str:
+        return '<{} added={} loaded={} in_flight={}>'.format(
+            self.__class__.__name__, self.added, self.loaded, self.in_flight,
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of batches, that are being sent.
+        """
+        return len(self._futures)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Time (in seconds) since the streamer was created, till it was
+        closed.
+        """
+        return (self._finished or monotonic()) - self._started
+
+    @property
+    def throughput(self) -> float:
+        """
+        The number of entries loaded per second.
+        """
+        elapsed = self.elapsed
+        return self.loaded / elapsed if elapsed > 0 else 0.0
+
+    def _check(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        if self._closed:
+            raise CacheError('Data streamer is closed.')
+
+    def add(
+        self, key, value, key_hint: object=None, value_hint: object=None,
+    ):
+        """
+        Adds the entry to the current batch. Sends the batch, if it is full.
+        Blocks, if there are `max_in_flight` batches being sent.
+
+        :param key: key for the cache entry. Can be of any supported type,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted.
+        """
+        self._check()
+        client = self.cache.client
+        if key_hint is not None:
+            key = key, key_hint
+        if value_hint is not None:
+            value = value, value_hint
+        key_data = infer_from_python(key, client)
+        self._data += key_data
+        self._data += infer_from_python(value, client)
+        self._keys.append(key_data)
+        self._length += 1
+        self.added += 1
+        if (
+            self._length >= self.batch_size
+            or len(self._data) >= self.batch_bytes
+        ):
+            self._send_batch()
+
+    def add_all(self, pairs: Union[dict, Iterable]):
+        """
+        Adds the entries.
+
+        :param pairs: dict or iterable of key-value pairs. Each key or value
+         can be an item of representable Python type or a tuple of
+         (item, hint).
+        """
+        if isinstance(pairs, dict):
+            pairs = pairs.items()
+        for key, value in pairs:
+            self.add(key, value)
+
+    def _send_batch(self):
+        if not self._length:
+            return
+        batch = self._length, bytes(self._data), self._keys
+        self._data = bytearray()
+        self._length = 0
+        self._keys = []
+
+        self._slots.acquire()
+        if self._executor is None:
+            try:
+                self._put(*batch)
+            finally:
+                self._slots.release()
+            return
+
+        future = self._executor.submit(self._put, *batch)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._done)
+
+    def _put(self, length: int, data: bytes, keys: list):
+        cache = self.cache
+        result = self._query.perform(
+            cache.client,
+            query_params={
+                'hash_code': cache.cache_id,
+                'flag': 1 if cache.binary else 0,
+                'data': (length, data),
+            },
+        )
+        if result.status != 0:
+            raise CacheError(result.message)
+        cache._invalidate_serialized(keys)
+        with self._lock:
+            self.loaded += length
+            self.batches += 1
+
+    def _done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+            if not future.cancelled() and future.exception() is not None:
+                if self._error is None:
+                    self._error = future.exception()
+        self._slots.release()
+
+    def flush(self):
+        """
+        Sends the current batch and waits for all the batches to be loaded.
+        """
+        self._check()
+        self._send_batch()
+        self._wait()
+        self._check()
+
+    def _wait(self):
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+
+    def close(self, cancel: bool=False):
+        """
+        Loads the remaining entries and stops the streamer.
+
+        :param cancel: (optional) drop the entries, that are not sent yet.
+         The batches, that are being sent, are waited for anyway. Defaults
+         to False.
+        """
+        if self._closed:
+            return
+        try:
+            if cancel:
+                self._data = bytearray()
+                self._length = 0
+                self._keys = []
+            else:
+                self._check()
+                self._send_batch()
+        finally:
+            self._wait()
+            self._closed = True
+            self._finished = monotonic()
+            if self._executor is not None:
+                self._executor.shutdown()
+        if not cancel and self._error is not None:
+            error, self._error = self._error, None
+            raise error
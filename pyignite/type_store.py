@@ -0,0 +1,156 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains `BinaryTypeStore` class, that keeps the descriptions
+of Complex object types in a local SQLite database file.
+
+The client, that is given such a store, loads it on start and saves
+in it every binary type it fetches from the server or registers. Other
+processes, that share the file, can then decode these Complex objects
+without querying the server::
+
+    client = Client(binary_type_store='/var/tmp/ignite_types.db')
+"""
+
+from collections import OrderedDict
+import json
+import sqlite3
+from threading import Lock
+from typing import Type
+
+from .constants import *
+from .datatypes import BinaryObject
+from .datatypes.internal import tc_map
+from .utils import schema_id
+
+
+__all__ = ['BinaryTypeStore']
+
+
+def field_type_class(type_code: int) -> Type:
+    """
+    Returns the data type class for the binary type field type code.
+
+    :param type_code: Ignite type code, as in the binary type description,
+    :return: data type class.
+    """
+    try:
+        return tc_map(type_code.to_bytes(1, PROTOCOL_BYTE_ORDER))
+    except (KeyError, OverflowError):
+        # if conversion to char or type lookup failed,
+        # we probably have a binary object type ID
+        return BinaryObject
+
+
+class BinaryTypeStore:
+    """
+    Binary type descriptions in a SQLite database file. One row is kept
+    per each schema of each type. The store can be shared by threads
+    and processes.
+    """
+
+    def __init__(self, path: str, timeout: float=5.0):
+        """
+        Open the store. The file is created, if it does not exist.
+
+        :param path: database file path,
+        :param timeout: (optional) time (in seconds) to wait for other
+         processes to unlock the file. Defaults to 5 seconds.
+        """
+        self.path = path
+        self._lock = Lock()
+        self._db = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False,
+        )
+        with self._lock, self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS binary_schemas ('
+                'type_id INTEGER NOT NULL, '
+                'schema_id INTEGER NOT NULL, '
+                'type_name TEXT NOT NULL, '
+                'fields TEXT NOT NULL, '
+                'PRIMARY KEY (type_id, schema_id))'
+            )
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(self.__class__.__name__, self.path)
+
+    def load(self, type_id: int=None) -> dict:
+        """
+        Reads the binary type descriptions.
+
+        :param type_id: (optional) binary type ID. Defaults to all types,
+        :return: dict of {type ID: description}. Descriptions are in the
+         format of :py:meth:`~pyignite.client.Client.get_binary_type`,
+         but only hold `type_exists`, `type_id`, `type_name` and `schemas`.
+        """
+        query = 'SELECT type_id, type_name, fields FROM binary_schemas'
+        args = ()
+        if type_id is not None:
+            query += ' WHERE type_id = ?'
+            args = (type_id,)
+        # keep the schemas in the order they were saved
+        query += ' ORDER BY rowid'
+        with self._lock:
+            rows = self._db.execute(query, args).fetchall()
+
+        result = {}
+        for row_type_id, type_name, fields in rows:
+            type_info = result.setdefault(row_type_id, {
+                'type_exists': True,
+                'type_id': row_type_id,
+                'type_name': type_name,
+                'schemas': [],
+            })
+            type_info['schemas'].append(OrderedDict(
+                (field_name, field_type_class(type_code))
+                for field_name, type_code in json.loads(fields)
+            ))
+        return result
+
+    def save(self, type_id: int, type_name: str, schemas: list):
+        """
+        Saves the binary type schemas. Already saved schemas are kept.
+
+        :param type_id: binary type ID,
+        :param type_name: binary type name,
+        :param schemas: list of schemas: {field name: field type} dicts.
+        """
+        rows = []
+        for schema in schemas:
+            fields = [
+                (
+                    field_name,
+                    int.from_bytes(field_type.type_code, PROTOCOL_BYTE_ORDER),
+                )
+                for field_name, field_type in schema.items()
+            ]
+            rows.append((
+                type_id, schema_id(schema), type_name, json.dumps(fields),
+            ))
+        with self._lock, self._db:
+            self._db.executemany(
+                'INSERT OR IGNORE INTO binary_schemas '
+                '(type_id, schema_id, type_name, fields) VALUES (?, ?, ?, ?)',
+                rows,
+            )
+
+    def close(self):
+        """
+        Close the database file.
+        """
+        with self._lock:
+            self._db.close()
@@ -13,13 +13,80 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import wraps
+import ctypes
+from functools import lru_cache, wraps
+import operator
+import struct
 from typing import Any, Type, Union
 
 from pyignite.datatypes.base import IgniteDataType
 from .constants import *
 
 
+LAYOUT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _build_layout(name: str, base: type, fields: tuple) -> type:
+    return type(
+        name,
+        (base,),
+        {
+            '_pack_': 1,
+            '_fields_': list(fields),
+        },
+    )
+
+
+def layout(
+    name: str, fields: list, base: type=ctypes.LittleEndianStructure,
+) -> type:
+    """
+    Returns a packed ctypes structure class with the given fields.
+
+    Classes are memoized by their shape (name, base class and fields),
+    so that parsing the messages of the same shape over and over does not
+    create a new class every time.
+
+    :param name: class name,
+    :param fields: list of (field name, ctypes type) tuples,
+    :param base: (optional) base class. Default is
+     `ctypes.LittleEndianStructure`,
+    :return: ctypes structure class.
+    """
+    return _build_layout(name, base, tuple(fields))
+
+
+# standard sizes of `struct` module formats, regardless of platform
+C_TYPE_FORMATS = {
+    ctypes.c_byte: 'b',
+    ctypes.c_ubyte: 'B',
+    ctypes.c_short: 'h',
+    ctypes.c_ushort: 'H',
+    ctypes.c_int: 'i',
+    ctypes.c_uint: 'I',
+    ctypes.c_longlong: 'q',
+    ctypes.c_ulonglong: 'Q',
+    ctypes.c_float: 'f',
+    ctypes.c_double: 'd',
+    ctypes.c_bool: '?',
+}
+
+
+@lru_cache(maxsize=None)
+def c_struct(*c_types) -> struct.Struct:
+    """
+    Returns a precompiled `struct.Struct` for unpacking a packed
+    little-endian sequence of the given ctypes types.
+
+    :param c_types: ctypes simple types, like `ctypes.c_int`,
+    :return: `struct.Struct` object.
+    """
+    return struct.Struct(
+        '<' + ''.join(C_TYPE_FORMATS[c_type] for c_type in c_types)
+    )
+
+
 def is_iterable(value):
     """ Check if value is iterable. """
     try:
@@ -82,65 +149,79 @@ def unwrap_binary(client: 'Client', wrapped: tuple):
     from pyignite.datatypes.complex import BinaryObject
 
     blob, offset = wrapped
-    client_clone = client.clone(prefetch=blob)
-    client_clone.pos = offset
-    data_class, data_bytes = BinaryObject.parse(client_clone)
-    return BinaryObject.to_python(
-        data_class.from_buffer_copy(data_bytes),
-        client,
-    )
+    # decode from memory; no network is involved unless the binary type
+    # is yet to be fetched
+    result, _ = BinaryObject.decode(memoryview(blob), offset, client)
+    return result
+
 
+HASHCODE_CHUNK = 512
+ID_CACHE_SIZE = 4096
 
-def hashcode(string: Union[str, bytes]) -> int:
+# 31 ** n modulo 2 ** 32 for each position of the chunk, highest first
+_hashcode_powers = [
+    pow(31, n, 0x100000000) for n in range(HASHCODE_CHUNK - 1, -1, -1)
+]
+
+
+def hashcode(string: Union[str, bytes, bytearray, memoryview]) -> int:
     """
     Calculate hash code used for identifying objects in Ignite binary API.
 
+    This is the Java's `31 * h + c` polynomial hash. Instead of going
+    through the data character by character, it is evaluated by chunks
+    with precomputed powers of 31, which is much faster on long buffers.
+
     :param string: UTF-8-encoded string identifier of binary buffer,
     :return: hash code.
     """
     result = 0
-    for char in string:
-        try:
-            char = ord(char)
-        except TypeError:
-            pass
-        result = int_overflow(31 * result + char)
-    return result
+    length = len(string)
+    for start in range(0, length, HASHCODE_CHUNK):
+        chunk = string[start:start + HASHCODE_CHUNK]
+        size = len(chunk)
+        if isinstance(chunk, str):
+            chunk = map(ord, chunk)
+        result = (
+            result * pow(31, size, 0x100000000)
+            + sum(map(
+                operator.mul, chunk,
+                _hashcode_powers[HASHCODE_CHUNK - size:],
+            ))
+        ) & 0xffffffff
+    return int_overflow(result)
+
+
+@lru_cache(maxsize=ID_CACHE_SIZE)
+def _name_hashcode(name: str) -> int:
+    return hashcode(name)
 
 
 def cache_id(cache: Union[str, int]) -> int:
     """
-    Create a cache ID from cache name.
+    Create a cache ID from cache name. IDs of the names are memoized.
 
     :param cache: cache name or ID,
     :return: cache ID.
     """
-    return cache if type(cache) is int else hashcode(cache)
+    return cache if type(cache) is int else _name_hashcode(cache)
 
 
 def entity_id(cache: Union[str, int]) -> int:
     """
-    Create a type ID from type name or field ID from field name.
+    Create a type ID from type name or field ID from field name. IDs
+    of the names are memoized.
 
     :param cache: entity name or ID,
     :return: entity ID.
     """
-    return cache if type(cache) is int else hashcode(cache.lower())
+    return cache if type(cache) is int else _name_hashcode(cache.lower())
 
 
-def schema_id(schema: Union[int, dict]) -> int:
-    """
-    Calculate Complex Object schema ID.
-
-    :param schema: a dict of field names: field types,
-    :return: schema ID.
-    """
-    if type(schema) is int:
-        return schema
-    if schema is None:
-        return 0
-    s_id = FNV1_OFFSET_BASIS if schema else 0
-    for field_name in schema.keys():
+@lru_cache(maxsize=ID_CACHE_SIZE)
+def _schema_id(field_names: tuple) -> int:
+    s_id = FNV1_OFFSET_BASIS if field_names else 0
+    for field_name in field_names:
         field_id = entity_id(field_name)
         s_id ^= (field_id & 0xff)
         s_id = int_overflow(s_id * FNV1_PRIME)
@@ -153,6 +234,21 @@ def schema_id(schema: Union[int, dict]) -> int:
     return s_id
 
 
+def schema_id(schema: Union[int, dict]) -> int:
+    """
+    Calculate Complex Object schema ID. IDs of the schemas are memoized
+    by their field names.
+
+    :param schema: a dict of field names: field types,
+    :return: schema ID.
+    """
+    if type(schema) is int:
+        return schema
+    if schema is None:
+        return 0
+    return _schema_id(tuple(schema.keys()))
+
+
 def status_to_exception(exc: Type[Exception]):
     """
     Converts erroneous status code with error message to an exception
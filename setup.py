@@ -51,6 +51,9 @@ requirement_sections = [
     'setup',
     'tests',
     'docs',
+    'numpy',
+    'pandas',
+    'arrow',
 ]
 requirements = defaultdict(list)
 
@@ -87,6 +90,9 @@ setuptools.setup(
     setup_requires=requirements['setup'],
     extras_require={
         'docs': requirements['docs'],
+        'numpy': requirements['numpy'],
+        'pandas': requirements['pandas'],
+        'arrow': requirements['arrow'],
     },
     classifiers=[
         'Programming Language :: Python',
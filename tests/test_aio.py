@@ -0,0 +1,114 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from pyignite.aio import AioClient
+from pyignite.datatypes import IntObject
+
+
+def test_aio_cache(ignite_host, ignite_port, timeout):
+
+    async def inner():
+        client = AioClient(timeout=timeout)
+        await client.connect(ignite_host, ignite_port)
+        cache = await client.get_or_create_cache('my_aio_bucket')
+
+        await asyncio.gather(*[
+            cache.put(i, 'value_{}'.format(i), key_hint=IntObject)
+            for i in range(20)
+        ])
+        values = await asyncio.gather(*[
+            cache.get(i, key_hint=IntObject) for i in range(20)
+        ])
+        assert values == ['value_{}'.format(i) for i in range(20)]
+        assert await cache.get_size() == 20
+
+        scanned = {}
+        async for k, v in cache.scan(page_size=3):
+            scanned[k] = v
+        assert scanned == {i: 'value_{}'.format(i) for i in range(20)}
+
+        await cache.destroy()
+        await client.close()
+
+    asyncio.run(inner())
+
+
+def test_aio_coalescing(ignite_host, ignite_port, timeout):
+
+    async def inner():
+        client = AioClient(timeout=timeout)
+        await client.connect(ignite_host, ignite_port)
+        cache = await client.get_or_create_cache('my_aio_bucket')
+        await cache.put_all({i: 'value_{}'.format(i) for i in range(20)})
+
+        coalesced = cache.with_coalescing(window=0.005)
+        keys = [i % 25 for i in range(100)]
+        values = await asyncio.gather(*[coalesced.get(k) for k in keys])
+        assert values == [
+            'value_{}'.format(k) if k < 20 else None for k in keys
+        ]
+        found = await asyncio.gather(*[
+            coalesced.contains_key(k) for k in keys
+        ])
+        assert found == [k < 20 for k in keys]
+        assert coalesced.coalescer.requests < 10
+
+        await cache.destroy()
+        await client.close()
+
+    asyncio.run(inner())
+
+
+def test_aio_sql(ignite_host, ignite_port, timeout):
+
+    async def inner():
+        client = AioClient(timeout=timeout)
+        await client.connect(ignite_host, ignite_port)
+
+        await client.sql(
+            'CREATE TABLE AioTest (id INT PRIMARY KEY, name VARCHAR)'
+        )
+        for i in range(5):
+            await client.sql(
+                'INSERT INTO AioTest (id, name) VALUES (?, ?)',
+                query_args=[i, 'name_{}'.format(i)],
+            )
+
+        rows = []
+        async for row in await client.sql(
+            'SELECT id, name FROM AioTest ORDER BY id',
+            page_size=2, include_field_names=True,
+        ):
+            rows.append(row)
+        assert rows[0] == ['ID', 'NAME']
+        assert rows[1:] == [[i, 'name_{}'.format(i)] for i in range(5)]
+
+        # the cursor of the abandoned iteration is closed
+        result = await client.sql(
+            'SELECT id, name FROM AioTest ORDER BY id', page_size=2,
+        )
+        async for row in result:
+            break
+        await result.aclose()
+        assert [row async for row in await client.sql(
+            'SELECT id FROM AioTest ORDER BY id', page_size=2,
+        )] == [[i] for i in range(5)]
+
+        await client.sql('DROP TABLE AioTest')
+        await client.close()
+
+    asyncio.run(inner())
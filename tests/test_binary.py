@@ -16,7 +16,7 @@
 from collections import OrderedDict
 from decimal import Decimal
 
-from pyignite import GenericObjectMeta
+from pyignite import GenericObjectMeta, RawBinaryObject
 from pyignite.datatypes import (
     BinaryObject, BoolObject, IntObject, DecimalObject, LongObject, String,
 )
@@ -87,6 +87,26 @@ def test_sql_read_as_binary(client):
     client.sql(drop_query)
 
 
+def test_preload_binary_types(client):
+
+    client.sql(drop_query)
+    client.sql(create_query)
+    for line in insert_data:
+        client.sql(insert_query, query_args=line)
+
+    table_cache = client.get_cache(table_cache_name)
+    value_type_name = table_cache.settings[
+        PROP_QUERY_ENTITIES
+    ][0]['value_type_name']
+
+    type_ids = client.preload_binary_types(caches=[table_cache])
+    data_classes = client.query_binary_type(value_type_name, sync=False)
+    assert data_classes
+    assert list(data_classes.values())[0].type_id in type_ids
+
+    client.sql(drop_query)
+
+
 def test_sql_write_as_binary(client):
 
     client.get_or_create_cache(scheme_name)
@@ -279,3 +299,111 @@ def test_add_schema_to_binary_object(client):
     assert not hasattr(result, 'test_bool')
 
     migrate_cache.destroy()
+
+
+def test_compiled_binary_object(client):
+
+    compiled_cache = client.create_cache('compiled_binary')
+
+    schema = OrderedDict([
+        ('test_int', IntObject),
+        ('test_long', LongObject),
+        ('test_bool', BoolObject),
+        ('test_str', String),
+    ])
+
+    class PlainType(
+        metaclass=GenericObjectMeta,
+        type_name='CompiledType',
+        schema=schema,
+    ):
+        pass
+
+    class CompiledType(
+        metaclass=GenericObjectMeta,
+        type_name='CompiledType',
+        schema=schema,
+        compiled=True,
+    ):
+        pass
+
+    assert CompiledType.compile() is CompiledType.compile()
+
+    for i, test_int in enumerate([42, None]):
+        values = dict(
+            test_int=test_int, test_long=2 ** 40, test_bool=True,
+            test_str='Test string',
+        )
+        assert BinaryObject.from_python(
+            CompiledType(**values), client
+        ) == BinaryObject.from_python(PlainType(**values), client)
+
+        compiled_cache.put(i, CompiledType(**values))
+        result = compiled_cache.get(i)
+        for field_name, value in values.items():
+            assert getattr(result, field_name) == value
+
+    compiled_cache.destroy()
+
+
+def test_lazy_binary_object(client):
+
+    lazy_cache = client.create_cache('lazy_binary')
+
+    class LazyType(
+        metaclass=GenericObjectMeta,
+        type_name='LazyType',
+        schema=OrderedDict([
+            ('test_int', IntObject),
+            ('test_str', String),
+            ('test_decimal', DecimalObject),
+        ]),
+        lazy=True,
+    ):
+        pass
+
+    lazy_cache.put(1, LazyType(
+        test_int=42, test_str='Test string', test_decimal=Decimal('2.34'),
+    ))
+    result = lazy_cache.get(1)
+    assert isinstance(result, LazyType)
+    assert 'test_str' not in vars(result)
+    assert result.test_str == 'Test string'
+    assert 'test_str' in vars(result)
+    assert result == LazyType(
+        test_int=42, test_str='Test string', test_decimal=Decimal('2.34'),
+    )
+    assert not hasattr(result, '_lazy_fields')
+
+    lazy_cache.destroy()
+
+
+def test_keep_binary(client):
+
+    source_cache = client.create_cache('binary_source')
+    target_cache = client.create_cache('binary_target')
+
+    class KeepBinaryType(
+        metaclass=GenericObjectMeta,
+        type_name='KeepBinaryType',
+        schema=OrderedDict([
+            ('test_int', IntObject),
+            ('test_str', String),
+        ]),
+    ):
+        pass
+
+    source_cache.put(1, KeepBinaryType(test_int=42, test_str='Test string'))
+
+    raw_object = source_cache.with_keep_binary().get(1)
+    assert isinstance(raw_object, RawBinaryObject)
+    assert raw_object.type_id == KeepBinaryType.type_id
+
+    target_cache.put(1, raw_object)
+    result = target_cache.get(1)
+    assert result.test_int == 42
+    assert result.test_str == 'Test string'
+    assert target_cache.with_keep_binary().get(1) == raw_object
+
+    source_cache.destroy()
+    target_cache.destroy()
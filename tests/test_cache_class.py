@@ -211,6 +211,67 @@ def test_cache_scan(client, page_size):
     cache.destroy()
 
 
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_cache_scan_prefetch(client, prefetch):
+    test_data = {i: 'value_{}'.format(i) for i in range(15)}
+    cache = client.get_or_create_cache('my_oop_cache')
+    cache.put_all(test_data)
+
+    received_data = {}
+    for k, v in cache.scan(page_size=2, prefetch=prefetch):
+        # the client is usable, while the pages are read ahead
+        assert cache.get(k) == v
+        received_data[k] = v
+    assert received_data == test_data
+
+    cache.destroy()
+
+
+@pytest.mark.parametrize('page_size', range(1, 17, 5))
+def test_cache_scan_to_arrow(client, page_size):
+    pytest.importorskip('pyarrow')
+
+    test_data = {i: 'value_{}'.format(i) for i in range(15)}
+    cache = client.get_or_create_cache('my_oop_cache')
+    cache.put_all(test_data)
+
+    received_data = {}
+    for batch in cache.scan_to_arrow(page_size=page_size):
+        assert batch.schema.names == ['key', 'value']
+        assert batch.num_rows <= page_size
+        received_data.update(zip(
+            batch.column(0).to_pylist(), batch.column(1).to_pylist()
+        ))
+    assert received_data == test_data
+
+    cache.destroy()
+
+
+def test_near_cache(client):
+    cache = client.get_or_create_cache('my_oop_cache')
+    cache.put_all({1: 'one', 2: 'two'})
+    near = cache.with_near_cache(max_size=10)
+
+    assert near.get(1) == 'one'
+    assert near.get(1) == 'one'
+    assert near.near_cache.hits == 1
+    assert near.near_cache.misses == 1
+
+    # served partly from the near cache
+    assert near.get_all([1, 2, 3]) == {1: 'one', 2: 'two'}
+    assert near.near_cache.hits == 2
+    assert near.get_all([1, 2, 3]) == {1: 'one', 2: 'two'}
+    assert near.near_cache.hits == 5
+
+    # writes through the same client invalidate the entries
+    cache.put(1, 'uno')
+    assert near.get(1) == 'uno'
+    near.remove_key(2)
+    assert near.get(2) is None
+
+    cache.destroy()
+
+
 def test_get_and_put_if_absent(client):
     cache = client.get_or_create_cache('my_oop_cache')
 
@@ -219,3 +280,17 @@ def test_get_and_put_if_absent(client):
     cache.put('my_key', 43)
     value = cache.get_and_put_if_absent('my_key', 42)
     assert value is 43
+
+
+def test_cache_pipeline(client):
+    cache = client.get_or_create_cache('my_oop_cache')
+
+    with cache.pipeline() as pipe:
+        for i in range(10):
+            pipe.put(i, 'value_{}'.format(i))
+        pipe.get(3)
+        pipe.contains_key(5)
+        pipe.contains_key(42)
+    assert pipe.results == [None] * 10 + ['value_3', True, False]
+
+    cache.destroy()
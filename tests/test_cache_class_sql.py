@@ -101,3 +101,95 @@ def test_sql(client, page_size):
         ]
 
     client.sql(drop_query, page_size)
+
+
+@pytest.mark.parametrize('page_size', range(1, 6, 2))
+def test_sql_to_columns(client, page_size):
+    numpy = pytest.importorskip('numpy')
+
+    client.sql(drop_query, page_size)
+    client.sql(create_query, page_size)
+    for i, data_line in enumerate(initial_data, start=1):
+        fname, lname, grade = data_line
+        client.sql(
+            insert_query,
+            page_size,
+            query_args=[i, fname, lname, grade]
+        )
+
+    columns = client.sql_to_columns(
+        select_query + ' ORDER BY id', page_size
+    )
+    assert list(columns) == ['ID', 'FIRST_NAME', 'LAST_NAME', 'GRADE']
+    assert columns['ID'].dtype == numpy.int32
+    assert columns['ID'].tolist() == [1, 2, 3, 4, 5]
+    assert columns['FIRST_NAME'].dtype == object
+    assert columns['FIRST_NAME'].tolist() == [
+        fname for fname, _, _ in initial_data
+    ]
+    assert columns['GRADE'].tolist() == [
+        grade for _, _, grade in initial_data
+    ]
+
+    client.sql(drop_query, page_size)
+
+
+@pytest.mark.parametrize('page_size', range(1, 6, 2))
+def test_sql_to_arrow(client, page_size):
+    pyarrow = pytest.importorskip('pyarrow')
+
+    client.sql(drop_query, page_size)
+    client.sql(create_query, page_size)
+    for i, data_line in enumerate(initial_data, start=1):
+        fname, lname, grade = data_line
+        client.sql(
+            insert_query,
+            page_size,
+            query_args=[i, fname, lname, grade]
+        )
+
+    batches = list(client.sql_to_arrow(
+        select_query + ' ORDER BY id', page_size
+    ))
+    assert all(batch.num_rows <= page_size for batch in batches)
+    table = pyarrow.Table.from_batches(batches)
+    assert table.schema.names == ['ID', 'FIRST_NAME', 'LAST_NAME', 'GRADE']
+    assert table.schema.field('ID').type == pyarrow.int32()
+    assert table.schema.field('FIRST_NAME').type == pyarrow.string()
+    assert table.column('ID').to_pylist() == [1, 2, 3, 4, 5]
+    assert table.column('LAST_NAME').to_pylist() == [
+        lname for _, lname, _ in initial_data
+    ]
+
+    client.sql(drop_query, page_size)
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_sql_prefetch(client, prefetch):
+    page_size = 2
+
+    client.sql(drop_query, page_size)
+    client.sql(create_query, page_size)
+    for i, data_line in enumerate(initial_data, start=1):
+        fname, lname, grade = data_line
+        client.sql(
+            insert_query,
+            page_size,
+            query_args=[i, fname, lname, grade]
+        )
+
+    result = client.sql(
+        select_query + ' ORDER BY id', page_size, prefetch=prefetch
+    )
+    assert [row[0] for row in result] == [1, 2, 3, 4, 5]
+
+    # the cursor is closed, when the result is abandoned
+    result = client.sql(select_query, page_size, prefetch=prefetch)
+    assert len(next(result)) == 4
+    result.close()
+
+    student = client.get_or_create_cache('SQL_PUBLIC_STUDENT')
+    result = student.select_row('TRUE', page_size, prefetch=prefetch)
+    assert sorted(k for k, v in result) == [1, 2, 3, 4, 5]
+
+    client.sql(drop_query, page_size)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from array import array
 from datetime import datetime, timedelta
 import decimal
 import pytest
@@ -132,3 +133,86 @@ def test_put_get_data(client, cache, value, value_hint):
     result = cache_get(client, cache, 'my_key')
     assert result.status == 0
     assert result.value == value
+
+
+@pytest.mark.parametrize(
+    'value, value_hint',
+    [
+        (42, None),
+        (3.1415, None),
+        ('Little Mary had a lamb', None),
+        (None, None),
+        (decimal.Decimal('-1.3'), None),
+        (datetime(year=1998, month=4, day=6, hour=18, minute=30), None),
+        ([1, 2, 3, 5], IntArrayObject),
+        (['String 1', 'String 2'], None),
+        ((-1, [1, 2, decimal.Decimal('3')]), None),
+        ((3, [1, 2, 3]), CollectionObject),
+        ((1, {'key': 4, 5: 6.0}), None),
+        ((2, {'key': 4, 5: 6.0}), None),
+    ]
+)
+def test_put_get_data_single_pass(client, cache, value, value_hint):
+
+    client.single_pass_decoding = True
+    try:
+        result = cache_put(
+            client, cache, 'my_key', value, value_hint=value_hint
+        )
+        assert result.status == 0
+
+        result = cache_get(client, cache, 'my_key')
+        assert result.status == 0
+        assert result.value == value
+    finally:
+        client.single_pass_decoding = False
+
+
+@pytest.mark.parametrize('array_type', [list, array, memoryview])
+@pytest.mark.parametrize('single_pass_decoding', [False, True])
+def test_primitive_array_types(
+    client, cache, array_type, single_pass_decoding
+):
+
+    client.single_pass_decoding = single_pass_decoding
+    client.primitive_array_type = array_type
+    try:
+        for value in [
+            array('q', range(1000)),
+            array('d', [1.5, 2.5, 3.5]),
+            array('i', [-1, 0, 1]),
+        ]:
+            result = cache_put(client, cache, 'my_key', value)
+            assert result.status == 0
+
+            result = cache_get(client, cache, 'my_key')
+            assert result.status == 0
+            assert type(result.value) is array_type
+            assert list(result.value) == list(value)
+    finally:
+        client.single_pass_decoding = False
+        client.primitive_array_type = list
+
+
+@pytest.mark.parametrize('single_pass_decoding', [False, True])
+def test_numpy_arrays(client, cache, single_pass_decoding):
+    numpy = pytest.importorskip('numpy')
+
+    client.single_pass_decoding = single_pass_decoding
+    client.primitive_array_type = numpy.ndarray
+    try:
+        for value in [
+            numpy.arange(1000, dtype='int64'),
+            numpy.linspace(0, 1, 11, dtype='float32'),
+            numpy.array([True, False]),
+        ]:
+            result = cache_put(client, cache, 'my_key', value)
+            assert result.status == 0
+
+            result = cache_get(client, cache, 'my_key')
+            assert result.status == 0
+            assert result.value.dtype == value.dtype
+            assert (result.value == value).all()
+    finally:
+        client.single_pass_decoding = False
+        client.primitive_array_type = list
@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+import decimal
+import struct
+import uuid
+
+import pytest
+
+from pyignite import Client, GenericObjectMeta
+from pyignite.api.result import APIResult
+from pyignite.connection.reader import BufferReader
+from pyignite.datatypes import *
+from pyignite.datatypes.complex import BinaryObject
+from pyignite.queries import Response
+
+
+class DecodingObject(
+    metaclass=GenericObjectMeta,
+    schema={
+        'ID': IntObject,
+        'NAME': String,
+        'TAGS': StringArrayObject,
+        'PROPS': MapObject,
+        'ITEMS': CollectionObject,
+    },
+):
+    pass
+
+
+@pytest.fixture
+def client():
+    client = Client(compact_footer=True)
+    registry = Client._registry[DecodingObject.type_id]
+    registry[DecodingObject.schema_id] = DecodingObject
+    yield client
+    del Client._registry[DecodingObject.type_id]
+
+
+def frame(payload: bytes) -> bytes:
+    # query ID and status code
+    body = struct.pack('<qi', 1, 0) + payload
+    return struct.pack('<i', len(body)) + body
+
+
+def ctypes_value(client, response_struct, data):
+    response_ctype, buffer = response_struct.parse(BufferReader(client, data))
+    response = response_ctype.from_buffer_copy(buffer)
+    assert APIResult(response).status == 0
+    return response_struct.to_python(response, client)
+
+
+def single_pass_value(client, response_struct, data):
+    result = response_struct.decode(memoryview(data), client)
+    assert result.status == 0
+    return result.value
+
+
+@pytest.mark.parametrize(
+    'value, value_type',
+    [
+        ({1: 'a', 'b': [1, 2], 'c': None}, Map),
+        ((1, {'key': 4, 5: 6.0}), MapObject),
+        ((2, {'key': [1, 2], 'date': datetime(2010, 1, 1)}), MapObject),
+        ((3, [1, 'two', 3.0, None]), CollectionObject),
+        ((1, [[1, 2], ['x', None], [True, False]]), CollectionObject),
+        ((-1, [1, 'two', decimal.Decimal('3.5')]), ObjectArrayObject),
+        ((-1, [uuid.UUID(int=1), ['a', None], [2.5]]), ObjectArrayObject),
+        ((3, [1, 2, 3]), AnyDataObject),
+        ((1, {'key': 4, 5: 6.0}), AnyDataObject),
+    ]
+)
+def test_collections(client, value, value_type):
+    response_struct = Response([('value', value_type), ('more', Bool)])
+    data = frame(value_type.from_python(value, client) + b'\x01')
+
+    expected = ctypes_value(client, response_struct, data)
+    assert expected['value'] == value
+    assert single_pass_value(client, response_struct, data) == expected
+
+
+def test_complex_object(client):
+    value = DecodingObject(
+        ID=1,
+        NAME='Complex',
+        TAGS=['a', 'b'],
+        PROPS=(1, {'x': 1, 'y': [1.5, 2.5]}),
+        ITEMS=(3, [1, 'two', [3, 4]]),
+    )
+    response_struct = Response([('value', BinaryObject)])
+    data = frame(bytes(BinaryObject.from_python(value, client)))
+
+    expected = ctypes_value(client, response_struct, data)
+    assert expected['value'] == value
+    assert single_pass_value(client, response_struct, data) == expected
@@ -31,3 +31,72 @@ def test_go():
 
     x = GenericObject()
     print(x.__class__.__name__)
+
+
+def test_go_slots():
+
+    class SlottedObject(
+        metaclass=GenericObjectMeta,
+        schema={
+            'TEST_ID': IntObject,
+            'TEST_NAME': String,
+        },
+        slots=True,
+    ):
+        pass
+
+    # the class is finalized once, at creation
+    init = SlottedObject.__init__
+    x = SlottedObject(TEST_ID=1)
+    assert SlottedObject.__init__ is init
+    assert x == SlottedObject(TEST_ID=1, TEST_NAME=None, version=1)
+    assert not hasattr(x, '__dict__')
+
+
+def test_lazy_objects():
+    from pyignite import Client
+    from pyignite.datatypes.complex import BinaryObject
+    from pyignite.utils import unwrap_binary
+
+    class TradeObject(
+        metaclass=GenericObjectMeta,
+        schema={
+            'TRADE_ID': LongObject,
+            'TRADE_SYMBOL': String,
+            'TRADE_PRICE': DoubleObject,
+        },
+    ):
+        pass
+
+    client = Client(compact_footer=True, lazy_objects=True)
+    registry = Client._registry[TradeObject.type_id]
+    registry[TradeObject.schema_id] = TradeObject
+    try:
+        data = bytes(BinaryObject.from_python(
+            TradeObject(TRADE_ID=1, TRADE_SYMBOL='ABC', TRADE_PRICE=2.5),
+            client,
+        ))
+        # replace the class with the one, that is generated from
+        # the binary type, fetched from the server
+        del registry[TradeObject.schema_id]
+        client._update_binary_registry(TradeObject.type_id, {
+            'type_exists': True,
+            'type_name': TradeObject.type_name,
+            'schemas': [TradeObject.schema],
+        })
+
+        # Complex objects are received wrapped
+        x = unwrap_binary(client, (data, 0))
+        assert x._lazy_fields is not None
+        assert 'TRADE_SYMBOL' not in x.__dict__
+        assert x.TRADE_SYMBOL == 'ABC'
+        assert 'TRADE_SYMBOL' in x.__dict__
+        assert x.TRADE_ID == 1 and x.TRADE_PRICE == 2.5
+        assert x._lazy_fields is None
+
+        client.lazy_objects = False
+        y = unwrap_binary(client, (data, 0))
+        assert 'TRADE_SYMBOL' in y.__dict__
+        assert x == y
+    finally:
+        del Client._registry[TradeObject.type_id]
@@ -0,0 +1,126 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from time import sleep
+
+from pyignite import Client, GenericObjectMeta
+from pyignite.datatypes import IntObject, StringArrayObject
+from pyignite.datatypes.complex import BinaryObject
+from pyignite.near_cache import NearCache
+from pyignite.utils import unwrap_binary
+
+
+def test_near_cache_lru():
+    near_cache = NearCache(max_size=2)
+    near_cache.store(b'a', 1, near_cache.generation)
+    near_cache.store(b'b', 2, near_cache.generation)
+    assert near_cache.lookup(b'a') == (True, 1)
+    # `b` is the least recently used entry now
+    near_cache.store(b'c', 3, near_cache.generation)
+    assert near_cache.lookup(b'b') == (False, None)
+    assert near_cache.lookup(b'c') == (True, 3)
+    assert len(near_cache) == 2
+    assert near_cache.hits == 2
+    assert near_cache.misses == 1
+    assert near_cache.evictions == 1
+
+
+def test_near_cache_ttl():
+    near_cache = NearCache(ttl=0.05)
+    near_cache.store(b'a', 1, near_cache.generation)
+    assert near_cache.lookup(b'a') == (True, 1)
+    sleep(0.1)
+    assert near_cache.lookup(b'a') == (False, None)
+    assert near_cache.evictions == 1
+    assert len(near_cache) == 0
+
+
+def test_near_cache_invalidation():
+    near_cache = NearCache()
+    near_cache.store(b'a', 1, near_cache.generation)
+    near_cache.store(b'b', 2, near_cache.generation)
+
+    # a read, that has started before the invalidation, is not stored
+    generation = near_cache.generation
+    near_cache.invalidate([b'a'])
+    near_cache.store(b'a', 0, generation)
+    assert near_cache.lookup(b'a') == (False, None)
+    assert near_cache.lookup(b'b') == (True, 2)
+
+    near_cache.invalidate()
+    assert len(near_cache) == 0
+
+
+def test_near_cache_copies():
+
+    class NearObject(
+        metaclass=GenericObjectMeta,
+        schema={'TAGS': StringArrayObject},
+    ):
+        pass
+
+    near_cache = NearCache()
+    value = {'a': [1, 2]}
+    near_cache.store(b'a', value, near_cache.generation)
+    value['a'].append(3)
+    _, cached = near_cache.lookup(b'a')
+    assert cached == {'a': [1, 2]}
+
+    # the readers can not change the cached value
+    cached['a'].append(4)
+    assert near_cache.lookup(b'a') == (True, {'a': [1, 2]})
+
+    near_cache.store(b'b', NearObject(TAGS=['x']), near_cache.generation)
+    _, cached = near_cache.lookup(b'b')
+    cached.TAGS.append('y')
+    assert near_cache.lookup(b'b') == (True, NearObject(TAGS=['x']))
+
+    # immutable values are shared
+    text = 'text' * 100
+    near_cache.store(b'c', text, near_cache.generation)
+    assert near_cache.lookup(b'c')[1] is text
+
+
+def test_near_cache_copies_lazy_objects():
+
+    class LazyNearObject(
+        metaclass=GenericObjectMeta,
+        schema={'ID': IntObject, 'TAGS': StringArrayObject},
+        lazy=True,
+    ):
+        pass
+
+    client = Client(compact_footer=True)
+    registry = Client._registry[LazyNearObject.type_id]
+    registry[LazyNearObject.schema_id] = LazyNearObject
+    try:
+        data = bytes(BinaryObject.from_python(
+            LazyNearObject(ID=1, TAGS=['x']), client,
+        ))
+        value = unwrap_binary(client, (data, 0))
+        assert value.ID == 1
+
+        near_cache = NearCache()
+        near_cache.store(b'a', value, near_cache.generation)
+        _, cached = near_cache.lookup(b'a')
+        # the copy shares the client, and decodes its fields on its own
+        assert cached._lazy_fields[2] is client
+        cached.TAGS.append('y')
+        assert value.TAGS == ['x']
+        assert near_cache.lookup(b'a') == (
+            True, LazyNearObject(ID=1, TAGS=['x']),
+        )
+    finally:
+        del Client._registry[LazyNearObject.type_id]
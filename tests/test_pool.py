@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Thread
+
+import pytest
+
+from pyignite import Client, ClientPool
+from pyignite.datatypes import IntObject
+from pyignite.exceptions import ParameterError
+
+
+def test_pool_threads(ignite_host, ignite_port, timeout):
+    pool = ClientPool(pool_size=3, timeout=timeout)
+    pool.connect(ignite_host, ignite_port)
+    cache = pool.get_or_create_cache('my_pool_bucket')
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(n * 100, n * 100 + 50):
+                cache.put(i, 'value_{}'.format(i), key_hint=IntObject)
+                assert cache.get(i, key_hint=IntObject) == 'value_{}'.format(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.get_size() == 400
+    assert pool._size <= 3
+
+    # cursor pages are read over the connection, that has opened the cursor
+    assert len(dict(cache.scan(page_size=7))) == 400
+
+    cache.destroy()
+    pool.close()
+
+
+def test_pool_coalescing(ignite_host, ignite_port, timeout):
+    pool = ClientPool(pool_size=3, timeout=timeout)
+    pool.connect(ignite_host, ignite_port)
+    cache = pool.get_or_create_cache('my_pool_bucket')
+    cache.put_all({i: 'value_{}'.format(i) for i in range(20)})
+    coalesced = cache.with_coalescing(window=0.005)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(25):
+                key = (n + i) % 25
+                value = 'value_{}'.format(key) if key < 20 else None
+                assert coalesced.get(key) == value
+                assert coalesced.contains_key(key) is (key < 20)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert coalesced.coalescer.calls == 400
+    assert coalesced.coalescer.requests < 400
+
+    cache.destroy()
+    pool.close()
+
+
+def test_pool_streamer(ignite_host, ignite_port, timeout):
+    pool = ClientPool(pool_size=3, timeout=timeout)
+    pool.connect(ignite_host, ignite_port)
+    cache = pool.get_or_create_cache('my_pool_bucket')
+
+    with cache.streamer(batch_size=100) as streamer:
+        for i in range(1000):
+            streamer.add(i, 'value_{}'.format(i))
+        assert streamer.in_flight <= 3
+
+    assert streamer.added == streamer.loaded == 1000
+    assert streamer.batches == 10
+    assert streamer.throughput > 0
+    assert cache.get_size() == 1000
+    assert cache.get(999) == 'value_999'
+
+    # the unsent entries are dropped on error
+    try:
+        with cache.streamer() as streamer:
+            streamer.add(1000, 'value_1000')
+            raise KeyError
+    except KeyError:
+        pass
+    assert streamer.loaded == 0
+    assert cache.get(1000) is None
+
+    cache.destroy()
+    pool.close()
+
+
+def test_pool_parallel_scan(ignite_host, ignite_port, timeout):
+    pool = ClientPool(pool_size=3, timeout=timeout)
+    pool.connect(ignite_host, ignite_port)
+    cache = pool.get_or_create_cache('my_pool_bucket')
+    test_data = {i: 'value_{}'.format(i) for i in range(500)}
+    cache.put_all(test_data)
+
+    pairs = list(cache.parallel_scan(page_size=16))
+    assert len(pairs) == 500
+    assert dict(pairs) == test_data
+
+    # the pool is usable, while the pairs are processed
+    for k, v in cache.parallel_scan(workers=2, page_size=16):
+        cache.put(k, v + '_updated')
+    assert cache.get(0) == 'value_0_updated'
+
+    cache.destroy()
+    pool.close()
+
+
+def test_parallel_scan_parameters():
+    # the parameters are checked at once, before anything is read
+    with pytest.raises(ParameterError):
+        ClientPool().get_cache('my_pool_bucket').parallel_scan(workers=0)
+    with pytest.raises(ParameterError):
+        Client().get_cache('my_pool_bucket').parallel_scan(workers=2)
+
+
+def test_pool_sql_statements(ignite_host, ignite_port, timeout):
+    pool = ClientPool(pool_size=2, timeout=timeout, checkout_timeout=1)
+    pool.connect(ignite_host, ignite_port)
+
+    # the results, that fit in one page, do not hold the connections
+    pool.sql('DROP TABLE PoolTest IF EXISTS')
+    pool.sql('CREATE TABLE PoolTest (id INT PRIMARY KEY, name VARCHAR)')
+    for i in range(5):
+        pool.sql(
+            'INSERT INTO PoolTest (id, name) VALUES (?, ?)',
+            query_args=[i, 'name_{}'.format(i)],
+        )
+    rows = list(pool.sql('SELECT id FROM PoolTest ORDER BY id', page_size=2))
+    assert rows == [[i] for i in range(5)]
+
+    pool.sql('DROP TABLE PoolTest')
+    pool.close()
@@ -0,0 +1,48 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+
+from pyignite.datatypes import BinaryObject, DoubleObject, IntObject, String
+from pyignite.type_store import BinaryTypeStore
+from pyignite.utils import entity_id
+
+
+def test_type_store(tmpdir):
+    path = str(tmpdir.join('types.db'))
+    schemas = [
+        OrderedDict([('name', String), ('age', IntObject)]),
+        OrderedDict([
+            ('name', String), ('salary', DoubleObject),
+            ('boss', BinaryObject),
+        ]),
+    ]
+    type_id = entity_id('Employee')
+
+    store = BinaryTypeStore(path)
+    store.save(type_id, 'Employee', schemas)
+    # saving again keeps the schemas
+    store.save(type_id, 'Employee', schemas[:1])
+    store.close()
+
+    # as if it was another process
+    store = BinaryTypeStore(path)
+    assert store.load() == store.load(type_id)
+    type_info = store.load(type_id)[type_id]
+    assert type_info['type_exists']
+    assert type_info['type_name'] == 'Employee'
+    assert type_info['schemas'] == schemas
+    assert store.load(entity_id('Unknown')) == {}
+    store.close()
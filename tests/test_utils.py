@@ -0,0 +1,46 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from pyignite.utils import hashcode, int_overflow
+
+
+def java_hashcode(data):
+    result = 0
+    for char in data:
+        if type(char) is str:
+            char = ord(char)
+        result = int_overflow(31 * result + char)
+    return result
+
+
+@pytest.mark.parametrize('data', [
+    '',
+    'hello',
+    'Ünïcödé ✓',
+    'x' * 1500,
+    b'',
+    bytes(range(256)) * 7,
+    bytearray(b'\xff' * 1025),
+    memoryview(bytes(range(200)) * 3),
+])
+def test_hashcode(data):
+    assert hashcode(data) == java_hashcode(data)
+
+
+def test_java_string_hashcode():
+    assert hashcode('hello') == 99162322
+    assert hashcode('polygenelubricants') == -2147483648